@@ -0,0 +1,51 @@
+"""add recurring_rules table
+
+Revision ID: 5c7e9a1b3d4f
+Revises: 3b9d5f7a1c2e
+Create Date: 2026-10-17 23:41:08.318270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c7e9a1b3d4f'
+down_revision: Union[str, Sequence[str], None] = '3b9d5f7a1c2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'recurring_rules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=16), nullable=False),
+        sa.Column('amount', sa.NUMERIC(precision=10, scale=2), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('interval', sa.String(length=16), nullable=False),
+        sa.Column('every', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=True),
+        sa.Column('next_due', sa.Date(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_recurring_rules_id'), 'recurring_rules', ['id'], unique=False)
+    op.create_index(op.f('ix_recurring_rules_user_id'), 'recurring_rules', ['user_id'], unique=False)
+    op.create_index('ix_recurring_rules_active_next_due', 'recurring_rules', ['is_active', 'next_due'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recurring_rules_active_next_due', table_name='recurring_rules')
+    op.drop_index(op.f('ix_recurring_rules_user_id'), table_name='recurring_rules')
+    op.drop_index(op.f('ix_recurring_rules_id'), table_name='recurring_rules')
+    op.drop_table('recurring_rules')
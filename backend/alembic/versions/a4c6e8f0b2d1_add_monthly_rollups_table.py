@@ -0,0 +1,54 @@
+"""add monthly_rollups table with per-category monthly sums
+
+Revision ID: a4c6e8f0b2d1
+Revises: f1a8c3e5b7d2
+Create Date: 2026-10-17 14:22:09.640381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c6e8f0b2d1'
+down_revision: Union[str, Sequence[str], None] = 'f1a8c3e5b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'monthly_rollups',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('kind', sa.String(length=16), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('total', sa.NUMERIC(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'month', 'kind', 'category'),
+    )
+    # backfill from the source tables
+    op.execute(
+        """
+        INSERT INTO monthly_rollups (user_id, month, kind, category, total, count)
+        SELECT user_id, date_trunc('month', date)::date, 'expense', category,
+               SUM(amount), COUNT(*)
+        FROM expenses
+        GROUP BY user_id, date_trunc('month', date)::date, category
+        UNION ALL
+        SELECT user_id, date_trunc('month', date)::date, 'income', source,
+               SUM(amount), COUNT(*)
+        FROM incomes
+        WHERE date IS NOT NULL
+        GROUP BY user_id, date_trunc('month', date)::date, source
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('monthly_rollups')
@@ -0,0 +1,46 @@
+"""add (user_id, date) covering indexes
+
+Revision ID: b3f1c2d4e5a6
+Revises: e6294f20a376
+Create Date: 2026-10-17 10:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c2d4e5a6'
+down_revision: Union[str, Sequence[str], None] = 'e6294f20a376'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_expenses_user_id_date', 'expenses', 'date'),
+    ('ix_incomes_user_id_date', 'incomes', 'date'),
+    ('ix_savings_user_id_created_at', 'savings', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (user_id, <date> DESC, id DESC) serves per-user listings and keyset
+    # pages; INCLUDE (amount) lets per-user SUM(amount) run as an index-only
+    # scan on PostgreSQL. Other dialects ignore the INCLUDE clause.
+    for name, table, date_column in INDEXES:
+        op.create_index(
+            name,
+            table,
+            ['user_id', sa.text(f'{date_column} DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_include=['amount'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
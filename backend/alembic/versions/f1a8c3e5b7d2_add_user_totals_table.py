@@ -0,0 +1,58 @@
+"""add user_totals table with running income, expense and savings sums
+
+Revision ID: f1a8c3e5b7d2
+Revises: d7a2e9c41f08
+Create Date: 2026-10-17 13:05:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a8c3e5b7d2'
+down_revision: Union[str, Sequence[str], None] = 'd7a2e9c41f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_totals',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('total_income', sa.NUMERIC(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('total_expense', sa.NUMERIC(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('total_savings', sa.NUMERIC(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('income_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('expense_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('savings_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    # backfill from the source tables
+    op.execute(
+        """
+        INSERT INTO user_totals (
+            user_id, total_income, total_expense, total_savings,
+            income_count, expense_count, savings_count
+        )
+        SELECT
+            u.id,
+            COALESCE((SELECT SUM(amount) FROM incomes WHERE user_id = u.id), 0),
+            COALESCE((SELECT SUM(amount) FROM expenses WHERE user_id = u.id), 0),
+            COALESCE((SELECT SUM(amount) FROM savings WHERE user_id = u.id), 0),
+            (SELECT COUNT(*) FROM incomes WHERE user_id = u.id),
+            (SELECT COUNT(*) FROM expenses WHERE user_id = u.id),
+            (SELECT COUNT(*) FROM savings WHERE user_id = u.id)
+        FROM users u
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_totals')
@@ -0,0 +1,27 @@
+"""
+Delete expired refresh tokens and revocations, e.g. from cron
+
+    python -m app.commands.prune_refresh_tokens
+"""
+
+import argparse
+from app.db.database import SessionLocal
+from app.services.refresh_token_service import prune_refresh_tokens_service
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        revocations, tokens = prune_refresh_tokens_service(db)
+    finally:
+        db.close()
+
+    print(f"Pruned {revocations} revocation(s) and {tokens} refresh token(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,34 @@
+"""
+Rebuild monthly_rollups from the expenses and incomes tables
+
+    python -m app.commands.rebuild_monthly_rollups [--user-id ID ...]
+"""
+
+import argparse
+from app.db.database import SessionLocal
+from app.utils.rollups import rebuild_monthly_rollups
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="only rebuild this user, may be repeated (default: all users)",
+    )
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        rebuilt = rebuild_monthly_rollups(db, args.user_ids)
+    finally:
+        db.close()
+
+    print(f"Rebuilt {rebuilt} rollup row(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""
+Create the incomes and expenses of the recurring rules as they fall due
+
+    python -m app.commands.run_recurring [--once] [--no-catch-up] [--batch-size N]
+
+--once creates everything due now and exits, e.g. from cron or after
+downtime; otherwise the scheduler runs until SIGTERM or SIGINT.
+"""
+
+import argparse
+import signal
+import threading
+from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.services.recurring_scheduler import RecurringScheduler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--once", action="store_true", help="run one pass over everything due and exit"
+    )
+    parser.add_argument(
+        "--no-catch-up",
+        dest="catch_up",
+        action="store_false",
+        default=settings.recurring_catch_up,
+        help="create only the latest missed occurrence of each rule",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.recurring_batch_size,
+        help="rules per transaction (default: RECURRING_BATCH_SIZE)",
+    )
+    args = parser.parse_args(argv)
+
+    scheduler = RecurringScheduler(
+        batch_size=args.batch_size,
+        refresh_seconds=settings.recurring_refresh_seconds,
+        catch_up=args.catch_up,
+    )
+    if args.once:
+        result = scheduler.run_once()
+        print(
+            f"Materialized {result.claimed} rule(s): {result.incomes} income(s), "
+            f"{result.expenses} expense(s), {result.skipped} skipped"
+        )
+        return 0
+
+    setup_logging()
+    stopped = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda signum, frame: stopped.set())
+    scheduler.start()
+    stopped.wait()
+    scheduler.stop()
+    shutdown_logging()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
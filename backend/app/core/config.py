@@ -18,12 +18,70 @@ class Settings(BaseSettings):
     db_port: str | None = None
     db_host: str | None = None
     db_name: str | None = None
+    use_async_db: bool = False
+    db_echo: bool = False
+    database_replica_url: str | None = None
+    replica_sticky_seconds: int = 5
+
+    # app.serve: worker processes (0 = one per available CPU), bind address,
+    # and seconds a stopping worker gets to finish in-flight requests
+    web_concurrency: int = 0
+    serve_host: str = "0.0.0.0"
+    serve_port: int = 8000
+    serve_graceful_timeout: int = 30
+
+    # Authenticated principal cache, a TTL of 0 disables it
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_size: int = 10000
+
+    # Verified JWT cache entries, 0 disables it
+    token_cache_size: int = 10000
+
+    # Password hashing pool, 0 workers hashes on the request thread
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
+
+    # Rate limiting: limits storage URI (memory://, sqlite:////dev/shm/x.db,
+    # redis://host:6379), strategy, and the per-user/per-IP default limit
+    rate_limit_storage_uri: str = "memory://"
+    rate_limit_strategy: str = "sliding-window-counter"
+    rate_limit_default: str = "300/minute"
+
+    # Bulk ingestion settings
+    bulk_max_rows: int = 5000
+
+    # Logging: root level, per-logger levels ("name=LEVEL,..."), JSON or text
+    # lines, optional file, and the share of requests whose INFO lines from
+    # the sampled loggers are kept
+    log_level: str = "INFO"
+    log_levels: str = "sqlalchemy=WARNING,uvicorn=INFO"
+    log_json: bool = True
+    log_file: str | None = None
+    log_sample_rate: float = 1.0
+    log_sampled_loggers: str = "app.services,app.routes"
+
+    # List endpoints select response columns and encode them with orjson
+    fast_list_responses: bool = True
+
+    # Recurring rules: run the scheduler thread in this process, rules per
+    # transaction, seconds between rule reloads, and whether occurrences
+    # missed during downtime are all created or only the latest one
+    recurring_scheduler: bool = False
+    recurring_batch_size: int = 500
+    recurring_refresh_seconds: int = 300
+    recurring_catch_up: bool = True
 
     # Security settings
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int = 60
-    refresh_token_expire_minutes: int = 7
+    refresh_token_expire_minutes: int = 10080
+
+    # Bloom filter front of the refresh token revocation store
+    refresh_revocation_filter_capacity: int = 100000
+    refresh_revocation_sync_seconds: int = 30
+    # how often each worker prunes expired tokens and rebuilds its filter
+    refresh_revocation_prune_seconds: int = 3600
 
     # CORS settings
     cors_allowed_origins: str
@@ -53,6 +111,21 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """
+        Derive the async driver URL (asyncpg / aiosqlite) from DATABASE_URL.
+        """
+        url = self.DATABASE_URL
+        for sync_prefix, async_prefix in (
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+            ("sqlite:///", "sqlite+aiosqlite:///"),
+        ):
+            if url.startswith(sync_prefix):
+                return async_prefix + url[len(sync_prefix):]
+        return url
+
     @property
     def ALLOWED_ORIGINS(self):
         """
@@ -69,4 +142,4 @@ def get_settings() -> Settings:
     return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,184 @@
+"""
+Logging setup: JSON lines written off the request path
+
+Loggers only put records on a queue through a QueueHandler; a
+QueueListener thread formats them and does the stdout/file I/O. INFO
+chatter of the sampled loggers (services and routes, several lines per
+request) is kept for a share of the requests, all lines of a request
+together; warnings and errors are always kept.
+"""
+
+import logging
+import queue
+import random
+import sys
+import zlib
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from app.core.config import settings
+
+# set by RequestIDMiddleware, read when a record is emitted
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s [%(request_id)s]"
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the id of the request that emitted them"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep INFO and lower records of `loggers` for `rate` of the requests.
+
+    The decision hashes the request id, so a request keeps all of its lines
+    or none; records outside a request are sampled one by one.
+    """
+
+    def __init__(self, rate: float, loggers: tuple[str, ...]):
+        super().__init__()
+        self.threshold = int(rate * 2**32)
+        self.prefixes = tuple(name + "." for name in loggers)
+        self.loggers = loggers
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or self.threshold >= 2**32:
+            return True
+        name = record.name
+        if name not in self.loggers and not name.startswith(self.prefixes):
+            return True
+        request_id = getattr(record, "request_id", "-")
+        if request_id == "-":
+            return random.random() * 2**32 < self.threshold
+        return zlib.crc32(request_id.encode()) < self.threshold
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _QueueHandler(QueueHandler):
+    """
+    QueueHandler that only merges the message arguments before enqueueing,
+    formatting (timestamps, JSON, tracebacks) is left to the listener
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # args may be ORM objects, render them on the thread that owns them
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the listener"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BufferedFileHandler(_BufferedStreamHandler, logging.FileHandler):
+    """FileHandler that leaves flushing to the listener"""
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers when the queue runs empty, one
+    write per burst instead of one per record
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+def parse_levels(levels: str) -> dict[str, str]:
+    """
+    "sqlalchemy=WARNING,app.db.metrics=INFO" -> {logger name: level}
+    """
+    parsed = {}
+    for item in levels.split(","):
+        if item.strip():
+            name, _, level = item.partition("=")
+            parsed[name.strip()] = level.strip().upper()
+    return parsed
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route the root logger through a queue to stdout (and LOG_FILE) and
+    start the writer thread. Calling it again replaces the previous setup.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    formatter = JSONFormatter() if settings.log_json else logging.Formatter(TEXT_FORMAT)
+    handlers: list[logging.Handler] = [_BufferedStreamHandler(sys.stdout)]
+    if settings.log_file:
+        handlers.append(_BufferedFileHandler(settings.log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _QueueHandler(log_queue)
+    _queue_handler.addFilter(RequestContextFilter())
+    sampled = tuple(
+        name.strip() for name in settings.log_sampled_loggers.split(",") if name.strip()
+    )
+    _queue_handler.addFilter(SamplingFilter(settings.log_sample_rate, sampled))
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.log_level.upper())
+    for name, level in parse_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """
+    Flush the queue, stop the writer thread and close its handlers
+    """
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler = None
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+        handler.close()
+    _listener = None
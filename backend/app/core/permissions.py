@@ -2,7 +2,7 @@
 Role based access control permissions. 
 """
 from enum import Enum
-from typing import List
+from typing import Iterable, List
 
 class Role(str, Enum):
     """User roles in the system"""
@@ -43,6 +43,16 @@ class Permission(str, Enum):
     ADMIN_WRITE = "admin:write"
     ADMIN_DELETE = "admin:delete"
 
+    # Budget permissions
+    BUDGET_READ = "budget:read"
+    BUDGET_WRITE = "budget:write"
+    BUDGET_DELETE = "budget:delete"
+
+    # Recurring rule permissions
+    RECURRING_READ = "recurring:read"
+    RECURRING_WRITE = "recurring:write"
+    RECURRING_DELETE = "recurring:delete"
+
 
 # Role to permissions mapping
 ROLE_PERMISSIONS: dict[Role, List[Permission]] = {
@@ -66,6 +76,14 @@ ROLE_PERMISSIONS: dict[Role, List[Permission]] = {
         Permission.SAVINGS_READ,
         Permission.SAVINGS_WRITE,
         Permission.SAVINGS_DELETE,
+
+        Permission.BUDGET_READ,
+        Permission.BUDGET_WRITE,
+        Permission.BUDGET_DELETE,
+
+        Permission.RECURRING_READ,
+        Permission.RECURRING_WRITE,
+        Permission.RECURRING_DELETE,
     ],
 
     Role.ADMIN: [
@@ -93,10 +111,45 @@ ROLE_PERMISSIONS: dict[Role, List[Permission]] = {
         Permission.ADMIN_READ,
         Permission.ADMIN_WRITE,
         Permission.ADMIN_DELETE,
+
+        Permission.BUDGET_READ,
+        Permission.BUDGET_WRITE,
+        Permission.BUDGET_DELETE,
+
+        Permission.RECURRING_READ,
+        Permission.RECURRING_WRITE,
+        Permission.RECURRING_DELETE,
     ]
 }
 
 
+# Permission bits in declaration order. Masks travel in access tokens, so
+# new permissions are only ever appended to Permission.
+PERMISSION_BITS: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+
+def permission_mask(permissions: Iterable[Permission]) -> int:
+    """Combine permissions into a bitmask"""
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
+# Role value to permission bitmask, compiled once at import
+ROLE_MASKS: dict[str, int] = {
+    role.value: permission_mask(permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+
+def role_mask(role: Role | str) -> int:
+    """Permission bitmask of a role, 0 for unknown roles"""
+    return ROLE_MASKS.get(role.value if isinstance(role, Role) else role, 0)
+
+
 def get_permissions_for_role(role: Role) -> List[Permission]:
     """Retrieve permissions for a given role"""
     return ROLE_PERMISSIONS.get(role, [])
@@ -104,5 +157,4 @@ def get_permissions_for_role(role: Role) -> List[Permission]:
 
 def has_permission(user_role: Role, permission: Permission) -> bool:
     """Check if a user role has a specific permission"""
-    role_permission = get_permissions_for_role(user_role)
-    return permission in role_permission
+    return bool(role_mask(user_role) & PERMISSION_BITS[permission])
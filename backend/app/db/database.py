@@ -2,18 +2,21 @@
 Database setup and session management
 """
 
-from sqlalchemy import create_engine, event
+from fastapi import Request, Response
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import Pool
 from app.core.config import settings
+from app.db.metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from app.db.routing import SessionRouter
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=True,
+_engine_options = dict(
+    echo=settings.db_echo,
+    poolclass=InstrumentedQueuePool,
     pool_size=10,
     max_overflow=20,
     pool_timeout=30,
@@ -21,28 +24,65 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+engine = create_engine(settings.DATABASE_URL, **_engine_options)
 
-@event.listens_for(Pool, "connect")
-def on_connect(dbapi_connection, connection_record):
-    """
-    Event listener for new database connections
-    """
-    logger.info("New database connection established.")
-
-
-@event.listens_for(Pool, "checkout")
-def on_checkout(dbapi_connection, connection_record, connection_proxy):
-    """
-    Event listener for checking out a database connection from the pool
-    """
-    logger.info("Database connection checked out from pool.")
+# Optional read replica, GET routes are served from it through get_db
+replica_engine = (
+    create_engine(settings.database_replica_url, **_engine_options)
+    if settings.database_replica_url
+    else None
+)
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReplicaSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    if replica_engine is not None
+    else None
+)
+
+session_router = SessionRouter(
+    primary=SessionLocal,
+    replica=ReplicaSessionLocal,
+    sticky_seconds=settings.replica_sticky_seconds,
+)
 
 Base = declarative_base()
 
 
+# Async engine, only built when USE_ASYNC_DB is enabled so the async driver
+# (asyncpg / aiosqlite) stays an optional dependency of the sync deployment.
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.use_async_db:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        echo=settings.db_echo,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def dispose_engines(close: bool = True):
+    """
+    Drop the pooled connections of every engine. A forked worker passes
+    close=False to forget the parent's connections without closing them
+    """
+    for pooled in (engine, replica_engine):
+        if pooled is not None:
+            pooled.dispose(close=close)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=close)
+
+
 def get_db_context():
     """
     Context manager for database sessions
@@ -52,18 +92,29 @@ def get_db_context():
         yield db
     except Exception as e:
         db.rollback()
-        logger.error(f"Database transaction failed: {str(e)}")
+        logger.error("Database transaction failed: %s", e)
         raise
     finally:
         db.close()
 
 
-def get_db():
+def get_db(request: Request, response: Response):
     """
-    Dependency to get DB session
+    Dependency to get DB session, routed to the replica for reads
     """
-    db = SessionLocal()
+    db = session_router.session_for(request, response)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to get an async DB session
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database is disabled, set USE_ASYNC_DB=true")
+
+    async with AsyncSessionLocal() as db:
+        yield db
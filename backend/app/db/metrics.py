@@ -0,0 +1,126 @@
+"""
+Per-request database metrics collected from SQLAlchemy events
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool, AsyncAdaptedQueuePool
+
+
+@dataclass
+class RequestDBStats:
+    """Database work attributed to a single request"""
+
+    query_count: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    checkouts: int = 0
+    connection_held: float = 0.0
+
+    @property
+    def db_time_ms(self) -> float:
+        return self.db_time * 1000
+
+    @property
+    def pool_wait_ms(self) -> float:
+        return self.pool_wait * 1000
+
+
+# The stats object is mutable on purpose: sync routes and dependencies run in
+# worker threads with a copy of the request context, so they must update the
+# same instance rather than set a new value.
+_request_stats: ContextVar[RequestDBStats | None] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def start_request_stats() -> RequestDBStats:
+    """
+    Start collecting database metrics for the current request
+    """
+    stats = RequestDBStats()
+    _request_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> RequestDBStats | None:
+    """
+    Metrics of the request being served, None outside of a request
+    """
+    return _request_stats.get()
+
+
+class _PoolWaitMixin:
+    """Time spent waiting for a connection from the pool"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.pool_wait += time.perf_counter() - started
+
+
+class InstrumentedQueuePool(_PoolWaitMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_PoolWaitMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# The start time lives on the statement's execution context, which is dropped
+# with the statement whether it succeeds or fails; the few statements run
+# without one keep theirs on the connection.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+    else:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _record_query(conn, context):
+    if context is not None:
+        started = getattr(context, "_query_start_time", None)
+        context._query_start_time = None
+    else:
+        pending = conn.info.get("query_start_time")
+        started = pending.pop() if pending else None
+    stats = _request_stats.get()
+    if stats is not None and started is not None:
+        stats.query_count += 1
+        stats.db_time += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_query(conn, context)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    """Failed statements count towards the request's queries and time too"""
+    if exception_context.connection is not None:
+        _record_query(exception_context.connection, exception_context.execution_context)
+
+
+@event.listens_for(Pool, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info["checkout_time"] = time.perf_counter()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.checkouts += 1
+
+
+@event.listens_for(Pool, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    started = connection_record.info.pop("checkout_time", None)
+    stats = _request_stats.get()
+    if stats is not None and started is not None:
+        stats.connection_held += time.perf_counter() - started
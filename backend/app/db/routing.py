@@ -0,0 +1,94 @@
+"""
+Primary / read-replica session routing
+"""
+
+import time
+from fastapi import Request, Response
+from sqlalchemy.orm import Session, sessionmaker
+
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+PRIMARY_STICKY_KEY = "db_primary"
+
+
+def _token_subject(request: Request) -> str | None:
+    from app.utils.rate_limits import token_subject
+
+    return token_subject(request)
+
+
+def _limiter_storage():
+    from app.utils.rate_limits import limiter
+
+    return limiter.storage
+
+
+class SessionRouter:
+    """
+    Pick the primary or the replica session for a request.
+
+    Safe methods read from the replica. Any other method writes to the
+    primary and marks the writer so its reads go to the primary until the
+    replica has had time to catch up (read-your-writes). Authenticated
+    writers are marked by token subject in the rate limit storage, which
+    the workers share when it is shared and which holds for bearer clients
+    that never send cookies; anonymous writers get a short-lived cookie.
+    """
+
+    def __init__(
+        self,
+        primary: sessionmaker,
+        replica: sessionmaker | None = None,
+        sticky_seconds: int = 5,
+        subject=_token_subject,
+        storage=_limiter_storage,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.sticky_seconds = sticky_seconds
+        self.subject = subject
+        self.storage = storage
+
+    def _is_sticky(self, request: Request, subject: str | None) -> bool:
+        if subject is not None:
+            return self.storage().get(f"{PRIMARY_STICKY_KEY}:{subject}") > 0
+
+        until = request.cookies.get(PRIMARY_STICKY_COOKIE)
+        try:
+            return until is not None and float(until) > time.time()
+        except ValueError:
+            return False
+
+    def _stick(self, response: Response, subject: str | None):
+        if subject is not None:
+            # clear first so the window restarts from this write
+            key = f"{PRIMARY_STICKY_KEY}:{subject}"
+            storage = self.storage()
+            storage.clear(key)
+            storage.incr(key, self.sticky_seconds)
+            return
+
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(time.time() + self.sticky_seconds),
+            max_age=self.sticky_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+
+    def session_for(self, request: Request, response: Response) -> Session:
+        """
+        Open the session that should serve this request
+        """
+        if self.replica is None:
+            return self.primary()
+
+        subject = self.subject(request)
+        if request.method in READ_METHODS:
+            if self._is_sticky(request, subject):
+                return self.primary()
+            return self.replica()
+
+        self._stick(response, subject)
+        return self.primary()
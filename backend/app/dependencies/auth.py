@@ -1,21 +1,25 @@
 """Authentication dependencies"""
 
-from fastapi import HTTPException, Depends, status, Header
-from jose import JWTError
+from fastapi import HTTPException, Depends, status, Header, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.utils.auth import decode_access_token
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.models import User
+from app.utils.principal_cache import Principal, principal_cache
+from app.utils.token_versions import token_versions
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def get_current_user(
-    authorization: str | None = Header(None), db: Session = Depends(get_db)
-):
+# Routes behind these methods only read, they authorize from token claims
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _claims_from_header(authorization: str | None) -> tuple[int, dict]:
     """
-    get_current_user
+    Validate the bearer header and return the token subject and payload
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -36,14 +40,7 @@ def get_current_user(
                 detail="Invalid token payload",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-
-    except JWTError as e:
-        logger.warning(f"Token validation failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        user_id = int(user_id)
 
     except Exception:
         raise HTTPException(
@@ -52,16 +49,107 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id, payload
 
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    return user
+def _user_not_found():
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="User not found",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _token_revoked():
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _claims_principal(request: Request, user_id: int, payload: dict):
+    """
+    The principal from the token claims for read-only requests, None when
+    the user must be loaded. Tokens without claims predate them.
+    """
+    version = payload.get("ver")
+    if version is None:
+        return None
+    if not token_versions.is_current(user_id, version):
+        raise _token_revoked()
+    if request.method in SAFE_METHODS and "perms" in payload:
+        return Principal.from_claims(user_id, payload)
+    return None
+
+
+def _check_version(principal: Principal, payload: dict):
+    version = payload.get("ver")
+    if version is not None and version < principal.token_version:
+        raise _token_revoked()
+
+
+def get_current_user(
+    request: Request,
+    authorization: str | None = Header(None),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    get_current_user, from the token claims on read-only requests and from
+    the principal cache when possible otherwise
+    """
+    user_id, payload = _claims_from_header(authorization)
+
+    if "ver" in payload:
+        token_versions.sync(db)
+    principal = _claims_principal(request, user_id, payload)
+    if principal is not None:
+        return principal
+
+    principal = principal_cache.get(user_id)
+    if principal is None or payload.get("ver", 0) > principal.token_version:
+        generation = principal_cache.generation
+        user = db.query(User).filter(User.id == user_id).first()
+
+        if user is None:
+            raise _user_not_found()
+
+        principal = Principal.from_user(user)
+        principal_cache.set(principal, generation)
+
+    _check_version(principal, payload)
+    return principal
+
+
+async def get_current_user_async(
+    request: Request,
+    authorization: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """
+    get_current_user for the async session
+    """
+    user_id, payload = _claims_from_header(authorization)
+
+    if "ver" in payload and token_versions.due():
+        await db.run_sync(token_versions.sync)
+    principal = _claims_principal(request, user_id, payload)
+    if principal is not None:
+        return principal
+
+    principal = principal_cache.get(user_id)
+    if principal is None or payload.get("ver", 0) > principal.token_version:
+        generation = principal_cache.generation
+        user = await db.get(User, user_id)
+
+        if user is None:
+            raise _user_not_found()
+
+        principal = Principal.from_user(user)
+        principal_cache.set(principal, generation)
+
+    _check_version(principal, payload)
+    return principal
 
 
 def get_current_active_user(current_user: User = Depends(get_current_user)):
@@ -3,8 +3,8 @@ RBAC (Role-Based Access Control) dependencies
 """
 from typing import List
 from fastapi import HTTPException, Depends, status
-from app.core.permissions import Permission, Role, get_permissions_for_role
-from app.dependencies.auth import get_current_user
+from app.core.permissions import Permission, Role, permission_mask
+from app.dependencies.auth import get_current_user, get_current_user_async
 from app.models.user import User
 
 
@@ -13,6 +13,7 @@ class RBACChecker:
 
     def __init__(self, required_permission: List[Permission]):
         self.required_permission = required_permission
+        self.required_mask = permission_mask(required_permission)
     
     def __call__(self, current_user: User = Depends(get_current_user)) -> User:
         """
@@ -25,23 +26,34 @@ class RBACChecker:
             User object if authorized
         """
 
-        user_role = Role(current_user.role)
-        user_permissions = get_permissions_for_role(user_role)
-
-        for permission in self.required_permission:
-            if permission not in user_permissions:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Insufficient permissions"
-                )
-        
+        if current_user.permissions & self.required_mask != self.required_mask:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions"
+            )
+
         return current_user
 
+
+class AsyncRBACChecker(RBACChecker):
+    """RBACChecker resolving the user through the async session"""
+
+    async def __call__(
+        self, current_user: User = Depends(get_current_user_async)
+    ) -> User:
+        return RBACChecker.__call__(self, current_user)
+
+
 def require_permissions(permissions: List[Permission]):
     """Dependency function to require specific permissions"""
     return RBACChecker(required_permission=permissions)
 
 
+def require_permissions_async(permissions: List[Permission]):
+    """Dependency function to require specific permissions in async routes"""
+    return AsyncRBACChecker(required_permission=permissions)
+
+
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Dependency function to require admin role"""
     if current_user.role != Role.ADMIN.value:
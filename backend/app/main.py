@@ -3,13 +3,17 @@ Main appplication file
 """
 
 import logging
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from app.utils.rate_limits import limiter
-from fastapi import FastAPI
+from app.utils.rate_limits import rate_limit_default
+from fastapi import Depends, FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.utils.hashing import PasswordHasherBusyError, password_hasher
 from app.middleware.security import SecurityHeadersMiddleware
+from app.middleware.db_metrics import DBMetricsMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.middleware.timing import TimingMiddleware
 from app.routes import (
     auth_router,
     user_router,
@@ -17,6 +21,11 @@ from app.routes import (
     expense_router,
     savings_router,
     admin_router,
+    analytics_router,
+    transactions_router,
+    dashboard_router,
+    budget_router,
+    recurring_router,
 )
 
 
@@ -26,24 +35,68 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redocs",
+    # default per-user/per-IP limits on every route
+    dependencies=[Depends(rate_limit_default)],
 )
 
 API_V1_PREFIX = "/api/v1"
 
+if settings.use_async_db:
+    from app.routes import overlay_router
+    from app.routes.async_user import router as async_user_router
+    from app.routes.async_income import router as async_income_router
+    from app.routes.async_expense import router as async_expense_router
+    from app.routes.async_savings import router as async_savings_router
+
+    user_router = overlay_router(user_router, async_user_router)
+    income_router = overlay_router(income_router, async_income_router)
+    expense_router = overlay_router(expense_router, async_expense_router)
+    savings_router = overlay_router(savings_router, async_savings_router)
+
 app.include_router(router=auth_router, prefix=API_V1_PREFIX)
 app.include_router(router=user_router, prefix=API_V1_PREFIX)
 app.include_router(router=income_router, prefix=API_V1_PREFIX)
 app.include_router(router=expense_router, prefix=API_V1_PREFIX)
 app.include_router(router=savings_router, prefix=API_V1_PREFIX)
 app.include_router(router=admin_router, prefix=API_V1_PREFIX)
+app.include_router(router=analytics_router, prefix=API_V1_PREFIX)
+app.include_router(router=transactions_router, prefix=API_V1_PREFIX)
+app.include_router(router=dashboard_router, prefix=API_V1_PREFIX)
+app.include_router(router=budget_router, prefix=API_V1_PREFIX)
+app.include_router(router=recurring_router, prefix=API_V1_PREFIX)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# queue-backed JSON logging, the writer thread is flushed on shutdown
+app.router.add_event_handler("startup", setup_logging)
+app.router.add_event_handler("shutdown", shutdown_logging)
+# stop the hashing worker processes with the server
+app.router.add_event_handler("shutdown", password_hasher.shutdown)
+
+if settings.recurring_scheduler:
+    from app.services.recurring_scheduler import recurring_scheduler
+
+    app.router.add_event_handler("startup", recurring_scheduler.start)
+    app.router.add_event_handler("shutdown", recurring_scheduler.stop)
+
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError):
+    """
+    Shed authentication load instead of queueing behind the hashing pool
+    """
+    logger.warning("Rejected %s %s: %s", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
 
 app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(DBMetricsMiddleware)
+app.add_middleware(TimingMiddleware)
+app.add_middleware(RequestIDMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +104,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-DB-Query-Count",
+        "X-DB-Time-Ms",
+        "X-DB-Pool-Wait-Ms",
+        "X-Request-ID",
+        "X-Response-Time-Ms",
+    ],
 )
 
 
@@ -0,0 +1,54 @@
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.db.metrics import start_request_stats
+
+logger = logging.getLogger("app.db.metrics")
+
+
+class DBMetricsMiddleware:
+    """
+    Report query count, DB time and pool wait of every request.
+
+    The headers carry the work done before the response started; the log
+    line is written once the body is sent, so it includes streamed queries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request_stats()
+        status_code = 500
+
+        async def send_with_metrics(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-db-query-count", str(stats.query_count).encode()),
+                    (b"x-db-time-ms", b"%.2f" % stats.db_time_ms),
+                    (b"x-db-pool-wait-ms", b"%.2f" % stats.pool_wait_ms),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            logger.info(
+                "method=%s path=%s status=%s queries=%d db_time_ms=%.2f "
+                "pool_wait_ms=%.2f checkouts=%d conn_held_ms=%.2f request_id=%s",
+                scope["method"],
+                scope["path"],
+                status_code,
+                stats.query_count,
+                stats.db_time_ms,
+                stats.pool_wait_ms,
+                stats.checkouts,
+                stats.connection_held * 1000,
+                scope.get("state", {}).get("request_id", "-"),
+            )
@@ -0,0 +1,51 @@
+"""
+Request ID middleware
+"""
+
+import re
+import uuid
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.logging_config import request_id_var
+
+REQUEST_ID_HEADER = b"x-request-id"
+# ids taken from clients or proxies must be safe to log and echo back
+_VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._\-]{1,128}")
+
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware giving every request an id, the incoming
+    X-Request-ID when it is well formed, otherwise a new one. The id is
+    available as request.state.request_id, stamped on log records and
+    echoed in the response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                if _VALID_REQUEST_ID.fullmatch(value):
+                    request_id = value
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex.encode()
+        scope.setdefault("state", {})["request_id"] = request_id.decode()
+        header = (REQUEST_ID_HEADER, request_id)
+
+        async def send_with_id(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        token = request_id_var.set(scope["state"]["request_id"])
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,34 @@
+"""
+Request timing middleware
+"""
+
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware reporting the time until the response headers in
+    X-Response-Time-Ms
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-response-time-ms", b"%.2f" % elapsed_ms),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
@@ -1,4 +1,10 @@
 from .user import User
 from .expense import Expense
 from .income import Income
-from .savings import Savings
\ No newline at end of file
+from .savings import Savings
+from .user_totals import UserTotals
+from .monthly_rollup import MonthlyRollup
+from .refresh_token import RefreshToken, RevokedRefreshToken
+from .token_revocation import TokenRevocation
+from .budget import Budget, BudgetSpend
+from .recurring_rule import RecurringRule
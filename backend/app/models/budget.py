@@ -0,0 +1,76 @@
+"""
+Budget models
+"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    ForeignKey,
+    TIMESTAMP,
+    NUMERIC,
+    UniqueConstraint,
+)
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class Budget(Base):
+    """
+    budgets table, a spending limit per user, expense category and period
+    """
+
+    __tablename__ = "budgets"
+    __table_args__ = (
+        # also the index the expense services look budgets up by
+        UniqueConstraint("user_id", "category", "period", name="uq_budgets_user_category_period"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    category = Column(String, nullable=False)
+    # "weekly", "monthly" or "yearly"
+    period = Column(String(16), nullable=False)
+    limit = Column(NUMERIC(precision=14, scale=2), nullable=False)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return (
+            f"<Budget id={self.id} user_id={self.user_id} category={self.category} "
+            f"period={self.period} limit={self.limit}>"
+        )
+
+
+class BudgetSpend(Base):
+    """
+    budget_spend table, one row per budget and period holding the sum and
+    count of the expenses in it. Maintained by the expense services in the
+    same transaction as the change.
+    """
+
+    __tablename__ = "budget_spend"
+
+    budget_id = Column(
+        Integer, ForeignKey("budgets.id", ondelete="CASCADE"), primary_key=True
+    )
+    # first day of the week (Monday), month or year
+    period_start = Column(Date, primary_key=True)
+    spent = Column(NUMERIC(precision=14, scale=2), default=0, nullable=False)
+    count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<BudgetSpend budget_id={self.budget_id} period_start={self.period_start} "
+            f"spent={self.spent}>"
+        )
@@ -1,7 +1,7 @@
 """
 Expense model
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP, NUMERIC
+from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP, NUMERIC, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -13,6 +13,17 @@ class Expense(Base):
     """
 
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Serves per-user listings newest first and, through INCLUDE (amount),
+        # index-only SUM(amount) per user on PostgreSQL.
+        Index(
+            "ix_expenses_user_id_date",
+            "user_id",
+            text("date DESC"),
+            text("id DESC"),
+            postgresql_include=["amount"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(NUMERIC(precision=10, scale=2), nullable=False)
@@ -2,7 +2,7 @@
 Income model
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP, NUMERIC
+from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP, NUMERIC, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -14,6 +14,15 @@ class Income(Base):
     """
 
     __tablename__ = "incomes"
+    __table_args__ = (
+        Index(
+            "ix_incomes_user_id_date",
+            "user_id",
+            text("date DESC"),
+            text("id DESC"),
+            postgresql_include=["amount"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(NUMERIC(precision=10, scale=2), nullable=False)
@@ -0,0 +1,34 @@
+"""
+Monthly rollup model
+"""
+
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, NUMERIC
+from app.db.database import Base
+
+
+class MonthlyRollup(Base):
+    """
+    monthly_rollups table, one row per (user, month, kind, category) holding
+    the sum and count of the expenses or incomes in that bucket. Maintained by
+    the expense and income services in the same transaction as the change.
+    """
+
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    # first day of the month
+    month = Column(Date, primary_key=True)
+    # "income" or "expense"
+    kind = Column(String(16), primary_key=True)
+    # expense category or income source
+    category = Column(String, primary_key=True)
+    total = Column(NUMERIC(precision=14, scale=2), default=0, nullable=False)
+    count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<MonthlyRollup user_id={self.user_id} month={self.month} "
+            f"kind={self.kind} category={self.category} total={self.total}>"
+        )
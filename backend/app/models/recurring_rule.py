@@ -0,0 +1,65 @@
+"""
+Recurring rule model
+"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    ForeignKey,
+    TIMESTAMP,
+    NUMERIC,
+    Boolean,
+    Index,
+)
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class RecurringRule(Base):
+    """
+    recurring_rules table, an income or expense repeated every `every`
+    days, weeks, months or years from `start_date`.
+
+    `next_due` is the rule's watermark: the first occurrence not yet
+    materialized. The scheduler advances it with a conditional UPDATE in the
+    same transaction as the entries it creates, which is its claim on them.
+    """
+
+    __tablename__ = "recurring_rules"
+    __table_args__ = (
+        Index("ix_recurring_rules_active_next_due", "is_active", "next_due"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    # "income" or "expense"
+    kind = Column(String(16), nullable=False)
+    amount = Column(NUMERIC(precision=10, scale=2), nullable=False)
+    # expense category or income source
+    category = Column(String, nullable=False)
+    # "daily", "weekly", "monthly" or "yearly"
+    interval = Column(String(16), nullable=False)
+    every = Column(Integer, default=1, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    next_due = Column(Date, nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return (
+            f"<RecurringRule id={self.id} user_id={self.user_id} kind={self.kind} "
+            f"amount={self.amount} every={self.every} {self.interval} next_due={self.next_due}>"
+        )
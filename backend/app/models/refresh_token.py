@@ -0,0 +1,54 @@
+"""
+Refresh token models
+"""
+
+from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class RefreshToken(Base):
+    """
+    refresh_tokens table, the live refresh tokens. Only the SHA-256 of a
+    token is stored, a token is used once and then replaced by its successor
+    in the same family
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    family_id = Column(String(32), index=True, nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<RefreshToken id={self.id} user_id={self.user_id} family={self.family_id}>"
+
+
+class RevokedRefreshToken(Base):
+    """
+    revoked_refresh_tokens table, the revocation store. Rotated and logged
+    out tokens are kept until they would have expired so that a replay can
+    be told apart from garbage and the whole family revoked
+    """
+
+    __tablename__ = "revoked_refresh_tokens"
+
+    token_hash = Column(String(64), primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    family_id = Column(String(32), nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), index=True, nullable=False)
+    revoked_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<RevokedRefreshToken user_id={self.user_id} family={self.family_id}>"
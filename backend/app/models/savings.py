@@ -2,7 +2,17 @@
 savings model
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP, Boolean, NUMERIC
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    TIMESTAMP,
+    Boolean,
+    NUMERIC,
+    Index,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -14,11 +24,20 @@ class Savings(Base):
     """
 
     __tablename__ = "savings"
+    __table_args__ = (
+        Index(
+            "ix_savings_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["amount"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     amount = Column(NUMERIC(precision=10, scale=2), nullable=False)
-    current_amount = Column(NUMERIC(precision=10, scale=2), nullable=True)
+    current_amount = Column(NUMERIC(precision=10, scale=2), nullable=True, default=0)
     goal = Column(NUMERIC(precision=10, scale=2), nullable=True)
     target_date = Column(TIMESTAMP(timezone=True), nullable=True)
     duration_months = Column(Integer, nullable=True)
@@ -0,0 +1,23 @@
+"""
+Token revocation model
+"""
+
+from sqlalchemy import Column, Integer, TIMESTAMP
+from app.db.database import Base
+
+
+class TokenRevocation(Base):
+    """
+    token_revocations table, the latest users.token_version of every user
+    whose access tokens were revoked. Workers poll it by revoked_at, so it
+    has no foreign key and outlives deleted users
+    """
+
+    __tablename__ = "token_revocations"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    token_version = Column(Integer, nullable=False)
+    revoked_at = Column(TIMESTAMP(timezone=True), index=True, nullable=False)
+
+    def __repr__(self):
+        return f"<TokenRevocation user_id={self.user_id} version={self.token_version}>"
@@ -10,6 +10,8 @@ from sqlalchemy import (
     TIMESTAMP,
     Numeric,
     CheckConstraint,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,6 +26,7 @@ class User(Base):
     __tablename__ = "users"
     __table_args__ = (
         CheckConstraint("balance >= 0", name="check_balance_non_negative"),
+        Index("ix_users_created_at_id", text("created_at DESC"), text("id DESC")),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -36,6 +39,7 @@ class User(Base):
     balance = Column(Numeric(12, 2), default=0.00, nullable=False)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     profile_img_url = Column(String(500), nullable=True)
     created_at = Column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
@@ -57,6 +61,9 @@ class User(Base):
     savings = relationship(
         "Savings", back_populates="user", cascade="all, delete-orphan"
     )
+    totals = relationship(
+        "UserTotals", back_populates="user", uselist=False, cascade="all, delete-orphan"
+    )
 
     def __repr__(self):
         """
@@ -0,0 +1,41 @@
+"""
+User totals model
+"""
+
+from sqlalchemy import Column, Integer, ForeignKey, TIMESTAMP, NUMERIC
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class UserTotals(Base):
+    """
+    user_totals table, running sums maintained by the income, expense and
+    savings services in the same transaction as the row they change
+    """
+
+    __tablename__ = "user_totals"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    total_income = Column(NUMERIC(precision=14, scale=2), default=0, nullable=False)
+    total_expense = Column(NUMERIC(precision=14, scale=2), default=0, nullable=False)
+    total_savings = Column(NUMERIC(precision=14, scale=2), default=0, nullable=False)
+    income_count = Column(Integer, default=0, nullable=False)
+    expense_count = Column(Integer, default=0, nullable=False)
+    savings_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    user = relationship("User", back_populates="totals")
+
+    def __repr__(self):
+        return (
+            f"<UserTotals user_id={self.user_id} income={self.total_income} "
+            f"expense={self.total_expense} savings={self.total_savings}>"
+        )
@@ -1,6 +1,34 @@
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
 from .user import router as user_router
 from .auth import router as auth_router
 from .income import router as income_router
 from .expense import router as expense_router
 from .savings import router as savings_router
-from .admin import router as admin_router
\ No newline at end of file
+from .admin import router as admin_router
+from .analytics import router as analytics_router
+from .transactions import router as transactions_router
+from .dashboard import router as dashboard_router
+from .budget import router as budget_router
+from .recurring import router as recurring_router
+
+
+def overlay_router(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """
+    Return a router with the sync routes replaced by their async counterparts.
+
+    Routes are matched on (path, methods) and keep the sync router's order, so
+    static paths like /expenses/total still win over /expenses/{expense_id}.
+    Endpoints without an async version keep being served by the sync router.
+    """
+    async_routes = {
+        (route.path, frozenset(route.methods)): route
+        for route in async_router.routes
+        if isinstance(route, APIRoute)
+    }
+
+    merged = APIRouter()
+    for route in sync_router.routes:
+        key = (route.path, frozenset(getattr(route, "methods", None) or ()))
+        merged.routes.append(async_routes.get(key, route))
+    return merged
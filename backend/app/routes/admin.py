@@ -4,6 +4,7 @@ Docstring for backend.app.routes.admin
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.schema.user import UserResponse, AdminUserUpdate
@@ -13,22 +14,29 @@ from app.db.database import get_db
 from app.services.user_service import (
     get_all_users_service,
     get_user_service,
-    update_user_service,
+    update_user_service_async,
     delete_user_service,
 )
 from app.core.permissions import Permission
-from app.schema.base import SuccessResponse
+from app.schema.base import SuccessResponse, PaginatedResponse
+from app.core.config import settings
+from app.utils.fast_json import paginated_json, response_columns
+from app.utils.pagination import InvalidCursorError, next_cursor
+from app.utils.principal_cache import invalidate_principal
+from app.utils.token_versions import revoke_user_tokens, token_versions
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
 
+USER_COLUMNS = response_columns(User, UserResponse)
+
 
 @router.get("/dashboard", response_model=SuccessResponse)
 def admin_dashboard(
     current_user: User = Depends(require_admin), db: Session = Depends(get_db)
 ):
-    logger.info(f"Admin {current_user.email} accessed the dashboard")
+    logger.info("Admin %s accessed the dashboard", current_user.email)
     """Admin dashboard endpoint"""
     total_users = db.query(User).count()
     total_expenses = db.query(Expense).count()
@@ -49,17 +57,24 @@ def admin_dashboard(
     )
 
 
-@router.get("/users", response_model=SuccessResponse[list[UserResponse]])
+@router.get("/users", response_model=PaginatedResponse[list[UserResponse]])
 def get_all_users(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     current_user: User = Depends(require([Permission.ADMIN_READ])),
     db: Session = Depends(get_db),
 ):
     """Get all users with pagination"""
 
     logger.info("Fetching users list by admin user_id: %s", current_user.id)
-    users = get_all_users_service(db, skip=skip, limit=limit)
+    columns = USER_COLUMNS if settings.fast_list_responses else None
+    try:
+        users = get_all_users_service(
+            db, skip=skip, limit=limit, cursor=cursor, columns=columns
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not users:
         logger.warning("No users found by admin user_id: %s", current_user.id)
@@ -68,7 +83,18 @@ def get_all_users(
         )
 
     logger.info("Users list retrieved by admin user_id: %s", current_user.id)
-    return SuccessResponse(message="Users retrieved successfully", data=users)
+    if columns:
+        return paginated_json(
+            "Users retrieved successfully",
+            users,
+            next_cursor(users, limit, date_attr="created_at"),
+            UserResponse,
+        )
+    return PaginatedResponse(
+        message="Users retrieved successfully",
+        data=users,
+        next_cursor=next_cursor(users, limit, date_attr="created_at"),
+    )
 
 
 @router.get("/users/{user_id}", response_model=SuccessResponse[UserResponse])
@@ -95,16 +121,21 @@ def fetch_user_by_id(
 
 
 @router.put("/users/{user_id}", response_model=SuccessResponse[UserResponse])
-def update_user_by_id(
+async def update_user_by_id(
     user_id: int,
     user: AdminUserUpdate,
     current_user: User = Depends(require([Permission.ADMIN_WRITE])),
     db: Session = Depends(get_db),
 ):
-    """Update a user for admins"""
+    """Update a user for admins, a new password is hashed on the hashing pool"""
 
     logger.info("Updating user_id: %s by admin user_id: %s", user_id, current_user.id)
-    updated_user = update_user_service(db, user, user_id)
+    updated_user = await update_user_service_async(db, user, user_id)
+    if updated_user and (user.role is not None or user.is_active is False):
+        # tokens carry the role, refuse the ones issued before
+        await run_in_threadpool(revoke_user_tokens, db, user_id)
+        await run_in_threadpool(db.refresh, updated_user)
+    invalidate_principal(user_id)
 
     if not updated_user:
         logger.warning(
@@ -127,7 +158,11 @@ def delete_user(
     """Delete a user for admins"""
 
     logger.info("Deleting user_id: %s by admin user_id: %s", user_id, current_user.id)
+    version = revoke_user_tokens(db, user_id, commit=False)
     deleted_user = delete_user_service(db, user_id)
+    if deleted_user:
+        token_versions.record(user_id, version)
+    invalidate_principal(user_id)
 
     if not deleted_user:
         logger.warning(
@@ -166,6 +201,9 @@ def activate_deactivate_user(
 
     user.is_active = activate
     db.commit()
+    if not activate:
+        revoke_user_tokens(db, user_id)
+    invalidate_principal(user_id)
     db.refresh(user)
     logger.info(
         "User_id: %s %s by admin user_id: %s",
@@ -0,0 +1,101 @@
+"""
+Analytics routes
+"""
+
+import logging
+from datetime import date
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.models import User
+from app.schema.analytics import (
+    MonthlySummary,
+    CategorySummary,
+    RollupKind,
+    Granularity,
+    TrendSeries,
+    CategoryTrends,
+)
+from app.schema.base import SuccessResponse
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions as require
+from app.services.analytics_service import (
+    monthly_summary_service,
+    category_summary_service,
+)
+
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/monthly", response_model=SuccessResponse[list[MonthlySummary]])
+def read_monthly_summary(
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.DASHBOARD_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Income, expense and net per month between start and end (inclusive months)
+    """
+    summaries = monthly_summary_service(current_user, db, start, end)
+    return SuccessResponse(message="Monthly summary retrieved successfully", data=summaries)
+
+
+@router.get("/categories", response_model=SuccessResponse[list[CategorySummary]])
+def read_category_summary(
+    kind: RollupKind = RollupKind.EXPENSE,
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.DASHBOARD_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Totals per expense category or income source between start and end
+    """
+    summaries = category_summary_service(current_user, db, kind, start, end)
+    return SuccessResponse(message="Category summary retrieved successfully", data=summaries)
+
+
+@router.get("/trends", response_model=SuccessResponse[TrendSeries])
+def read_trends(
+    kind: RollupKind = RollupKind.EXPENSE,
+    granularity: Granularity = Granularity.MONTH,
+    window: int = 3,
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.DASHBOARD_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Expense or income totals per day, week or month with their rolling mean
+    over `window` periods, and the distribution of the amounts
+    """
+    # NumPy is imported with the first trends request rather than at startup
+    from app.services.trends_service import trend_series_service
+
+    series = trend_series_service(current_user, db, kind, granularity, window, start, end)
+    return SuccessResponse(message="Trends retrieved successfully", data=series)
+
+
+@router.get("/trends/categories", response_model=SuccessResponse[CategoryTrends])
+def read_category_trends(
+    kind: RollupKind = RollupKind.EXPENSE,
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.DASHBOARD_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Distribution, monthly totals and month over month changes per expense
+    category or income source
+    """
+    from app.services.trends_service import category_trends_service
+
+    trends = category_trends_service(current_user, db, kind, start, end)
+    return SuccessResponse(message="Category trends retrieved successfully", data=trends)
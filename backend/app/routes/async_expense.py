@@ -0,0 +1,170 @@
+"""
+Async expense routes, overlaid on the sync ones when USE_ASYNC_DB is set
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
+from app.models import User
+from app.schema.expense import (
+    ExpenseCreate,
+    ExpenseCreated,
+    ExpenseResponse,
+    ExpenseUpdate,
+)
+from app.schema.base import SuccessResponse, PaginatedResponse
+from app.utils.pagination import InvalidCursorError, next_cursor
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions_async as require
+from app.services.async_expense_service import (
+    create_expense_service,
+    read_all_expense_service,
+    read_expense_service,
+    update_expense_service,
+    delete_expense_service,
+    InsufficientBalanceError,
+    UserNotFoundError,
+    ExpenseNotFoundError,
+)
+
+
+router = APIRouter(
+    prefix="/expenses",
+    tags=["expenses"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.post(
+    "/",
+    response_model=SuccessResponse[ExpenseCreated],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_expense(
+    expense: ExpenseCreate,
+    check_budget: bool = False,
+    current_user: User = Depends(require([Permission.EXPENSE_WRITE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Create a new expense entry. With `check_budget`, the response lists the
+    budgets of its category the expense took over their limit
+    """
+    try:
+        new_expense = await create_expense_service(
+            expense, current_user.id, db, check_budget
+        )
+    except InsufficientBalanceError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error creating expense: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Expense created successfully", data=new_expense)
+
+
+@router.get("/", response_model=PaginatedResponse[list[ExpenseResponse]])
+async def read_expenses(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    current_user: User = Depends(require([Permission.EXPENSE_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve all expense entries for the current user
+    """
+    try:
+        expenses = await read_all_expense_service(
+            current_user, db, skip, limit, cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return PaginatedResponse(
+        message="Expenses retrieved successfully",
+        data=expenses,
+        next_cursor=next_cursor(expenses, limit),
+    )
+
+
+@router.get("/{expense_id}", response_model=SuccessResponse[ExpenseResponse])
+async def read_expense(
+    expense_id: int,
+    current_user: User = Depends(require([Permission.EXPENSE_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve an expense entry by ID
+    """
+    try:
+        expense = await read_expense_service(expense_id, db)
+    except ExpenseNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return SuccessResponse(message="Expense retrieved successfully", data=expense)
+
+
+@router.put("/{expense_id}", response_model=SuccessResponse[ExpenseResponse])
+async def update_expense(
+    expense_id: int,
+    expense_update: ExpenseUpdate,
+    current_user: User = Depends(require([Permission.EXPENSE_WRITE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Update an existing expense entry
+    """
+    try:
+        updated_expense = await update_expense_service(
+            expense_id, expense_update, current_user, db
+        )
+    except InsufficientBalanceError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except (ExpenseNotFoundError, UserNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        if "Unauthorized" in str(e):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error updating expense: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Expense updated successfully", data=updated_expense)
+
+
+@router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_expense(
+    expense_id: int,
+    current_user: User = Depends(require([Permission.EXPENSE_DELETE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Delete an expense entry
+    """
+    try:
+        await delete_expense_service(expense_id, current_user, db)
+    except (ExpenseNotFoundError, UserNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        if "Unauthorized" in str(e):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error deleting expense: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return None
@@ -0,0 +1,175 @@
+"""
+Async income routes, overlaid on the sync ones when USE_ASYNC_DB is set
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
+from app.models import User
+from app.schema.income import IncomeCreate, IncomeResponse, IncomeUpdate
+from app.schema.base import SuccessResponse, PaginatedResponse
+from app.utils.pagination import InvalidCursorError, next_cursor
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions_async as require
+from app.services.async_income_service import (
+    create_income_service,
+    fetch_all_income_service,
+    fetch_income_service,
+    update_income_service,
+    delete_income_service,
+    IncomeNotFoundError,
+    UserNotFoundError,
+)
+
+
+router = APIRouter(
+    prefix="/incomes",
+    tags=["incomes"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.post(
+    "/",
+    response_model=SuccessResponse[IncomeResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_income(
+    income: IncomeCreate,
+    current_user: User = Depends(require([Permission.INCOME_WRITE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Create a new income entry
+    """
+    try:
+        new_income = await create_income_service(income, current_user, db)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error creating income: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Income created successfully", data=new_income)
+
+
+@router.get("/", response_model=PaginatedResponse[list[IncomeResponse]])
+async def read_incomes(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve all income entries for the current user
+    """
+    try:
+        incomes = await fetch_all_income_service(
+            current_user, db, skip, limit, cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error fetching incomes: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return PaginatedResponse(
+        message="Incomes retrieved successfully",
+        data=incomes,
+        next_cursor=next_cursor(incomes, limit),
+    )
+
+
+@router.get("/{income_id}", response_model=SuccessResponse[IncomeResponse])
+async def read_income(
+    income_id: int,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve an income entry by ID
+    """
+    try:
+        income = await fetch_income_service(income_id, current_user, db)
+    except IncomeNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        if "Unauthorized" in str(e):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Income not found"
+            )
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return SuccessResponse(message="Income retrieved successfully", data=income)
+
+
+@router.put("/{income_id}", response_model=SuccessResponse[IncomeResponse])
+async def update_income(
+    income_id: int,
+    income: IncomeUpdate,
+    current_user: User = Depends(require([Permission.INCOME_WRITE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Update an existing income entry
+    """
+    try:
+        income = await update_income_service(income_id, income, current_user, db)
+    except ValueError as e:
+        if "Unauthorized" in str(e):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IncomeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Income not found"
+        )
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error updating income: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Income updated successfully", data=income)
+
+
+@router.delete("/{income_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_income(
+    income_id: int,
+    current_user: User = Depends(require([Permission.INCOME_DELETE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Delete an income entry
+    """
+    try:
+        await delete_income_service(income_id, current_user, db)
+    except ValueError as e:
+        if "Unauthorized" in str(e):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IncomeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Income not found"
+        )
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error deleting income: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return None
@@ -0,0 +1,136 @@
+"""
+Async savings routes, overlaid on the sync ones when USE_ASYNC_DB is set
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import User
+from app.db.database import get_async_db
+from app.schema.savings import SavingsCreate, SavingsResponse, SavingsUpdate
+from app.schema.base import SuccessResponse, PaginatedResponse
+from app.utils.pagination import InvalidCursorError, next_cursor
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions_async as require
+from app.services.async_savings_service import (
+    get_saving_service,
+    get_all_savings_service,
+    create_saving_service,
+    update_saving_service,
+    delete_saving_service,
+)
+
+
+router = APIRouter(prefix="/savings", tags=["Savings"])
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/{savings_id}", response_model=SuccessResponse[SavingsResponse])
+async def read_saving(
+    savings_id: int,
+    current_user: User = Depends(require([Permission.SAVINGS_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieving savings for a user
+    """
+    try:
+        savings = await get_saving_service(savings_id, current_user, db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    if not savings:
+        raise HTTPException(status_code=404, detail="Savings not found")
+    return SuccessResponse(message="Savings retrieved successfully", data=savings)
+
+
+@router.get("/", response_model=PaginatedResponse[list[SavingsResponse]])
+async def read_savings(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    current_user: User = Depends(require([Permission.SAVINGS_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieving all savings for a user
+    """
+    try:
+        savings_list = await get_all_savings_service(
+            current_user, db, skip, limit, cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return PaginatedResponse(
+        message="Savings retrieved successfully",
+        data=savings_list,
+        next_cursor=next_cursor(savings_list, limit, date_attr="created_at"),
+    )
+
+
+@router.post(
+    "/",
+    response_model=SuccessResponse[SavingsResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create(
+    saving: SavingsCreate,
+    current_user: User = Depends(require([Permission.SAVINGS_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Creating new savings for a user
+    """
+    try:
+        new_savings = await create_saving_service(saving, current_user, db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    return SuccessResponse(message="Savings created successfully", data=new_savings)
+
+
+@router.put(
+    "/{savings_id}",
+    response_model=SuccessResponse[SavingsResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def update(
+    savings_id: int,
+    savings: SavingsUpdate,
+    current_user: User = Depends(require([Permission.SAVINGS_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Updating savings for a user
+    """
+    try:
+        existing_savings = await update_saving_service(
+            savings_id, savings, current_user, db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    if not existing_savings:
+        raise HTTPException(status_code=404, detail="Savings not found")
+    return SuccessResponse(message="Savings updated successfully", data=existing_savings)
+
+
+@router.delete("/{savings_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete(
+    savings_id: int,
+    current_user: User = Depends(require([Permission.SAVINGS_DELETE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Deleting savings of a user
+    """
+    try:
+        existing_savings = await delete_saving_service(savings_id, current_user, db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    if not existing_savings:
+        raise HTTPException(status_code=404, detail="Savings not found")
+    return None
@@ -0,0 +1,57 @@
+"""
+Async user routes, overlaid on the sync ones when USE_ASYNC_DB is set
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
+from app.models import User
+from app.schema.user import UserResponse, UserUpdate
+from app.services.async_user_service import get_user_service, update_user_service
+from app.core.permissions import Permission
+from app.utils.principal_cache import invalidate_principal
+from app.schema.base import SuccessResponse
+from app.dependencies.rbac import require_permissions_async as require
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/", response_model=SuccessResponse[UserResponse])
+async def fetch_user(
+    current_user: User = Depends(require([Permission.USER_READ])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get a user by ID"""
+    user = await get_user_service(db, current_user.id)
+
+    if not user:
+        logger.warning("User not found for user_id: %s", current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    return SuccessResponse(message="User profile retrieved successfully", data=user)
+
+
+@router.put("/", response_model=SuccessResponse[UserResponse])
+async def update_profile(
+    user: UserUpdate,
+    current_user: User = Depends(require([Permission.USER_WRITE])),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update a user"""
+    updated_user = await update_user_service(db, user, current_user.id)
+    invalidate_principal(current_user.id)
+
+    if not updated_user:
+        logger.warning("User not found for user_id: %s", current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    return SuccessResponse(
+        message="User profile updated successfully", data=updated_user
+    )
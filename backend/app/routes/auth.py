@@ -5,13 +5,28 @@ Authentication routes
 import logging
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.utils.auth import login_service, UserNotFoundError, signup_service
+from app.utils.auth import (
+    access_token_claims,
+    create_access_token,
+    login_service_async,
+    UserNotFoundError,
+    signup_service_async,
+)
+from app.utils.hashing import PasswordHasherBusyError
 from app.db.database import get_db
 from app.models import User
-from app.schema.user import UserCreate, UserResponse, UserLogin
+from app.schema.user import UserCreate, UserResponse, UserLogin, RefreshTokenRequest
 from app.dependencies.auth import get_current_active_user
-from app.utils.rate_limits import limiter
+from app.services.user_service import get_user_service
+from app.services.refresh_token_service import (
+    InvalidRefreshTokenError,
+    issue_refresh_token_service,
+    revoke_refresh_token_service,
+    rotate_refresh_token_service,
+)
+from app.utils.rate_limits import client_ip, limiter
 from app.schema.base import SuccessResponse
 
 logger = logging.getLogger(__name__)
@@ -19,27 +34,51 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _token_pair(token, expire, refresh_token, refresh_expire) -> dict:
+    return {
+        "access_token": token,
+        "token_type": "bearer",
+        "expires_in": int((expire - datetime.now(timezone.utc)).total_seconds()),
+        "expires_at": expire.isoformat(),
+        "refresh_token": refresh_token,
+        "refresh_expires_at": refresh_expire.isoformat(),
+    }
+
+
+def _login_response(user: User, token, expire, db: Session) -> dict:
+    refresh_token, refresh_expire = issue_refresh_token_service(user.id, db)
+    return {
+        **_token_pair(token, expire, refresh_token, refresh_expire),
+        "user": UserResponse.from_orm(user),
+    }
+
+
 @router.get("/me", response_model=UserResponse)
-def me(current_user: User = Depends(get_current_active_user)):
+def me(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
     """Get current authenticated user"""
-    return current_user
+    user = get_user_service(db, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return user
 
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")  # Rate limiting: 5 requests per minute
-def login(request: Request, payload: UserLogin, db: Session = Depends(get_db)):
-    """User Login route"""
+@limiter.limit("5/minute", key_func=client_ip)  # Rate limiting: 5 requests per minute
+async def login(request: Request, payload: UserLogin, db: Session = Depends(get_db)):
+    """
+    User Login route, async so the password check waits on the hashing pool
+    rather than on a request thread
+    """
 
     logger.info("Login attempt for email: %s", payload.email)
     try:
-        user, token, expire = login_service(payload, db)
-        return {
-            "access_token": token,
-            "token_type": "bearer",
-            "expires_in": int((expire - datetime.now(timezone.utc)).total_seconds()),
-            "expires_at": expire.isoformat(),
-            "user": UserResponse.from_orm(user),
-        }
+        user, token, expire = await login_service_async(payload, db)
+        return await run_in_threadpool(_login_response, user, token, expire, db)
     except ValueError as e:
         if "password" in str(e).lower():
             raise HTTPException(
@@ -48,7 +87,7 @@ def login(request: Request, payload: UserLogin, db: Session = Depends(get_db)):
             )
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except HTTPException:
+    except (HTTPException, PasswordHasherBusyError):
         raise
     except Exception as e:
         logger.error("Failed to login in user due to: %s", e)
@@ -58,24 +97,63 @@ def login(request: Request, payload: UserLogin, db: Session = Depends(get_db)):
         )
 
 
+@router.post("/refresh", status_code=status.HTTP_200_OK)
+@limiter.limit("30/minute", key_func=client_ip)
+def refresh(request: Request, payload: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new access token and refresh token"""
+
+    try:
+        user, refresh_token, refresh_expire = rotate_refresh_token_service(
+            payload.refresh_token, db
+        )
+        token, expire = create_access_token(data=access_token_claims(user))
+        return _token_pair(token, expire, refresh_token, refresh_expire)
+    except InvalidRefreshTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except Exception as e:
+        logger.error("Failed to refresh token due to: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """Revoke a refresh token"""
+
+    try:
+        revoke_refresh_token_service(payload.refresh_token, db)
+    except Exception as e:
+        logger.error("Failed to revoke refresh token due to: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
 @router.post(
     "/signup",
     response_model=SuccessResponse[UserResponse],
     status_code=status.HTTP_201_CREATED,
 )
-@limiter.limit("5/minute")  # Rate limiting: 3 requests per minute
-def create_user(request: Request, user: UserCreate, db: Session = Depends(get_db)):
-    """Create a new user"""
+@limiter.limit("5/minute", key_func=client_ip)  # Rate limiting: 3 requests per minute
+async def create_user(request: Request, user: UserCreate, db: Session = Depends(get_db)):
+    """Create a new user, hashing the password as login checks it"""
 
     logger.info("Signup attempt for email: %s", user.email)
     try:
-        new_user = signup_service(user, db)
+        new_user = await signup_service_async(user, db)
         logger.info("User %s created successfully", user.email)
         return SuccessResponse(message="User created successfully", data=new_user)
     except ValueError as e:
         if "already registered" in str(e).lower():
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    except HTTPException:
+    except (HTTPException, PasswordHasherBusyError):
         raise
     except Exception as e:
         logger.error("Failed to sign in user due to: %s", e)
@@ -0,0 +1,112 @@
+"""
+Budget routes
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.models import User
+from app.schema.budget import BudgetCreate, BudgetResponse, BudgetStatus, BudgetUpdate
+from app.schema.base import SuccessResponse
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions as require
+from app.services.budget_service import (
+    create_budget_service,
+    read_budgets_service,
+    update_budget_service,
+    delete_budget_service,
+    budget_status_service,
+    BudgetExistsError,
+    BudgetNotFoundError,
+)
+
+
+router = APIRouter(
+    prefix="/budgets",
+    tags=["budgets"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/status", response_model=SuccessResponse[list[BudgetStatus]])
+def read_budget_status(
+    current_user: User = Depends(require([Permission.BUDGET_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Spend of each budget in its current period against the limit, read from
+    the running counters
+    """
+    statuses = budget_status_service(current_user, db)
+    return SuccessResponse(message="Budget status retrieved successfully", data=statuses)
+
+
+@router.get("/", response_model=SuccessResponse[list[BudgetResponse]])
+def read_budgets(
+    current_user: User = Depends(require([Permission.BUDGET_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve the current user's budgets
+    """
+    budgets = read_budgets_service(current_user, db)
+    return SuccessResponse(message="Budgets retrieved successfully", data=budgets)
+
+
+@router.post(
+    "/",
+    response_model=SuccessResponse[BudgetResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_budget(
+    budget: BudgetCreate,
+    current_user: User = Depends(require([Permission.BUDGET_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a budget for an expense category and period
+    """
+    try:
+        new_budget = create_budget_service(budget, current_user, db)
+    except BudgetExistsError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    logger.info("Budget created with id: %s for user_id: %s", new_budget.id, current_user.id)
+    return SuccessResponse(message="Budget created successfully", data=new_budget)
+
+
+@router.put("/{budget_id}", response_model=SuccessResponse[BudgetResponse])
+def update_budget(
+    budget_id: int,
+    budget: BudgetUpdate,
+    current_user: User = Depends(require([Permission.BUDGET_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Change the limit of a budget
+    """
+    try:
+        updated = update_budget_service(budget_id, budget, current_user, db)
+    except BudgetNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return SuccessResponse(message="Budget updated successfully", data=updated)
+
+
+@router.delete("/{budget_id}", response_model=SuccessResponse[BudgetResponse])
+def delete_budget(
+    budget_id: int,
+    current_user: User = Depends(require([Permission.BUDGET_DELETE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Delete a budget
+    """
+    try:
+        deleted = delete_budget_service(budget_id, current_user, db)
+    except BudgetNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return SuccessResponse(message="Budget deleted successfully", data=deleted)
@@ -0,0 +1,38 @@
+"""
+Dashboard routes
+"""
+
+import logging
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.models import User
+from app.schema.base import SuccessResponse
+from app.schema.dashboard import Dashboard
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions as require
+from app.services.dashboard_service import dashboard_service
+
+
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/", response_model=SuccessResponse[Dashboard])
+def read_dashboard(
+    recent: int = 10,
+    categories: int = 5,
+    current_user: User = Depends(require([Permission.DASHBOARD_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Balance totals, month to date income and expense, the last `recent`
+    transactions, the month's top `categories` expense categories and the
+    open savings goals of the current user
+    """
+    dashboard = dashboard_service(current_user, db, recent, categories)
+    return SuccessResponse(message="Dashboard retrieved successfully", data=dashboard)
@@ -3,17 +3,42 @@ Expense routes
 """
 
 import logging
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models import Expense, User
-from app.schema.expense import ExpenseCreate, ExpenseResponse, ExpenseUpdate
-from app.schema.base import SuccessResponse
+from app.schema.analytics import AmountStats, MonthlyAmount
+from app.schema.expense import (
+    ExpenseCreate,
+    ExpenseCreated,
+    ExpenseResponse,
+    ExpenseUpdate,
+)
+from app.schema.base import (
+    SuccessResponse,
+    PaginatedResponse,
+    BulkCreateRequest,
+    BulkCreateResult,
+)
+from app.core.config import settings
+from app.utils.export import iter_csv
+from app.utils.fast_json import paginated_json, response_columns
+from app.utils.pagination import InvalidCursorError, next_cursor
 from app.core.permissions import Permission
+from app.services.export_service import export_expenses_service, EXPENSE_HEADER
+from app.services.stats_service import (
+    amount_stats_service,
+    monthly_amounts_service,
+    total_amount_service,
+    entries_in_category_service,
+    has_entries_service,
+)
 from app.dependencies.rbac import require_permissions as require
-from app.utils.expense import calculate_total_expenses, filter_expenses_by_category
 from app.services.expense_service import (
     create_expense_service,
+    bulk_create_expense_service,
     read_all_expense_service,
     read_expense_service,
     update_expense_service,
@@ -31,19 +56,23 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+EXPENSE_COLUMNS = response_columns(Expense, ExpenseResponse)
+
 
 @router.post(
     "/",
-    response_model=SuccessResponse[ExpenseResponse],
+    response_model=SuccessResponse[ExpenseCreated],
     status_code=status.HTTP_201_CREATED,
 )
 def create_expense(
     expense: ExpenseCreate,
+    check_budget: bool = False,
     current_user: User = Depends(require([Permission.EXPENSE_WRITE])),
     db: Session = Depends(get_db),
 ):
     """
-    Create a new expense entry
+    Create a new expense entry. With `check_budget`, the response lists the
+    budgets of its category the expense took over their limit
     """
     logger.info(
         "Creating expense for user_id: %s, amount: %s, category: %s",
@@ -53,7 +82,9 @@ def create_expense(
     )
 
     try:
-        new_expense = create_expense_service(expense, current_user.id, db)
+        new_expense = create_expense_service(
+            expense, current_user.id, db, check_budget
+        )
     except InsufficientBalanceError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except UserNotFoundError as e:
@@ -71,48 +102,132 @@ def create_expense(
     return SuccessResponse(message="Expense created successfully", data=new_expense)
 
 
-@router.get("/", response_model=SuccessResponse[list[ExpenseResponse]])
+@router.post("/bulk", response_model=SuccessResponse[BulkCreateResult])
+def bulk_create_expenses(
+    payload: BulkCreateRequest,
+    current_user: User = Depends(require([Permission.EXPENSE_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Create many expense entries at once, reporting per-row errors
+    """
+    if len(payload.items) > settings.bulk_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.bulk_max_rows} rows per request",
+        )
+
+    logger.info(
+        "Bulk creating %d expenses for user_id: %s", len(payload.items), current_user.id
+    )
+    try:
+        result = bulk_create_expense_service(payload.items, current_user.id, db)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error bulk creating expenses: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Expenses processed successfully", data=result)
+
+
+@router.get("/", response_model=PaginatedResponse[list[ExpenseResponse]])
 def read_expenses(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     current_user: User = Depends(require([Permission.EXPENSE_READ])),
     db: Session = Depends(get_db),
 ):
     """
     Retrieve all expense entries for the current user
     """
-    expenses = read_all_expense_service(current_user, db, skip, limit)
+    columns = EXPENSE_COLUMNS if settings.fast_list_responses else None
+    try:
+        expenses = read_all_expense_service(
+            current_user, db, skip, limit, cursor, columns=columns
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     logger.info("Found %d expenses for user_id: %s", len(expenses), current_user.id)
-    return SuccessResponse(message="Expenses retrieved successfully", data=expenses)
+    if columns:
+        return paginated_json(
+            "Expenses retrieved successfully",
+            expenses,
+            next_cursor(expenses, limit),
+            ExpenseResponse,
+        )
+    return PaginatedResponse(
+        message="Expenses retrieved successfully",
+        data=expenses,
+        next_cursor=next_cursor(expenses, limit),
+    )
 
 
 @router.get("/total")
 def get_total_expenses(
+    start: date | None = None,
+    end: date | None = None,
     current_user: User = Depends(require([Permission.EXPENSE_READ])),
     db: Session = Depends(get_db),
 ):
     """
-    Calculate total expenses for a user
+    Calculate total expenses for a user, optionally between start and end
     """
     logger.info("Calculating total expenses for user_id: %s", current_user.id)
-    expenses = db.query(Expense).filter(Expense.user_id == current_user.id).all()
+    total = total_amount_service(Expense, current_user, db, start, end)
 
-    if not expenses:
+    if not total:
         logger.warning("No expenses found for user_id: %s", current_user.id)
         return {"user_id": current_user.id, "total_expenses": 0.0}
 
-    total = calculate_total_expenses(expenses)
-
-    logger.info("Total expenses for user_id: %s is %f", current_user.id, total)
+    logger.info("Total expenses for user_id: %s is %s", current_user.id, total)
     return {"user_id": current_user.id, "total_expenses": total}
 
 
+@router.get("/stats", response_model=SuccessResponse[AmountStats])
+def get_expense_stats(
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+    current_user: User = Depends(require([Permission.EXPENSE_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Total, count, average, min and max expense, optionally of one category
+    and between start and end
+    """
+    stats = amount_stats_service(Expense, current_user, db, start, end, category)
+    return SuccessResponse(message="Expense stats retrieved successfully", data=stats)
+
+
+@router.get("/monthly", response_model=SuccessResponse[list[MonthlyAmount]])
+def get_monthly_expenses(
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+    current_user: User = Depends(require([Permission.EXPENSE_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Expense total and count per month, optionally of one category and
+    between start and end
+    """
+    months = monthly_amounts_service(Expense, current_user, db, start, end, category)
+    return SuccessResponse(message="Monthly expenses retrieved successfully", data=months)
+
+
 @router.get(
     "/category/{category}", response_model=SuccessResponse[list[ExpenseResponse]]
 )
 def get_expenses_by_category(
     category: str,
+    start: date | None = None,
+    end: date | None = None,
     current_user: User = Depends(require([Permission.EXPENSE_READ])),
     db: Session = Depends(get_db),
 ):
@@ -122,23 +237,40 @@ def get_expenses_by_category(
     logger.info(
         "Fetching expenses for user_id: %s in category: %s", current_user.id, category
     )
-    expenses = db.query(Expense).filter(Expense.user_id == current_user.id).all()
+    expenses = entries_in_category_service(
+        Expense, current_user, db, category, start, end
+    )
 
-    if not expenses:
+    if not expenses and not has_entries_service(Expense, current_user, db):
         logger.warning("No expenses found for user_id: %s", current_user.id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Expenses not found"
         )
 
-    filtered_expenses = filter_expenses_by_category(expenses, category)
     logger.info(
         "Found %d expenses for user_id: %s in category: %s",
-        len(filtered_expenses),
+        len(expenses),
         current_user.id,
         category,
     )
-    return SuccessResponse(
-        message="Expenses retrieved successfully", data=filtered_expenses
+    return SuccessResponse(message="Expenses retrieved successfully", data=expenses)
+
+
+@router.get("/export.csv", response_class=StreamingResponse)
+def export_expenses(
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.EXPENSE_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream the expense entries of the current user as CSV
+    """
+    rows = export_expenses_service(current_user, db, start, end)
+    return StreamingResponse(
+        iter_csv(EXPENSE_HEADER, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="expenses.csv"'},
     )
 
 
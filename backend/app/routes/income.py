@@ -3,16 +3,36 @@ Income routes
 """
 
 import logging
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
-from app.models import User
+from app.models import Income, User
+from app.schema.analytics import AmountStats, MonthlyAmount
 from app.schema.income import IncomeCreate, IncomeResponse, IncomeUpdate
-from app.schema.base import SuccessResponse
+from app.schema.base import (
+    SuccessResponse,
+    PaginatedResponse,
+    BulkCreateRequest,
+    BulkCreateResult,
+)
+from app.core.config import settings
+from app.utils.export import iter_csv
+from app.utils.fast_json import paginated_json, response_columns
+from app.utils.pagination import InvalidCursorError, next_cursor
 from app.core.permissions import Permission
+from app.services.export_service import export_incomes_service, INCOME_HEADER
+from app.services.stats_service import (
+    amount_stats_service,
+    monthly_amounts_service,
+    total_amount_service,
+    entries_in_category_service,
+)
 from app.dependencies.rbac import require_permissions as require
 from app.services.income_service import (
     create_income_service,
+    bulk_create_income_service,
     fetch_all_income_service,
     fetch_income_service,
     update_income_service,
@@ -29,6 +49,8 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+INCOME_COLUMNS = response_columns(Income, IncomeResponse)
+
 
 @router.post(
     "/",
@@ -66,10 +88,43 @@ def create_income(
     return SuccessResponse(message="Income created successfully", data=new_income)
 
 
-@router.get("/", response_model=SuccessResponse[list[IncomeResponse]])
+@router.post("/bulk", response_model=SuccessResponse[BulkCreateResult])
+def bulk_create_incomes(
+    payload: BulkCreateRequest,
+    current_user: User = Depends(require([Permission.INCOME_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Create many income entries at once, reporting per-row errors
+    """
+    if len(payload.items) > settings.bulk_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.bulk_max_rows} rows per request",
+        )
+
+    logger.info(
+        "Bulk creating %d incomes for user_id: %s", len(payload.items), current_user.id
+    )
+    try:
+        result = bulk_create_income_service(payload.items, current_user, db)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error bulk creating incomes: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+    return SuccessResponse(message="Incomes processed successfully", data=result)
+
+
+@router.get("/", response_model=PaginatedResponse[list[IncomeResponse]])
 def read_incomes(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     current_user: User = Depends(require([Permission.INCOME_READ])),
     db: Session = Depends(get_db),
 ):
@@ -77,8 +132,13 @@ def read_incomes(
     Retrieve all income entries for the current user
     """
     logger.info("Fetching incomes for user_id: %s", current_user.id)
+    columns = INCOME_COLUMNS if settings.fast_list_responses else None
     try:
-        incomes = fetch_all_income_service(current_user, db, skip, limit)
+        incomes = fetch_all_income_service(
+            current_user, db, skip, limit, cursor, columns=columns
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("Unexpected error updating income: %s", e)
         raise HTTPException(
@@ -87,9 +147,103 @@ def read_incomes(
         )
 
     logger.info("Found %d incomes for user_id: %s", len(incomes), current_user.id)
+    if columns:
+        return paginated_json(
+            "Incomes retrieved successfully",
+            incomes,
+            next_cursor(incomes, limit),
+            IncomeResponse,
+        )
+    return PaginatedResponse(
+        message="Incomes retrieved successfully",
+        data=incomes,
+        next_cursor=next_cursor(incomes, limit),
+    )
+
+
+@router.get("/total")
+def get_total_income(
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Calculate total income for a user, optionally between start and end
+    """
+    logger.info("Calculating total income for user_id: %s", current_user.id)
+    total = total_amount_service(Income, current_user, db, start, end)
+    return {"user_id": current_user.id, "total_income": total or 0.0}
+
+
+@router.get("/stats", response_model=SuccessResponse[AmountStats])
+def get_income_stats(
+    start: date | None = None,
+    end: date | None = None,
+    source: str | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Total, count, average, min and max income, optionally of one source
+    and between start and end
+    """
+    stats = amount_stats_service(Income, current_user, db, start, end, source)
+    return SuccessResponse(message="Income stats retrieved successfully", data=stats)
+
+
+@router.get("/monthly", response_model=SuccessResponse[list[MonthlyAmount]])
+def get_monthly_income(
+    start: date | None = None,
+    end: date | None = None,
+    source: str | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Income total and count per month, optionally of one source and between
+    start and end
+    """
+    months = monthly_amounts_service(Income, current_user, db, start, end, source)
+    return SuccessResponse(message="Monthly income retrieved successfully", data=months)
+
+
+@router.get("/source/{source}", response_model=SuccessResponse[list[IncomeResponse]])
+def get_incomes_by_source(
+    source: str,
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve incomes for a user filtered by source
+    """
+    logger.info(
+        "Fetching incomes for user_id: %s from source: %s", current_user.id, source
+    )
+    incomes = entries_in_category_service(Income, current_user, db, source, start, end)
     return SuccessResponse(message="Incomes retrieved successfully", data=incomes)
 
 
+@router.get("/export.csv", response_class=StreamingResponse)
+def export_incomes(
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(require([Permission.INCOME_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream the income entries of the current user as CSV
+    """
+    rows = export_incomes_service(current_user, db, start, end)
+    return StreamingResponse(
+        iter_csv(INCOME_HEADER, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="incomes.csv"'},
+    )
+
+
 @router.get("/{income_id}", response_model=SuccessResponse[IncomeResponse])
 def read_income(
     income_id: int,
@@ -0,0 +1,102 @@
+"""
+Recurring rule routes
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.models import User
+from app.schema.recurring import (
+    RecurringRuleCreate,
+    RecurringRuleResponse,
+    RecurringRuleUpdate,
+)
+from app.schema.base import SuccessResponse
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions as require
+from app.services.recurring_service import (
+    create_recurring_rule_service,
+    read_recurring_rules_service,
+    update_recurring_rule_service,
+    delete_recurring_rule_service,
+    InvalidRecurringRuleError,
+    RecurringRuleNotFoundError,
+)
+
+
+router = APIRouter(
+    prefix="/recurring",
+    tags=["recurring"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/", response_model=SuccessResponse[list[RecurringRuleResponse]])
+def read_recurring_rules(
+    current_user: User = Depends(require([Permission.RECURRING_READ])),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve the current user's recurring incomes and expenses
+    """
+    rules = read_recurring_rules_service(current_user, db)
+    return SuccessResponse(message="Recurring rules retrieved successfully", data=rules)
+
+
+@router.post(
+    "/",
+    response_model=SuccessResponse[RecurringRuleResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_recurring_rule(
+    rule: RecurringRuleCreate,
+    current_user: User = Depends(require([Permission.RECURRING_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a recurring income or expense, the scheduler creates its entries
+    """
+    new_rule = create_recurring_rule_service(rule, current_user, db)
+    logger.info(
+        "Recurring rule created with id: %s for user_id: %s", new_rule.id, current_user.id
+    )
+    return SuccessResponse(message="Recurring rule created successfully", data=new_rule)
+
+
+@router.put("/{rule_id}", response_model=SuccessResponse[RecurringRuleResponse])
+def update_recurring_rule(
+    rule_id: int,
+    rule: RecurringRuleUpdate,
+    current_user: User = Depends(require([Permission.RECURRING_WRITE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Update a recurring rule's future occurrences, or pause it
+    """
+    try:
+        updated = update_recurring_rule_service(rule_id, rule, current_user, db)
+    except RecurringRuleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidRecurringRuleError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return SuccessResponse(message="Recurring rule updated successfully", data=updated)
+
+
+@router.delete("/{rule_id}", response_model=SuccessResponse[RecurringRuleResponse])
+def delete_recurring_rule(
+    rule_id: int,
+    current_user: User = Depends(require([Permission.RECURRING_DELETE])),
+    db: Session = Depends(get_db),
+):
+    """
+    Delete a recurring rule, the entries it created are kept
+    """
+    try:
+        deleted = delete_recurring_rule_service(rule_id, current_user, db)
+    except RecurringRuleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return SuccessResponse(message="Recurring rule deleted successfully", data=deleted)
@@ -8,7 +8,10 @@ from sqlalchemy.orm import Session
 from app.models import Savings, User
 from app.db.database import get_db
 from app.schema.savings import SavingsCreate, SavingsResponse, SavingsUpdate
-from app.schema.base import SuccessResponse
+from app.schema.base import SuccessResponse, PaginatedResponse
+from app.core.config import settings
+from app.utils.fast_json import paginated_json, response_columns
+from app.utils.pagination import InvalidCursorError, next_cursor
 from app.core.permissions import Permission, Role
 from app.dependencies.rbac import require_permissions as require
 from app.services.savings_service import (
@@ -24,6 +27,8 @@ router = APIRouter(prefix="/savings", tags=["Savings"])
 
 logger = logging.getLogger(__name__)
 
+SAVINGS_COLUMNS = response_columns(Savings, SavingsResponse)
+
 
 @router.get("/{savings_id}", response_model=SuccessResponse[SavingsResponse])
 def read_saving(
@@ -47,16 +52,37 @@ def read_saving(
         )
 
 
-@router.get("/", response_model=SuccessResponse[list[SavingsResponse]])
+@router.get("/", response_model=PaginatedResponse[list[SavingsResponse]])
 def read_savings(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
     current_user: User = Depends(require([Permission.SAVINGS_READ])),
     db: Session = Depends(get_db),
 ):
     """
     Retrieving all savings for a user
     """
-    savings_list = get_all_savings_service(current_user, db)
-    return SuccessResponse(message="Savings retrieved successfully", data=savings_list)
+    columns = SAVINGS_COLUMNS if settings.fast_list_responses else None
+    try:
+        savings_list = get_all_savings_service(
+            current_user, db, skip, limit, cursor, columns=columns
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if columns:
+        return paginated_json(
+            "Savings retrieved successfully",
+            savings_list,
+            next_cursor(savings_list, limit, date_attr="created_at"),
+            SavingsResponse,
+        )
+    return PaginatedResponse(
+        message="Savings retrieved successfully",
+        data=savings_list,
+        next_cursor=next_cursor(savings_list, limit, date_attr="created_at"),
+    )
 
 
 @router.post(
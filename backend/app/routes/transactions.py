@@ -0,0 +1,43 @@
+"""
+Transaction routes, spanning expenses and incomes
+"""
+
+import logging
+from datetime import date
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.models import User
+from app.core.permissions import Permission
+from app.dependencies.rbac import require_permissions as require
+from app.utils.export import iter_csv
+from app.services.export_service import export_transactions_service, TRANSACTION_HEADER
+
+
+router = APIRouter(
+    prefix="/transactions",
+    tags=["transactions"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/export.csv", response_class=StreamingResponse)
+def export_transactions(
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(
+        require([Permission.EXPENSE_READ, Permission.INCOME_READ])
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream the expenses and incomes of the current user as one CSV
+    """
+    rows = export_transactions_service(current_user, db, start, end)
+    return StreamingResponse(
+        iter_csv(TRANSACTION_HEADER, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="transactions.csv"'},
+    )
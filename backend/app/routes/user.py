@@ -8,8 +8,9 @@ from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models import User
 from app.schema.user import UserResponse, UserUpdate
-from app.services.user_service import get_user_service, update_user_service
+from app.services.user_service import get_user_service, update_user_service_async
 from app.core.permissions import Permission
+from app.utils.principal_cache import invalidate_principal
 from app.schema.base import SuccessResponse
 from app.dependencies.rbac import require_permissions as require
 
@@ -38,14 +39,15 @@ def fetch_user(
 
 
 @router.put("/", response_model=SuccessResponse[UserResponse])
-def update_profile(
+async def update_profile(
     user: UserUpdate,
     current_user: User = Depends(require([Permission.USER_WRITE])),
     db: Session = Depends(get_db),
 ):
-    """Update a user"""
+    """Update a user, any new password is hashed on the hashing pool"""
     logger.info("Updating user profile for user_id: %s", current_user.id)
-    updated_user = update_user_service(db, user, current_user.id)
+    updated_user = await update_user_service_async(db, user, current_user.id)
+    invalidate_principal(current_user.id)
 
     if not updated_user:
         logger.warning("User not found for user_id: %s", current_user.id)
@@ -0,0 +1,118 @@
+"""
+Analytics schemas
+"""
+
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from app.schema.base import Schema
+
+
+class RollupKind(str, Enum):
+    """Kind of entries a rollup bucket sums"""
+    INCOME = "income"
+    EXPENSE = "expense"
+
+
+class MonthlySummary(Schema):
+    """
+    Income and expense totals of one month
+    """
+    month: date
+    total_income: Decimal = Decimal(0)
+    total_expense: Decimal = Decimal(0)
+    net: Decimal = Decimal(0)
+    income_count: int = 0
+    expense_count: int = 0
+
+
+class CategorySummary(Schema):
+    """
+    Total of one expense category or income source over a period
+    """
+    category: str
+    total: Decimal
+    count: int
+
+
+class AmountStats(Schema):
+    """
+    Sum, count, average, smallest and largest amount of expenses or incomes
+    """
+    total: Decimal = Decimal(0)
+    count: int = 0
+    average: Optional[Decimal] = None
+    min: Optional[Decimal] = None
+    max: Optional[Decimal] = None
+
+
+class MonthlyAmount(Schema):
+    """
+    Sum and count of the expenses or incomes of one month
+    """
+    month: date
+    total: Decimal
+    count: int
+
+
+class Granularity(str, Enum):
+    """Length of the periods of a trend series"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class AmountDistribution(Schema):
+    """
+    Count, total, mean, standard deviation and percentiles of amounts
+    """
+    count: int = 0
+    total: float = 0
+    mean: Optional[float] = None
+    stddev: Optional[float] = None
+    p25: Optional[float] = None
+    p50: Optional[float] = None
+    p75: Optional[float] = None
+    p90: Optional[float] = None
+
+
+class TrendPoint(Schema):
+    """
+    Total and count of one period, with the rolling mean of the totals
+    """
+    period: date
+    total: float
+    count: int
+    rolling_mean: float
+
+
+class TrendSeries(Schema):
+    """
+    Totals per day, week or month, gaps included as zeros
+    """
+    kind: RollupKind
+    granularity: Granularity
+    window: int
+    distribution: AmountDistribution
+    points: list[TrendPoint]
+
+
+class CategoryTrend(AmountDistribution):
+    """
+    Distribution and monthly totals of one category or source; the month
+    over month lists are None for the first month
+    """
+    category: str
+    monthly: list[float]
+    month_over_month: list[Optional[float]]
+    month_over_month_pct: list[Optional[float]]
+
+
+class CategoryTrends(Schema):
+    """
+    Per-category trends, monthly values aligned with months
+    """
+    kind: RollupKind
+    months: list[date]
+    categories: list[CategoryTrend]
@@ -1,9 +1,29 @@
-from typing import Generic, TypeVar, Optional
-from pydantic import BaseModel
+from typing import Any, Generic, TypeVar, Optional
+from pydantic import BaseModel, ConfigDict
 
 T = TypeVar("T")
 
-class ResponseBase(BaseModel):
+
+class Schema(BaseModel):
+    """
+    Base of the API schemas. Their validators and serializers are built on
+    first use rather than at import, which keeps them (and email_validator)
+    off the startup path
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+def build_schemas():
+    """Build every deferred schema now, e.g. before forking workers"""
+    pending = [Schema]
+    while pending:
+        schema = pending.pop()
+        pending.extend(schema.__subclasses__())
+        if schema is not Schema:
+            schema.model_rebuild()
+
+
+class ResponseBase(Schema):
     """Response base schema"""
     success: bool
     message: str
@@ -16,6 +36,29 @@ class SuccessResponse(ResponseBase, Generic[T]):
     data: T
 
 
+class PaginatedResponse(SuccessResponse[T], Generic[T]):
+    """Success response schema for keyset-paginated listings"""
+    next_cursor: Optional[str] = None
+
+
+class BulkCreateRequest(Schema):
+    """Bulk create request, rows are validated one by one"""
+    items: list[dict[str, Any]]
+
+
+class BulkRowError(Schema):
+    """Validation or business error of one row of a bulk request"""
+    index: int
+    error: str
+
+
+class BulkCreateResult(Schema):
+    """Outcome of a bulk create"""
+    created: int
+    ids: list[int]
+    errors: list[BulkRowError]
+
+
 class ErrorResponse(ResponseBase, Generic[T]):
     """Error response schema"""
     success: bool = False
@@ -0,0 +1,105 @@
+"""
+Budget schemas
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pydantic import ConfigDict, field_validator
+from app.schema.base import Schema
+
+
+class BudgetPeriod(str, Enum):
+    """Period a budget limit applies to"""
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+class BudgetCreate(Schema):
+    """
+    Schema for creating a budget
+    """
+    category: str
+    period: BudgetPeriod = BudgetPeriod.MONTHLY
+    limit: Decimal
+
+    @field_validator('limit')
+    @classmethod
+    def limit_is_positive(cls, value):
+        """
+        Validate that the limit is positive
+        """
+        if value <= 0:
+            raise ValueError("Limit must be positive")
+        return value
+
+    @field_validator('category')
+    @classmethod
+    def category_not_empty(cls, value):
+        """
+        Validate that the category is not empty
+        """
+        if not value or value.strip() == "":
+            raise ValueError("Category must not be empty")
+        return value
+
+
+class BudgetUpdate(Schema):
+    """
+    Schema for updating a budget, only the limit can change
+    """
+    limit: Decimal
+
+    @field_validator('limit')
+    @classmethod
+    def limit_is_positive(cls, value):
+        """
+        Validate that the limit is positive
+        """
+        if value <= 0:
+            raise ValueError("Limit must be positive")
+        return value
+
+
+class BudgetResponse(Schema):
+    """
+    Schema for outputting a budget
+    """
+    id: int
+    category: str
+    period: BudgetPeriod
+    limit: Decimal
+    user_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BudgetStatus(Schema):
+    """
+    Spend of a budget in its current period against the limit
+    """
+    id: int
+    category: str
+    period: BudgetPeriod
+    limit: Decimal
+    period_start: date
+    period_end: date
+    spent: Decimal
+    count: int
+    remaining: Decimal
+    over_budget: bool
+
+
+class BudgetAlert(Schema):
+    """
+    A budget an expense took over its limit
+    """
+    id: int
+    category: str
+    period: BudgetPeriod
+    limit: Decimal
+    period_start: date
+    spent: Decimal
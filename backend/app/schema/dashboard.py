@@ -0,0 +1,67 @@
+"""
+Dashboard schemas
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from app.schema.analytics import CategorySummary, RollupKind
+from app.schema.base import Schema
+
+
+class BalanceSummary(Schema):
+    """
+    All-time totals of a user, as get_user_balance reports them
+    """
+    total_income: Decimal = Decimal(0)
+    total_expense: Decimal = Decimal(0)
+    total_savings: Decimal = Decimal(0)
+    balance: Decimal = Decimal(0)
+    net_balance: Decimal = Decimal(0)
+    income_count: int = 0
+    expense_count: int = 0
+    savings_count: int = 0
+
+
+class MonthToDate(Schema):
+    """
+    Income and expense of the current month
+    """
+    month: date
+    income: Decimal = Decimal(0)
+    expense: Decimal = Decimal(0)
+    net: Decimal = Decimal(0)
+
+
+class RecentTransaction(Schema):
+    """
+    An expense or income, category holds the income source
+    """
+    id: int
+    type: RollupKind
+    category: str
+    amount: Decimal
+    date: Optional[datetime] = None
+
+
+class SavingsGoal(Schema):
+    """
+    A savings entry not completed yet
+    """
+    id: int
+    amount: Decimal
+    current_amount: Optional[Decimal] = None
+    goal: Optional[Decimal] = None
+    target_date: Optional[datetime] = None
+    description: Optional[str] = None
+
+
+class Dashboard(Schema):
+    """
+    Everything the dashboard page shows, read in two queries
+    """
+    balance: BalanceSummary
+    month_to_date: MonthToDate
+    recent_transactions: list[RecentTransaction]
+    top_categories: list[CategorySummary]
+    savings_goals: list[SavingsGoal]
@@ -1,12 +1,15 @@
 """
 Expense schema
 """
-from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Optional
+from pydantic import ConfigDict, field_validator
+from app.schema.base import Schema
+from app.schema.budget import BudgetAlert
 from datetime import datetime
 from decimal import Decimal
 
 
-class ExpenseCreate(BaseModel):
+class ExpenseCreate(Schema):
     """
     Schema for creating an expense entry
     """
@@ -35,7 +38,7 @@ class ExpenseCreate(BaseModel):
         return value
 
 
-class ExpenseUpdate(BaseModel):
+class ExpenseUpdate(Schema):
     """
     Schema for updating an expense entry
     """
@@ -64,7 +67,7 @@ class ExpenseUpdate(BaseModel):
         return value
 
 
-class ExpenseResponse(BaseModel):
+class ExpenseResponse(Schema):
     """
     Schema for outputting an expense entry
     """
@@ -77,3 +80,11 @@ class ExpenseResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ExpenseCreated(ExpenseResponse):
+    """
+    Schema for outputting a created expense, with the budgets it took over
+    their limit when the creation asked for the check
+    """
+    over_budget: Optional[list[BudgetAlert]] = None
@@ -3,11 +3,12 @@ Income schema
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import ConfigDict, field_validator
+from app.schema.base import Schema
 from decimal import Decimal
 
 
-class IncomeCreate(BaseModel):
+class IncomeCreate(Schema):
     """
     Schema for creating an income entry
     """
@@ -26,7 +27,7 @@ class IncomeCreate(BaseModel):
         return value
 
 
-class IncomeUpdate(BaseModel):
+class IncomeUpdate(Schema):
     """
     Schema for updating an income entry
     """
@@ -44,7 +45,7 @@ class IncomeUpdate(BaseModel):
             raise ValueError("Amount must be positive")
         return value
 
-class IncomeResponse(BaseModel):
+class IncomeResponse(Schema):
     """
     Schema for outputting an income entry
     """
@@ -0,0 +1,129 @@
+"""
+Recurring rule schemas
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from pydantic import ConfigDict, field_validator, model_validator
+from app.schema.base import Schema
+
+
+class RecurringKind(str, Enum):
+    """Kind of entry a rule creates"""
+    INCOME = "income"
+    EXPENSE = "expense"
+
+
+class RecurringInterval(str, Enum):
+    """Unit of the time between two occurrences"""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+class RecurringRuleCreate(Schema):
+    """
+    Schema for creating a recurring income or expense. A start date in the
+    past is caught up on by the scheduler
+    """
+    kind: RecurringKind
+    amount: Decimal
+    category: str
+    interval: RecurringInterval = RecurringInterval.MONTHLY
+    every: int = 1
+    start_date: date
+    end_date: Optional[date] = None
+
+    @field_validator('amount')
+    @classmethod
+    def amount_is_positive(cls, value):
+        """
+        Validate that the amount is positive
+        """
+        if value <= 0:
+            raise ValueError("Amount must be positive")
+        return value
+
+    @field_validator('category')
+    @classmethod
+    def category_not_empty(cls, value):
+        """
+        Validate that the category is not empty
+        """
+        if not value or value.strip() == "":
+            raise ValueError("Category must not be empty")
+        return value
+
+    @field_validator('every')
+    @classmethod
+    def every_is_positive(cls, value):
+        """
+        Validate that the rule repeats at least once per interval
+        """
+        if value <= 0:
+            raise ValueError("Every must be a positive integer")
+        return value
+
+    @model_validator(mode='after')
+    def end_after_start(self):
+        """
+        Validate that the end date is not before the start date
+        """
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("End date must not be before the start date")
+        return self
+
+
+class RecurringRuleUpdate(Schema):
+    """
+    Schema for updating a recurring rule, changes apply to the occurrences
+    not yet created
+    """
+    amount: Optional[Decimal] = None
+    category: Optional[str] = None
+    end_date: Optional[date] = None
+    is_active: Optional[bool] = None
+
+    @field_validator('amount')
+    @classmethod
+    def amount_is_positive(cls, value):
+        """
+        Validate that the amount is positive
+        """
+        if value is not None and value <= 0:
+            raise ValueError("Amount must be positive")
+        return value
+
+    @field_validator('category')
+    @classmethod
+    def category_not_empty(cls, value):
+        """
+        Validate that the category is not empty
+        """
+        if value is not None and value.strip() == "":
+            raise ValueError("Category must not be empty")
+        return value
+
+
+class RecurringRuleResponse(Schema):
+    """
+    Schema for outputting a recurring rule
+    """
+    id: int
+    kind: RecurringKind
+    amount: Decimal
+    category: str
+    interval: RecurringInterval
+    every: int
+    start_date: date
+    end_date: Optional[date] = None
+    next_due: date
+    is_active: bool
+    user_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
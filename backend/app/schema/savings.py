@@ -4,11 +4,12 @@ Schema models
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import ConfigDict, field_validator
+from app.schema.base import Schema
 from decimal import Decimal
 
 
-class SavingsCreate(BaseModel):
+class SavingsCreate(Schema):
     """
     Schema for create
     """
@@ -36,7 +37,7 @@ class SavingsCreate(BaseModel):
         return value
 
 
-class SavingsUpdate(BaseModel):
+class SavingsUpdate(Schema):
     """
     Schema for update
     """
@@ -64,7 +65,7 @@ class SavingsUpdate(BaseModel):
         return value
 
 
-class SavingsResponse(BaseModel):
+class SavingsResponse(Schema):
     """
     Schema for response
     """
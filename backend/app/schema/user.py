@@ -4,7 +4,8 @@ User Schemas
 
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import ConfigDict, EmailStr, field_validator
+from app.schema.base import Schema
 from datetime import datetime
 from decimal import Decimal
 from app.utils.auth import validate_password
@@ -20,7 +21,7 @@ class UserRole(str, Enum):
     MODERATOR = "moderator"
 
 
-class UserCreate(BaseModel):
+class UserCreate(Schema):
     """
     Schema for creating a new user
     """
@@ -40,7 +41,7 @@ class UserCreate(BaseModel):
         return value
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(Schema):
     """
     Schema for updating a user
     """
@@ -54,7 +55,7 @@ class UserUpdate(BaseModel):
     profile_img_url: Optional[str] = None
 
 
-class AdminUserUpdate(BaseModel):
+class AdminUserUpdate(Schema):
     """Schema for admin updating a user"""
 
     role: Optional[UserRole] = None
@@ -63,7 +64,7 @@ class AdminUserUpdate(BaseModel):
     balance: Optional[Decimal] = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(Schema):
     """
     Schema for user response
     """
@@ -84,10 +85,18 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class UserLogin(BaseModel):
+class UserLogin(Schema):
     """
     Schema for user login
     """
 
     email: EmailStr
     password: str
+
+
+class RefreshTokenRequest(Schema):
+    """
+    Schema for refreshing or revoking a refresh token
+    """
+
+    refresh_token: str
@@ -0,0 +1,214 @@
+"""
+Production entry point: python -m app.serve [--workers N] [--host H] [--port P]
+
+The parent imports the app once, binds the listening socket and forks the
+workers, which inherit both. Objects built at import (routes, SQLAlchemy
+mappers) and the pydantic validators the app defers to first use, which the
+parent builds up front, are moved out of the garbage collector's reach with
+gc.freeze() before forking, so collections in the workers do not touch, and
+copy, the shared pages. uvloop and httptools are used when installed. On
+SIGTERM or SIGINT the workers stop accepting connections and finish their
+in-flight requests; the ones still running after SERVE_GRACEFUL_TIMEOUT are
+killed.
+"""
+
+import argparse
+import gc
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import time
+import uvicorn
+from app.core.config import settings
+from app.db.database import dispose_engines
+
+logger = logging.getLogger("app.serve")
+
+# a worker dying sooner than this after its start is restarted with a delay
+MIN_WORKER_LIFETIME = 1.0
+
+
+def default_workers() -> int:
+    """
+    One worker per CPU the process may run on (the affinity mask, which
+    container CPU sets restrict, rather than the host's count)
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def build_config(host: str, port: int) -> uvicorn.Config:
+    """
+    Uvicorn config of a worker, logging is left to the app's pipeline
+    """
+    return uvicorn.Config(
+        "app.main:app",
+        host=host,
+        port=port,
+        loop="auto",
+        http="auto",
+        log_config=None,
+        # the app.db.metrics line already records every request
+        access_log=False,
+        timeout_graceful_shutdown=settings.serve_graceful_timeout,
+    )
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """
+    Listening socket shared by the workers. It is created as IPPROTO_TCP so
+    asyncio sets TCP_NODELAY on the accepted connections, as it does for
+    sockets it binds itself; without it a response written in two parts
+    waits ~40 ms for the client's delayed ACK.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def warm_up():
+    """
+    Build what the app defers to the first request (the pydantic validators
+    and serializers of the schemas and routes), so the workers share it
+    instead of each building its own
+    """
+    from app.main import app
+    from app.schema.base import build_schemas
+
+    app.openapi()
+    build_schemas()
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket):
+    """
+    Body of a forked worker, serves until SIGTERM/SIGINT
+    """
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGALRM):
+        signal.signal(sig, signal.SIG_DFL)
+    # the parent's pooled connections must not be shared, only forgotten
+    dispose_engines(close=False)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(workers: int, host: str, port: int) -> int:
+    """
+    Preload the app, fork `workers` workers and supervise them until a
+    shutdown signal; returns the exit code
+    """
+    config = build_config(host, port)
+    sock = bind_socket(host, port, config.backlog)
+    config.load()
+    warm_up()
+    dispose_engines()
+    gc.collect()
+    gc.freeze()
+
+    logger.info(
+        "Serving on %s:%d with %d workers (loop=%s, http=%s)",
+        host,
+        port,
+        workers,
+        "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "httptools" if importlib.util.find_spec("httptools") else "h11",
+    )
+
+    children: dict[int, float] = {}
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(config, sock)
+            except BaseException:
+                logger.exception("Worker %d failed", os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = time.monotonic()
+
+    def signal_children(sig: int):
+        for pid in list(children):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def stop(signum, frame):
+        nonlocal stopping
+        if not stopping:
+            stopping = True
+            logger.info("Stopping %d workers", len(children))
+            signal.alarm(settings.serve_graceful_timeout + 5)
+            # no new connections once the workers have closed their copies
+            sock.close()
+        signal_children(signal.SIGTERM)
+
+    def kill(signum, frame):
+        logger.warning("Killing %d workers after the graceful timeout", len(children))
+        signal_children(signal.SIGKILL)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGALRM, kill)
+
+    for _ in range(workers):
+        spawn()
+
+    failed = False
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        if stopping:
+            # a worker stopped by the SIGTERM it captured re-raises it
+            failed |= code not in (0, -signal.SIGTERM)
+            continue
+        logger.warning("Worker %d exited with %d, restarting", pid, code)
+        if time.monotonic() - started < MIN_WORKER_LIFETIME:
+            time.sleep(MIN_WORKER_LIFETIME)
+        spawn()
+
+    signal.alarm(0)
+    sock.close()
+    logger.info("Stopped")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with several worker processes")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.web_concurrency or default_workers(),
+    )
+    parser.add_argument("--host", default=settings.serve_host)
+    parser.add_argument("--port", type=int, default=settings.serve_port)
+    args = parser.parse_args()
+
+    # the supervisor's own lines, workers log through the app's pipeline
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    raise SystemExit(serve(args.workers, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
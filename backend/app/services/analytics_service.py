@@ -0,0 +1,94 @@
+"""
+Analytics Service, reading from the monthly rollups
+"""
+
+import logging
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import User, MonthlyRollup
+from app.schema.analytics import MonthlySummary, CategorySummary, RollupKind
+from app.utils.rollups import month_start
+
+
+logger = logging.getLogger(__name__)
+
+
+def _in_period(query, start: date | None, end: date | None):
+    if start is not None:
+        query = query.where(MonthlyRollup.month >= month_start(start))
+    if end is not None:
+        query = query.where(MonthlyRollup.month <= month_start(end))
+    return query
+
+
+def monthly_summary_service(
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[MonthlySummary]:
+    """
+    Income, expense and net per month, oldest first
+    """
+    logger.info("Fetching monthly summary for user_id: %s", current_user.id)
+    query = _in_period(
+        select(
+            MonthlyRollup.month,
+            MonthlyRollup.kind,
+            func.sum(MonthlyRollup.total),
+            func.sum(MonthlyRollup.count),
+        )
+        .where(MonthlyRollup.user_id == current_user.id)
+        .group_by(MonthlyRollup.month, MonthlyRollup.kind)
+        .order_by(MonthlyRollup.month),
+        start,
+        end,
+    )
+
+    months: dict[date, MonthlySummary] = {}
+    for month, kind, total, count in db.execute(query):
+        summary = months.setdefault(month, MonthlySummary(month=month))
+        if kind == RollupKind.INCOME.value:
+            summary.total_income, summary.income_count = total, count
+        else:
+            summary.total_expense, summary.expense_count = total, count
+
+    summaries = [s for s in months.values() if s.income_count or s.expense_count]
+    for summary in summaries:
+        summary.net = summary.total_income - summary.total_expense
+    return summaries
+
+
+def category_summary_service(
+    current_user: User,
+    db: Session,
+    kind: RollupKind = RollupKind.EXPENSE,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[CategorySummary]:
+    """
+    Totals per expense category or income source, largest first
+    """
+    logger.info(
+        "Fetching %s category summary for user_id: %s", kind.value, current_user.id
+    )
+    total = func.sum(MonthlyRollup.total)
+    count = func.sum(MonthlyRollup.count)
+    query = _in_period(
+        select(MonthlyRollup.category, total, count)
+        .where(
+            MonthlyRollup.user_id == current_user.id,
+            MonthlyRollup.kind == kind.value,
+        )
+        .group_by(MonthlyRollup.category)
+        .having(count > 0)
+        .order_by(total.desc()),
+        start,
+        end,
+    )
+    return [
+        CategorySummary(category=category, total=total, count=count)
+        for category, total, count in db.execute(query)
+    ]
@@ -0,0 +1,212 @@
+"""
+Async Expense Service
+"""
+
+import logging
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import User, Expense
+from app.schema.expense import ExpenseCreate, ExpenseUpdate
+from app.utils.expense import is_authorized
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
+from app.utils.rollups import apply_entry_rollup, rollup_key
+from app.utils.budgets import apply_entry_budgets, budget_entry
+from app.services.expense_service import (
+    InsufficientBalanceError,
+    ExpenseNotFoundError,
+    UserNotFoundError,
+    budget_alerts,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _lock_user(db: AsyncSession, user_id: int) -> User:
+    """
+    Select the user row for update
+    """
+    result = await db.execute(
+        select(User).where(User.id == user_id).with_for_update()
+    )
+    user = result.scalars().first()
+    if not user:
+        raise UserNotFoundError("User not found")
+    return user
+
+
+async def create_expense_service(
+    expense: ExpenseCreate,
+    current_user_id: int,
+    db: AsyncSession,
+    check_budget: bool = False,
+) -> Expense:
+    """
+    Creating a expense service and deduct from user balance
+    Args:
+        expense: Expense data to create
+        current_user_id: ID of the user creating the expense
+        check_budget: set `over_budget` on the returned expense to the
+            budgets it took over their limit
+    """
+    try:
+        user = await _lock_user(db, current_user_id)
+
+        if user.balance < expense.amount:
+            raise InsufficientBalanceError("Insufficent Amount")
+
+        new_expense = Expense(**expense.model_dump(), user_id=current_user_id)
+        user.balance -= new_expense.amount
+        db.add(new_expense)
+        await db.run_sync(
+            apply_totals_delta,
+            current_user_id,
+            expense=new_expense.amount,
+            expense_count=1,
+        )
+        await db.run_sync(apply_entry_rollup, new_expense)
+        # built before the commit expires the budgets
+        alerts = budget_alerts(await db.run_sync(apply_entry_budgets, new_expense))
+        await db.commit()
+        await db.refresh(new_expense)
+        if check_budget:
+            new_expense.over_budget = alerts
+        return new_expense
+    except Exception as e:
+        await db.rollback()
+        logger.error(
+            "Failed to create expense for user_id %s: %s", current_user_id, str(e)
+        )
+        raise e
+
+
+async def read_all_expense_service(
+    current_user: User,
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+):
+    """
+    Read expense service, newest first
+    """
+    try:
+        logger.info("Fetching expense for user_id: %s", current_user.id)
+        query = select(Expense).where(Expense.user_id == current_user.id)
+        result = await db.execute(
+            paginate(query, Expense.date, Expense.id, skip, limit, cursor)
+        )
+        return result.scalars().all()
+    except Exception as e:
+        logger.error("Failed to read all expense of user_id: %s", current_user.id)
+        raise e
+
+
+async def read_expense_service(expense_id: int, db: AsyncSession):
+    """
+    Read a particular expense by id
+    """
+    expense = await db.get(Expense, expense_id)
+    if not expense:
+        raise ExpenseNotFoundError("Expense not Found")
+
+    return expense
+
+
+async def update_expense_service(
+    expense_id: int,
+    expense_update: ExpenseUpdate,
+    current_user: User,
+    db: AsyncSession,
+) -> Expense:
+    """
+    Update an existing expense
+    """
+    try:
+        result = await db.execute(
+            select(Expense).where(Expense.id == expense_id).with_for_update()
+        )
+        expense = result.scalars().first()
+        if not expense:
+            raise ExpenseNotFoundError(f"Expense {expense_id} not found")
+
+        if not is_authorized(expense, current_user):
+            raise ValueError("Unauthorized to update this expense")
+
+        user = await _lock_user(db, current_user.id)
+
+        old_amount = expense.amount
+        previous = (rollup_key(expense), old_amount)
+        previous_budget = budget_entry(expense)
+        new_amount = (
+            expense_update.amount if expense_update.amount is not None else old_amount
+        )
+        difference = new_amount - old_amount
+
+        if difference > 0:
+            if user.balance < difference:
+                raise InsufficientBalanceError(
+                    f"Insufficient balance. For {expense.amount} this balance: {user.balance}"
+                )
+
+        if expense_update.amount is not None:
+            expense.amount = new_amount
+        if expense_update.category is not None:
+            expense.category = expense_update.category
+        if expense_update.date is not None:
+            expense.date = expense_update.date
+
+        user.balance -= difference
+        await db.run_sync(apply_totals_delta, user.id, expense=difference)
+        await db.run_sync(apply_entry_rollup, expense, previous)
+        await db.run_sync(apply_entry_budgets, expense, previous_budget)
+
+        await db.commit()
+        await db.refresh(expense)
+        return expense
+    except Exception as e:
+        await db.rollback()
+        logger.error("Failed to update expense %s due to: %s", expense_id, str(e))
+        raise e
+
+
+async def delete_expense_service(
+    expense_id: int, current_user: User, db: AsyncSession
+):
+    """
+    Delete an expense and refund the user balance
+    """
+    try:
+        user = await _lock_user(db, current_user.id)
+
+        result = await db.execute(
+            select(Expense).where(Expense.id == expense_id).with_for_update()
+        )
+        expense = result.scalars().first()
+        if not expense:
+            raise ExpenseNotFoundError(f"Expense {expense_id} not found")
+
+        if not is_authorized(expense, current_user):
+            logger.warning(
+                "Unauthorized delete attempt to expense id: %s by user_id: %s",
+                expense_id,
+                current_user.id,
+            )
+            raise ValueError("Unauthorized to delete this expense")
+
+        await db.delete(expense)
+
+        # refund balance
+        user.balance += expense.amount
+        await db.run_sync(
+            apply_totals_delta, user.id, expense=-expense.amount, expense_count=-1
+        )
+        await db.run_sync(apply_entry_rollup, expense, removed=True)
+        await db.run_sync(apply_entry_budgets, expense, removed=True)
+        await db.commit()
+        return expense
+    except Exception as e:
+        await db.rollback()
+        logger.error("Failed to delete expense %s due to: %s", expense_id, str(e))
+        raise e
@@ -0,0 +1,207 @@
+"""
+Async Income Service
+"""
+
+import logging
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Income, User
+from app.schema.income import IncomeCreate, IncomeUpdate
+from app.utils.income import authorized
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
+from app.utils.rollups import apply_entry_rollup, rollup_key
+from app.services.income_service import IncomeNotFoundError, UserNotFoundError
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _lock_user(db: AsyncSession, user_id: int) -> User:
+    """
+    Select the user row for update
+    """
+    result = await db.execute(
+        select(User).where(User.id == user_id).with_for_update()
+    )
+    user = result.scalars().first()
+    if not user:
+        raise UserNotFoundError(f"User {user_id} not found")
+    return user
+
+
+async def _lock_income(db: AsyncSession, income_id: int) -> Income | None:
+    """
+    Select the income row for update
+    """
+    result = await db.execute(
+        select(Income).where(Income.id == income_id).with_for_update()
+    )
+    return result.scalars().first()
+
+
+async def create_income_service(
+    income: IncomeCreate, current_user: User, db: AsyncSession
+) -> Income:
+    """
+    Creating income and adding balance
+    Args:
+        income: Income data to create
+        current_user: user data to create income
+    Return:
+        Income Data
+    """
+    try:
+        user = await _lock_user(db, current_user.id)
+
+        new_income = Income(**income.model_dump(), user_id=current_user.id)
+        db.add(new_income)
+        user.balance += new_income.amount
+        await db.run_sync(
+            apply_totals_delta,
+            current_user.id,
+            income=new_income.amount,
+            income_count=1,
+        )
+        await db.run_sync(apply_entry_rollup, new_income)
+        await db.commit()
+        await db.refresh(new_income)
+        return new_income
+
+    except Exception as e:
+        await db.rollback()
+        logger.warning(
+            "Failed to create income for user %s due to: %s", current_user.id, str(e)
+        )
+        raise e
+
+
+async def fetch_all_income_service(
+    current_user: User,
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+):
+    """
+    Retrieveing all incomes, newest first
+    Args:
+        skip: start count of rows
+        limit: end count of rows
+        cursor: token from a previous page, takes precedence over skip
+        current_user: authorized user data
+        db: async session of db
+    return:
+        incomes
+    """
+    try:
+        logger.info("Retrieveing all incomes for user_id: %s", current_user.id)
+        query = select(Income).where(Income.user_id == current_user.id)
+        result = await db.execute(
+            paginate(query, Income.date, Income.id, skip, limit, cursor)
+        )
+        return result.scalars().all()
+    except Exception as e:
+        logger.warning(
+            "Failed to read incomes of user: %s due to: %s", current_user.id, str(e)
+        )
+        raise e
+
+
+async def fetch_income_service(
+    income_id: int, current_user: User, db: AsyncSession
+) -> Income:
+    """
+    Retrieveing income by id
+    """
+    logger.info(
+        "Retrieveing incomes id: %s for user_id: %s", income_id, current_user.id
+    )
+    income = await db.get(Income, income_id)
+    if not income:
+        logger.warning(
+            "Income id %s for user_id %s not found", income_id, current_user.id
+        )
+        raise IncomeNotFoundError("Income not found")
+
+    if not authorized(income, current_user):
+        raise ValueError("Unauthorized to access this income")
+    return income
+
+
+async def update_income_service(
+    income_id: int, income_update: IncomeUpdate, current_user: User, db: AsyncSession
+):
+    """
+    Updateding income by ID
+    """
+    logger.info("Updating income id: %s for user_id: %s", income_id, current_user.id)
+    try:
+        income = await _lock_income(db, income_id)
+
+        if income is None:
+            logger.warning(
+                "Income: %s for user %s not found", income_id, current_user.id
+            )
+            raise IncomeNotFoundError(f"Income {income_id} not found")
+
+        if not authorized(income, current_user):
+            raise ValueError("Unauthorized to edit this income")
+
+        user = await _lock_user(db, current_user.id)
+        old_amount = income.amount
+        previous = (rollup_key(income), old_amount)
+        new_amount = (
+            income_update.amount if income_update.amount is not None else old_amount
+        )
+        difference = old_amount - new_amount
+        user.balance -= difference
+
+        if income_update.amount is not None:
+            income.amount = new_amount
+        if income_update.source is not None:
+            income.source = income_update.source
+        if income_update.date is not None:
+            income.date = income_update.date
+        await db.run_sync(apply_totals_delta, user.id, income=-difference)
+        await db.run_sync(apply_entry_rollup, income, previous)
+
+        await db.commit()
+        await db.refresh(income)
+        return income
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def delete_income_service(
+    income_id: int, current_user: User, db: AsyncSession
+):
+    """
+    Deleteing an income with ID
+    """
+    try:
+        income = await _lock_income(db, income_id)
+
+        if not income:
+            logger.warning(
+                "Income %s not found for user_id %s", income_id, current_user.id
+            )
+            raise IncomeNotFoundError("Income not found")
+
+        if not authorized(income, current_user):
+            raise ValueError("Unauthorized to delete income")
+
+        user = await _lock_user(db, current_user.id)
+
+        await db.delete(income)
+        user.balance -= income.amount
+        await db.run_sync(
+            apply_totals_delta, user.id, income=-income.amount, income_count=-1
+        )
+        await db.run_sync(apply_entry_rollup, income, removed=True)
+        await db.commit()
+        return income
+    except Exception as e:
+        await db.rollback()
+        raise e
@@ -0,0 +1,183 @@
+"""
+Async Savings Service
+"""
+
+import logging
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Savings, User
+from app.schema.savings import SavingsCreate, SavingsUpdate
+from app.services.savings_service import is_authorized
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
+
+logger = logging.getLogger(__name__)
+
+
+async def _lock_user(db: AsyncSession, user_id: int) -> User | None:
+    """
+    Select the user row for update
+    """
+    result = await db.execute(
+        select(User).where(User.id == user_id).with_for_update()
+    )
+    return result.scalars().first()
+
+
+async def get_saving_service(savings_id: int, current_user: User, db: AsyncSession):
+    """
+    Retrieving savings for a user
+    """
+    logger.info("Fetching savings id: %s for user_id: %s", savings_id, current_user.id)
+    savings = await db.get(Savings, savings_id)
+
+    if not savings:
+        logger.warning(
+            "Savings id: %s not found for user_id: %s", savings_id, current_user.id
+        )
+        return None
+
+    if not is_authorized(savings, current_user):
+        logger.warning(
+            "Unauthorized access attempt to savings id: %s by user_id: %s",
+            savings_id,
+            current_user.id,
+        )
+        raise ValueError("Unauthorized access")
+
+    return savings
+
+
+async def get_all_savings_service(
+    current_user: User,
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+):
+    """
+    Retrieving all savings for a user, newest first
+    """
+    logger.info("Fetching all savings for user_id: %s", current_user.id)
+
+    try:
+        query = select(Savings).where(Savings.user_id == current_user.id)
+        result = await db.execute(
+            paginate(query, Savings.created_at, Savings.id, skip, limit, cursor)
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to retrieve savings for user_id: %s due to: %s", current_user.id, e
+        )
+        raise e
+
+    return result.scalars().all()
+
+
+async def create_saving_service(
+    saving: SavingsCreate, current_user: User, db: AsyncSession
+):
+    """
+    Creating new savings for a user
+    """
+    logger.info(
+        "Creating savings for user_id: %s, amount: %s, goal: %s",
+        current_user.id,
+        saving.amount,
+        saving.goal,
+    )
+
+    new_savings = Savings(**saving.model_dump(), user_id=current_user.id)
+
+    await _lock_user(db, current_user.id)
+    db.add(new_savings)
+    await db.run_sync(
+        apply_totals_delta,
+        current_user.id,
+        savings=new_savings.amount,
+        savings_count=1,
+    )
+    await db.commit()
+    await db.refresh(new_savings)
+
+    logger.info(
+        "Savings created with id: %s for user_id: %s", new_savings.id, current_user.id
+    )
+    return new_savings
+
+
+async def update_saving_service(
+    savings_id: int, saving_update: SavingsUpdate, current_user: User, db: AsyncSession
+):
+    """
+    Updating savings for a user
+    """
+    logger.info("Updating savings id: %s for user_id: %s", savings_id, current_user.id)
+    existing_savings = await db.get(Savings, savings_id)
+
+    if not existing_savings:
+        logger.warning(
+            "Savings id: %s not found for user_id: %s", savings_id, current_user.id
+        )
+        return None
+
+    if not is_authorized(existing_savings, current_user):
+        logger.warning(
+            "Unauthorized update attempt to savings id: %s by user_id: %s",
+            savings_id,
+            current_user.id,
+        )
+        raise ValueError("Unauthorized access")
+
+    old_amount = existing_savings.amount
+    update_data = saving_update.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(existing_savings, key, value)
+    if update_data.get("amount") is not None:
+        await _lock_user(db, current_user.id)
+        await db.run_sync(
+            apply_totals_delta, current_user.id, savings=update_data["amount"] - old_amount
+        )
+
+    await db.commit()
+    await db.refresh(existing_savings)
+
+    logger.info("Savings id: %s updated for user_id: %s", savings_id, current_user.id)
+    return existing_savings
+
+
+async def delete_saving_service(
+    savings_id: int, current_user: User, db: AsyncSession
+):
+    """
+    Deleting savings of a user
+    """
+    logger.info("Deleting savings id: %s for user_id: %s", savings_id, current_user.id)
+    existing_savings = await db.get(Savings, savings_id)
+
+    if not existing_savings:
+        logger.warning(
+            "Savings id: %s not found for user_id: %s", savings_id, current_user.id
+        )
+        return None
+
+    if not is_authorized(existing_savings, current_user):
+        logger.warning(
+            "Unauthorized delete attempt to savings id: %s by user_id: %s",
+            savings_id,
+            current_user.id,
+        )
+        raise ValueError("Unauthorized access")
+
+    await _lock_user(db, current_user.id)
+    await db.delete(existing_savings)
+    await db.run_sync(
+        apply_totals_delta,
+        current_user.id,
+        savings=-existing_savings.amount,
+        savings_count=-1,
+    )
+    await db.commit()
+
+    logger.info("Savings id: %s deleted for user_id: %s", savings_id, current_user.id)
+    return existing_savings
@@ -0,0 +1,98 @@
+"""
+Async User Service
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.schema.user import UserCreate, UserUpdate
+from app.utils.hashing import password_hasher
+from app.utils.pagination import paginate
+
+
+async def get_user_service(db: AsyncSession, user_id: int):
+    """Fetch a user by id"""
+    return await db.get(User, user_id)
+
+
+async def get_all_users_service(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: str | None = None
+):
+    """Fetch all users with pagination, newest first"""
+    result = await db.execute(
+        paginate(select(User), User.created_at, User.id, skip, limit, cursor)
+    )
+    return result.scalars().all()
+
+
+async def get_user_by_email_service(db: AsyncSession, email: str):
+    """Fetch a user by email"""
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+
+async def create_user_service(db: AsyncSession, user: UserCreate):
+    """Create a new user"""
+
+    if await get_user_by_email_service(db, user.email):
+        raise ValueError("Email already registered")
+
+    # argon2 is CPU bound, keep it off the event loop
+    hashed_password = (
+        await password_hasher.hash_async(user.password) if user.password else None
+    )
+
+    user_data = user.model_dump(exclude={"password"})
+    user_data["password"] = hashed_password
+
+    new_user = User(**user_data)
+
+    try:
+        db.add(new_user)
+        await db.commit()
+        await db.refresh(new_user)
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    return new_user
+
+
+async def update_user_service(db: AsyncSession, user: UserUpdate, user_id: int):
+    """Update user"""
+
+    update_user = await db.get(User, user_id)
+
+    if not update_user:
+        return None
+
+    update_data = user.model_dump(exclude_unset=True)
+
+    if "password" in update_data and update_data["password"]:
+        update_data["password"] = await password_hasher.hash_async(
+            update_data["password"]
+        )
+
+    for key, value in update_data.items():
+        setattr(update_user, key, value)
+
+    try:
+        await db.commit()
+        await db.refresh(update_user)
+    except Exception:
+        await db.rollback()
+        raise
+
+    return update_user
+
+
+async def delete_user_service(db: AsyncSession, user_id: int):
+    """Delete user"""
+    delete_user = await db.get(User, user_id)
+    if not delete_user:
+        return None
+
+    await db.delete(delete_user)
+    await db.commit()
+
+    return delete_user
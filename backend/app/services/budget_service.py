@@ -0,0 +1,180 @@
+"""
+Budget Service
+"""
+
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import and_, case, delete, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import Budget, BudgetSpend, User
+from app.schema.budget import BudgetCreate, BudgetStatus, BudgetUpdate
+from app.utils.budgets import PERIODS, period_end, period_start, rebuild_budget_spend
+
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetNotFoundError(Exception):
+    pass
+
+
+class BudgetExistsError(Exception):
+    pass
+
+
+def _own_budget(budget_id: int, current_user: User, db: Session) -> Budget:
+    """
+    The user's budget, with its row locked
+    """
+    budget = (
+        db.query(Budget)
+        .filter(Budget.id == budget_id, Budget.user_id == current_user.id)
+        .with_for_update()
+        .first()
+    )
+    if not budget:
+        raise BudgetNotFoundError(f"Budget {budget_id} not found")
+    return budget
+
+
+def create_budget_service(budget: BudgetCreate, current_user: User, db: Session) -> Budget:
+    """
+    Create a budget and compute its spend from the current period on.
+
+    The user's row lock keeps expenses from being written between the spend
+    being computed and the budget becoming visible to the expense services.
+    """
+    try:
+        db.query(User).filter(User.id == current_user.id).with_for_update().first()
+
+        exists = db.scalar(
+            select(Budget.id).where(
+                Budget.user_id == current_user.id,
+                Budget.category == budget.category,
+                Budget.period == budget.period.value,
+            )
+        )
+        if exists:
+            raise BudgetExistsError(
+                f"A {budget.period.value} budget for {budget.category} already exists"
+            )
+
+        new_budget = Budget(
+            user_id=current_user.id,
+            category=budget.category,
+            period=budget.period.value,
+            limit=budget.limit,
+        )
+        db.add(new_budget)
+        db.flush()
+        rebuild_budget_spend(db, new_budget, datetime.utcnow().date())
+        db.commit()
+        db.refresh(new_budget)
+        return new_budget
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to create budget for user_id %s: %s", current_user.id, e)
+        raise e
+
+
+def read_budgets_service(current_user: User, db: Session) -> list[Budget]:
+    """
+    The user's budgets, by category and period
+    """
+    logger.info("Fetching budgets for user_id: %s", current_user.id)
+    return list(
+        db.scalars(
+            select(Budget)
+            .where(Budget.user_id == current_user.id)
+            .order_by(Budget.category, Budget.period)
+        )
+    )
+
+
+def update_budget_service(
+    budget_id: int, budget_update: BudgetUpdate, current_user: User, db: Session
+) -> Budget:
+    """
+    Change the limit of a budget, its spend is unaffected
+    """
+    try:
+        budget = _own_budget(budget_id, current_user, db)
+        budget.limit = budget_update.limit
+        db.commit()
+        db.refresh(budget)
+        return budget
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to update budget %s due to: %s", budget_id, e)
+        raise e
+
+
+def delete_budget_service(budget_id: int, current_user: User, db: Session) -> Budget:
+    """
+    Delete a budget and its spend rows
+    """
+    try:
+        budget = _own_budget(budget_id, current_user, db)
+        db.execute(delete(BudgetSpend).where(BudgetSpend.budget_id == budget.id))
+        db.delete(budget)
+        db.commit()
+        return budget
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to delete budget %s due to: %s", budget_id, e)
+        raise e
+
+
+def budget_status_service(
+    current_user: User, db: Session, today: date | None = None
+) -> list[BudgetStatus]:
+    """
+    Spend of each of the user's budgets in the period containing `today`
+    (default: the current UTC day) against its limit.
+
+    One query: each budget joined to the spend row of its current period,
+    whose start is picked per period with a CASE.
+    """
+    today = today or datetime.utcnow().date()
+    starts = {period: period_start(today, period) for period in PERIODS}
+    current_start = case(
+        *((Budget.period == period, start) for period, start in starts.items())
+    )
+    rows = db.execute(
+        select(
+            Budget,
+            func.coalesce(BudgetSpend.spent, 0),
+            func.coalesce(BudgetSpend.count, 0),
+        )
+        .outerjoin(
+            BudgetSpend,
+            and_(
+                BudgetSpend.budget_id == Budget.id,
+                BudgetSpend.period_start == current_start,
+            ),
+        )
+        .where(Budget.user_id == current_user.id)
+        .order_by(Budget.category, Budget.period)
+    ).all()
+
+    statuses = []
+    for budget, spent, count in rows:
+        spent = Decimal(spent)
+        start = starts[budget.period]
+        statuses.append(
+            BudgetStatus(
+                id=budget.id,
+                category=budget.category,
+                period=budget.period,
+                limit=budget.limit,
+                period_start=start,
+                period_end=period_end(start, budget.period),
+                spent=spent,
+                count=count,
+                remaining=budget.limit - spent,
+                over_budget=spent > budget.limit,
+            )
+        )
+    return statuses
@@ -0,0 +1,278 @@
+"""
+Dashboard Service, the whole page in two queries
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+from sqlalchemy import (
+    Integer,
+    NUMERIC,
+    String,
+    TIMESTAMP,
+    cast,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import User, Expense, Income, Savings, MonthlyRollup, UserTotals
+from app.schema.analytics import CategorySummary
+from app.schema.dashboard import (
+    BalanceSummary,
+    Dashboard,
+    MonthToDate,
+    RecentTransaction,
+    SavingsGoal,
+)
+from app.utils.balance import sum_user_totals
+from app.utils.rollups import EXPENSE, INCOME, month_start
+
+
+logger = logging.getLogger(__name__)
+
+# upper bound of the recent transactions and top categories a request asks for
+DASHBOARD_MAX_ITEMS = 50
+
+CATEGORY = "category"
+SAVINGS = "savings"
+
+# columns of the lists query; each member of the UNION ALL fills the ones it
+# has and leaves the others as typed NULLs
+LIST_COLUMNS = {
+    "id": Integer(),
+    "date": TIMESTAMP(),
+    "target_date": TIMESTAMP(timezone=True),
+    "label": String(),
+    "amount": NUMERIC(precision=14, scale=2),
+    "current_amount": NUMERIC(precision=10, scale=2),
+    "goal": NUMERIC(precision=10, scale=2),
+    "count": Integer(),
+}
+
+
+def _summary_query(user_id: int, month):
+    """
+    One row: the user's totals and this month's income and expense, summed
+    with FILTER from the month's rollup rows
+    """
+    month_rows = (
+        select(
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.kind == INCOME), 0
+            ).label("month_income"),
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.kind == EXPENSE), 0
+            ).label("month_expense"),
+        )
+        .where(MonthlyRollup.user_id == user_id, MonthlyRollup.month == month)
+        .subquery()
+    )
+    return (
+        select(
+            month_rows.c.month_income,
+            month_rows.c.month_expense,
+            UserTotals.total_income,
+            UserTotals.total_expense,
+            UserTotals.total_savings,
+            UserTotals.income_count,
+            UserTotals.expense_count,
+            UserTotals.savings_count,
+        )
+        .select_from(month_rows)
+        .outerjoin(UserTotals, UserTotals.user_id == user_id)
+    )
+
+
+def _month_from_entries(db: Session, user_id: int, month, categories: int):
+    """
+    This month's income, expense and largest expense categories summed from
+    the entries, for users whose totals and rollups are not backfilled yet
+    """
+    since = datetime.combine(month, time.min)
+    until = datetime.combine((month + timedelta(days=32)).replace(day=1), time.min)
+
+    def month_total(model):
+        return (
+            select(func.coalesce(func.sum(model.amount), 0))
+            .where(model.user_id == user_id, model.date >= since, model.date < until)
+            .scalar_subquery()
+        )
+
+    income, expense = db.execute(select(month_total(Income), month_total(Expense))).one()
+    top_categories = [
+        CategorySummary(category=category, total=total, count=count)
+        for category, total, count in db.execute(
+            select(Expense.category, func.sum(Expense.amount), func.count(Expense.id))
+            .where(Expense.user_id == user_id, Expense.date >= since, Expense.date < until)
+            .group_by(Expense.category)
+            .order_by(func.sum(Expense.amount).desc())
+            .limit(categories)
+        )
+    ]
+    return income, expense, top_categories
+
+
+def _list_member(kind: str, query_filter, order_by=(), limit: int | None = None, **columns):
+    """
+    One member of the lists UNION ALL, wrapped in a subquery when it is
+    ordered and limited on its own
+    """
+    query = select(
+        literal(kind).label("kind"),
+        *(
+            (columns[name] if name in columns else cast(null(), type_)).label(name)
+            for name, type_ in LIST_COLUMNS.items()
+        ),
+    ).where(*query_filter)
+    if limit is None:
+        return query
+    return select(query.order_by(*order_by).limit(limit).subquery())
+
+
+def _lists_query(user_id: int, month, recent: int, categories: int | None):
+    """
+    The last `recent` expenses and incomes, the month's `categories` largest
+    expense categories (from the rollups, left out when None) and the open
+    savings goals, in one UNION ALL
+    """
+    members = [
+        _list_member(
+            EXPENSE,
+            [Expense.user_id == user_id],
+            [Expense.date.desc(), Expense.id.desc()],
+            recent,
+            id=Expense.id,
+            date=Expense.date,
+            label=Expense.category,
+            amount=Expense.amount,
+        ),
+        _list_member(
+            INCOME,
+            [Income.user_id == user_id],
+            [Income.date.desc(), Income.id.desc()],
+            recent,
+            id=Income.id,
+            date=Income.date,
+            label=Income.source,
+            amount=Income.amount,
+        ),
+        _list_member(
+            SAVINGS,
+            [Savings.user_id == user_id, Savings.is_completed.isnot(True)],
+            id=Savings.id,
+            target_date=Savings.target_date,
+            label=Savings.description,
+            amount=Savings.amount,
+            current_amount=Savings.current_amount,
+            goal=Savings.goal,
+        ),
+    ]
+    if categories is not None:
+        members.append(
+            _list_member(
+                CATEGORY,
+                [
+                    MonthlyRollup.user_id == user_id,
+                    MonthlyRollup.month == month,
+                    MonthlyRollup.kind == EXPENSE,
+                    MonthlyRollup.count > 0,
+                ],
+                [MonthlyRollup.total.desc()],
+                categories,
+                label=MonthlyRollup.category,
+                amount=MonthlyRollup.total,
+                count=MonthlyRollup.count,
+            )
+        )
+    return union_all(*members)
+
+
+def dashboard_service(
+    current_user: User,
+    db: Session,
+    recent: int = 10,
+    categories: int = 5,
+) -> Dashboard:
+    """
+    Totals, month to date figures, recent transactions, top expense
+    categories of the month and open savings goals of a user.
+
+    The totals come from user_totals and the month's figures from
+    monthly_rollups. A user without a totals row predates the backfills,
+    so both are summed from the entries instead, as get_user_balance does.
+    """
+    logger.info("Fetching dashboard for user_id: %s", current_user.id)
+    recent = max(1, min(recent, DASHBOARD_MAX_ITEMS))
+    categories = max(1, min(categories, DASHBOARD_MAX_ITEMS))
+    month = month_start(datetime.utcnow())
+
+    summary = db.execute(_summary_query(current_user.id, month)).one()
+    month_income, month_expense = summary.month_income, summary.month_expense
+    top_categories = []
+    if summary.total_income is not None:
+        totals = summary[2:]
+    else:
+        totals = sum_user_totals(current_user, db)
+        month_income, month_expense, top_categories = _month_from_entries(
+            db, current_user.id, month, categories
+        )
+    total_income, total_expense, total_savings, income_count, expense_count, savings_count = totals
+    balance = BalanceSummary(
+        total_income=total_income,
+        total_expense=total_expense,
+        total_savings=total_savings,
+        balance=total_income - total_expense - total_savings,
+        net_balance=total_income - total_expense,
+        income_count=income_count,
+        expense_count=expense_count,
+        savings_count=savings_count,
+    )
+
+    transactions, goals = [], []
+    rollup_categories = categories if summary.total_income is not None else None
+    for row in db.execute(_lists_query(current_user.id, month, recent, rollup_categories)):
+        if row.kind == CATEGORY:
+            top_categories.append(
+                CategorySummary(category=row.label, total=row.amount, count=row.count)
+            )
+        elif row.kind == SAVINGS:
+            goals.append(
+                SavingsGoal(
+                    id=row.id,
+                    amount=row.amount,
+                    current_amount=row.current_amount,
+                    goal=row.goal,
+                    target_date=row.target_date,
+                    description=row.label,
+                )
+            )
+        else:
+            transactions.append(
+                RecentTransaction(
+                    id=row.id,
+                    type=row.kind,
+                    category=row.label,
+                    amount=row.amount,
+                    date=row.date,
+                )
+            )
+
+    # the members come back in no particular order
+    transactions.sort(key=lambda t: (t.date or datetime.min, t.id), reverse=True)
+    top_categories.sort(key=lambda c: c.total, reverse=True)
+    goals.sort(key=lambda g: (g.target_date is None, g.target_date or datetime.min, g.id))
+
+    return Dashboard(
+        balance=balance,
+        month_to_date=MonthToDate(
+            month=month,
+            income=month_income,
+            expense=month_expense,
+            net=month_income - month_expense,
+        ),
+        recent_transactions=transactions[:recent],
+        top_categories=top_categories,
+        savings_goals=goals,
+    )
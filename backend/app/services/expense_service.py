@@ -1,8 +1,30 @@
 import logging
+from typing import Any
+from sqlalchemy import insert
 from app.models import User, Expense
+from app.schema.base import BulkCreateResult, BulkRowError
+from app.schema.budget import BudgetAlert
 from app.schema.expense import ExpenseCreate, ExpenseUpdate
 from sqlalchemy.orm import Session
 from app.utils.expense import is_authorized
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
+from app.utils.rollups import (
+    EXPENSE,
+    RollupKey,
+    apply_bulk_rollup,
+    apply_entry_rollup,
+    month_start,
+    rollup_key,
+)
+from app.utils.budgets import (
+    BudgetEntry,
+    OverBudget,
+    apply_bulk_budgets,
+    apply_entry_budgets,
+    budget_entry,
+)
+from app.utils.bulk import validate_rows
 
 
 logger = logging.getLogger(__name__)
@@ -20,14 +42,36 @@ class UserNotFoundError(Exception):
     pass
 
 
+def budget_alerts(over: list[OverBudget]) -> list[BudgetAlert]:
+    """
+    BudgetAlert of each budget an expense took over its limit
+    """
+    return [
+        BudgetAlert(
+            id=item.budget.id,
+            category=item.budget.category,
+            period=item.budget.period,
+            limit=item.budget.limit,
+            period_start=item.period_start,
+            spent=item.spent,
+        )
+        for item in over
+    ]
+
+
 def create_expense_service(
-    expense: ExpenseCreate, current_user_id: int, db: Session
+    expense: ExpenseCreate,
+    current_user_id: int,
+    db: Session,
+    check_budget: bool = False,
 ) -> Expense:
     """
     Creating a expense service and deduct from user balance
     Args:
         expense: Expense data to create
         current_user_id: ID of the user creating the expense
+        check_budget: set `over_budget` on the returned expense to the
+            budgets it took over their limit
     """
     try:
         user = (
@@ -43,8 +87,16 @@ def create_expense_service(
         expense = Expense(**expense.model_dump(), user_id=current_user_id)
         user.balance -= expense.amount
         db.add(expense)
+        apply_totals_delta(
+            db, current_user_id, expense=expense.amount, expense_count=1
+        )
+        apply_entry_rollup(db, expense)
+        # built before the commit expires the budgets
+        alerts = budget_alerts(apply_entry_budgets(db, expense))
         db.commit()
         db.refresh(expense)
+        if check_budget:
+            expense.over_budget = alerts
         return expense
     except Exception as e:
         db.rollback()
@@ -52,21 +104,115 @@ def create_expense_service(
         raise e
 
 
+def bulk_create_expense_service(
+    rows: list[dict[str, Any]], current_user_id: int, db: Session
+) -> BulkCreateResult:
+    """
+    Create many expenses with a single balance lock and one multi-row insert.
+    Rows are applied in order; invalid rows and rows the remaining balance
+    cannot cover are reported back instead of failing the batch.
+    Args:
+        rows: raw expense rows, validated against ExpenseCreate
+        current_user_id: ID of the user creating the expenses
+    """
+    valid, errors = validate_rows(rows, ExpenseCreate)
+    try:
+        user = (
+            db.query(User).filter(User.id == current_user_id).with_for_update().first()
+        )
+        if not user:
+            raise UserNotFoundError("User not found")
+
+        remaining = user.balance
+        accepted = []
+        for index, expense in valid:
+            if expense.amount > remaining:
+                errors.append(BulkRowError(index=index, error="Insufficient balance"))
+                continue
+            remaining -= expense.amount
+            accepted.append(expense)
+
+        ids = []
+        if accepted:
+            ids = list(
+                db.execute(
+                    insert(Expense).returning(Expense.id, sort_by_parameter_order=True),
+                    [
+                        {**expense.model_dump(), "user_id": current_user_id}
+                        for expense in accepted
+                    ],
+                ).scalars()
+            )
+            total = user.balance - remaining
+            user.balance = remaining
+            apply_totals_delta(
+                db, current_user_id, expense=total, expense_count=len(accepted)
+            )
+            apply_bulk_rollup(
+                db,
+                (
+                    (
+                        RollupKey(
+                            current_user_id,
+                            month_start(expense.date),
+                            EXPENSE,
+                            expense.category,
+                        ),
+                        expense.amount,
+                    )
+                    for expense in accepted
+                ),
+            )
+            apply_bulk_budgets(
+                db,
+                current_user_id,
+                [
+                    BudgetEntry(
+                        current_user_id, expense.category, expense.date, expense.amount
+                    )
+                    for expense in accepted
+                ],
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(
+            "Failed to bulk create expenses for user_id %s: %s", current_user_id, str(e)
+        )
+        raise e
+
+    logger.info(
+        "Bulk created %d expenses for user_id %s, %d rows rejected",
+        len(ids),
+        current_user_id,
+        len(errors),
+    )
+    errors.sort(key=lambda error: error.index)
+    return BulkCreateResult(created=len(ids), ids=ids, errors=errors)
+
+
 def read_all_expense_service(
-    current_user: User, db: Session, skip: int = 0, limit: int = 100
+    current_user: User,
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    columns: tuple | None = None,
 ):
     """
-    Read expense service
+    Read expense service, newest first
+    Args:
+        cursor: token from a previous page, takes precedence over skip
+        columns: select these columns as rows instead of Expense objects
     """
     try:
         logger.info("Fetching expense for user_id: %s", current_user.id)
-        expenses = (
-            db.query(Expense)
-            .filter(Expense.user_id == current_user.id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = db.query(*(columns or (Expense,))).filter(
+            Expense.user_id == current_user.id
         )
+        expenses = paginate(
+            query, Expense.date, Expense.id, skip, limit, cursor
+        ).all()
         return expenses
     except Exception as e:
         logger.error("Failed to read all expense of user_id: %s", current_user.id)
@@ -110,6 +256,8 @@ def update_expense_service(
             raise UserNotFoundError("User not found")
 
         old_amount = expense.amount
+        previous = (rollup_key(expense), old_amount)
+        previous_budget = budget_entry(expense)
         new_amount = (
             expense_update.amount if expense_update.amount is not None else old_amount
         )
@@ -129,13 +277,16 @@ def update_expense_service(
             expense.date = expense_update.date
 
         user.balance -= difference
+        apply_totals_delta(db, user.id, expense=difference)
+        apply_entry_rollup(db, expense, previous)
+        apply_entry_budgets(db, expense, previous_budget)
 
         db.commit()
         db.refresh(expense)
         return expense
     except Exception as e:
         db.rollback()
-        logger.error(f"Failed to update expense {expense_id} due to: {str(e)}")
+        logger.error("Failed to update expense %s due to: %s", expense_id, e)
         raise e
 
 
@@ -166,9 +317,14 @@ def delete_expense_service(expense_id: int, current_user: User, db: Session):
 
         # refund balance
         user.balance += expense.amount
+        apply_totals_delta(
+            db, user.id, expense=-expense.amount, expense_count=-1
+        )
+        apply_entry_rollup(db, expense, removed=True)
+        apply_entry_budgets(db, expense, removed=True)
         db.commit()
         return expense
     except Exception as e:
         db.rollback()
-        logger.error(f"Failed to delete expense {expense_id} due to: {str(e)}")
+        logger.error("Failed to delete expense %s due to: %s", expense_id, e)
         raise e
@@ -0,0 +1,108 @@
+"""
+Export Service, streams transactions with server-side cursors
+"""
+
+import logging
+from datetime import date
+from typing import Iterator
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+from app.models import User, Expense, Income
+from app.utils.periods import in_date_range
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPENSE_HEADER = ("id", "date", "category", "amount")
+INCOME_HEADER = ("id", "date", "source", "amount")
+TRANSACTION_HEADER = ("id", "date", "type", "category", "amount")
+
+
+def _stream(db: Session, query) -> Iterator[tuple]:
+    """
+    Iterate plain row tuples, fetched EXPORT_BATCH_SIZE at a time from a
+    server-side cursor
+    """
+    result = db.execute(
+        query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    try:
+        for row in result:
+            yield tuple(row)
+    finally:
+        result.close()
+
+
+def export_expenses_service(
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[tuple]:
+    """
+    Expenses of a user between start and end (inclusive), oldest first
+    """
+    logger.info("Exporting expenses for user_id: %s", current_user.id)
+    query = select(Expense.id, Expense.date, Expense.category, Expense.amount).where(
+        Expense.user_id == current_user.id
+    )
+    query = in_date_range(query, Expense.date, start, end).order_by(Expense.date, Expense.id)
+    return _stream(db, query)
+
+
+def export_incomes_service(
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[tuple]:
+    """
+    Incomes of a user between start and end (inclusive), oldest first
+    """
+    logger.info("Exporting incomes for user_id: %s", current_user.id)
+    query = select(Income.id, Income.date, Income.source, Income.amount).where(
+        Income.user_id == current_user.id
+    )
+    query = in_date_range(query, Income.date, start, end).order_by(Income.date, Income.id)
+    return _stream(db, query)
+
+
+def export_transactions_service(
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[tuple]:
+    """
+    Expenses and incomes of a user in one date-ordered stream
+    """
+    logger.info("Exporting transactions for user_id: %s", current_user.id)
+    expenses = in_date_range(
+        select(
+            Expense.id,
+            Expense.date,
+            literal("expense").label("type"),
+            Expense.category.label("category"),
+            Expense.amount,
+        ).where(Expense.user_id == current_user.id),
+        Expense.date,
+        start,
+        end,
+    )
+    incomes = in_date_range(
+        select(
+            Income.id,
+            Income.date,
+            literal("income").label("type"),
+            Income.source.label("category"),
+            Income.amount,
+        ).where(Income.user_id == current_user.id),
+        Income.date,
+        start,
+        end,
+    )
+    combined = union_all(expenses, incomes).subquery()
+    query = select(combined).order_by(combined.c.date, combined.c.type, combined.c.id)
+    return _stream(db, query)
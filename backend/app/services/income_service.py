@@ -1,8 +1,23 @@
 import logging
+from datetime import datetime
+from typing import Any
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models import Income, User
+from app.schema.base import BulkCreateResult
 from app.schema.income import IncomeCreate, IncomeUpdate
 from app.utils.income import authorized
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
+from app.utils.rollups import (
+    INCOME,
+    RollupKey,
+    apply_bulk_rollup,
+    apply_entry_rollup,
+    month_start,
+    rollup_key,
+)
+from app.utils.bulk import validate_rows
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +52,10 @@ def create_income_service(
         new_income = Income(**income.model_dump(), user_id=current_user.id)
         db.add(new_income)
         user.balance += new_income.amount
+        apply_totals_delta(
+            db, current_user.id, income=new_income.amount, income_count=1
+        )
+        apply_entry_rollup(db, new_income)
         db.commit()
         db.refresh(new_income)
         return new_income
@@ -49,28 +68,94 @@ def create_income_service(
         raise e
 
 
+def bulk_create_income_service(
+    rows: list[dict[str, Any]], current_user: User, db: Session
+) -> BulkCreateResult:
+    """
+    Creating many incomes with a single balance lock and one multi-row insert
+    Args:
+        rows: raw income rows, validated against IncomeCreate
+        current_user: user data to create incomes
+    Return:
+        created ids and per-row errors of the rows that were skipped
+    """
+    valid, errors = validate_rows(rows, IncomeCreate)
+    try:
+        user = (
+            db.query(User).filter(User.id == current_user.id).with_for_update().first()
+        )
+        if not user:
+            raise UserNotFoundError("User not Found")
+
+        now = datetime.utcnow()
+        values = [
+            {**income.model_dump(), "date": income.date or now, "user_id": user.id}
+            for _, income in valid
+        ]
+        ids = []
+        if values:
+            ids = list(
+                db.execute(
+                    insert(Income).returning(Income.id, sort_by_parameter_order=True),
+                    values,
+                ).scalars()
+            )
+            total = sum(row["amount"] for row in values)
+            user.balance += total
+            apply_totals_delta(db, user.id, income=total, income_count=len(values))
+            apply_bulk_rollup(
+                db,
+                (
+                    (
+                        RollupKey(user.id, month_start(row["date"]), INCOME, row["source"]),
+                        row["amount"],
+                    )
+                    for row in values
+                ),
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(
+            f"Failed to bulk create incomes for user {current_user.id} due to: {str(e)}"
+        )
+        raise e
+
+    logger.info(
+        "Bulk created %d incomes for user_id %s, %d rows rejected",
+        len(ids),
+        current_user.id,
+        len(errors),
+    )
+    return BulkCreateResult(created=len(ids), ids=ids, errors=errors)
+
+
 def fetch_all_income_service(
-    current_user: User, db: Session, skip: int = 0, limit: int = 100
+    current_user: User,
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    columns: tuple | None = None,
 ) -> Income:
     """
-    Retrieveing all incomes
+    Retrieveing all incomes, newest first
     Args:
         skip: start count of rows
         limit: end count of rows
+        cursor: token from a previous page, takes precedence over skip
         current_user: authorized user data
         db: session of db
+        columns: select these columns as rows instead of Income objects
     return:
         incomes
     """
     try:
         logger.info("Retrieveing all incomes for user_id: %s", current_user.id)
-        incomes = (
-            db.query(Income)
-            .filter(Income.user_id == current_user.id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = db.query(*(columns or (Income,))).filter(
+            Income.user_id == current_user.id
         )
+        incomes = paginate(query, Income.date, Income.id, skip, limit, cursor).all()
         return incomes
     except Exception as e:
         logger.warning(
@@ -145,6 +230,7 @@ def update_income_service(
         if not user:
             raise UserNotFoundError(f"User {current_user.id} not found")
         old_amount = income.amount
+        previous = (rollup_key(income), old_amount)
         new_amount = (
             income_update.amount if income_update.amount is not None else old_amount
         )
@@ -157,6 +243,8 @@ def update_income_service(
             income.source = income_update.source
         if income_update.date is not None:
             income.date = income_update.date
+        apply_totals_delta(db, user.id, income=-difference)
+        apply_entry_rollup(db, income, previous)
 
         db.commit()
         db.refresh(income)
@@ -198,6 +286,8 @@ def delete_income_service(income_id: int, current_user: User, db: Session):
 
         db.delete(income)
         user.balance -= income.amount
+        apply_totals_delta(db, user.id, income=-income.amount, income_count=-1)
+        apply_entry_rollup(db, income, removed=True)
         db.commit()
         return income
     except Exception as e:
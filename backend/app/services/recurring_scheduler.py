@@ -0,0 +1,163 @@
+"""
+In-process scheduler of the recurring rules
+"""
+
+import heapq
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models import RecurringRule
+from app.services.recurring_service import MaterializeResult, materialize_due_rules
+from app.utils.recurring import utc_today
+
+
+logger = logging.getLogger(__name__)
+
+
+class RecurringScheduler:
+    """
+    Materialize recurring rules as they fall due.
+
+    The rules due by tomorrow are kept in a heap of (next_due, rule id), so
+    a pass pops exactly the due ones, earliest first, and hands them to
+    materialize_due_rules `batch_size` rules (of any users) per transaction.
+    Claimed rules go back on the heap with their new watermark. The heap is
+    reloaded every `refresh_seconds` to pick up new and changed rules and
+    the progress of other workers; a stale entry costs one claim that
+    matches nothing. Between passes the thread sleeps until the next UTC
+    day or reload.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = 500,
+        refresh_seconds: float = 300,
+        catch_up: bool = True,
+        max_loaded: int = 100_000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.refresh_seconds = refresh_seconds
+        self.catch_up = catch_up
+        self.max_loaded = max_loaded
+        self._heap: list[tuple[date, int]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def load(self, today: date) -> bool:
+        """
+        Replace the heap with the active rules due by tomorrow, at most
+        `max_loaded` of them; True when that left some out
+        """
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(RecurringRule.next_due, RecurringRule.id)
+                .where(
+                    RecurringRule.is_active.is_(True),
+                    RecurringRule.next_due <= today + timedelta(days=1),
+                )
+                .order_by(RecurringRule.next_due, RecurringRule.id)
+                .limit(self.max_loaded)
+            ).all()
+        # rows sorted by (next_due, id) already satisfy the heap invariant
+        self._heap = [tuple(row) for row in rows]
+        return len(rows) == self.max_loaded
+
+    def run_pending(self, today: date) -> MaterializeResult:
+        """
+        Materialize every rule on the heap due on or before `today`
+        """
+        claimed = incomes = expenses = skipped = 0
+        while self._heap and self._heap[0][0] <= today:
+            batch = []
+            while self._heap and self._heap[0][0] <= today and len(batch) < self.batch_size:
+                batch.append(heapq.heappop(self._heap)[1])
+            with self.session_factory() as db:
+                result = materialize_due_rules(
+                    db, today, rule_ids=batch, catch_up=self.catch_up
+                )
+            for rule_id, next_due in (result.next_due or {}).items():
+                if next_due <= today + timedelta(days=1):
+                    heapq.heappush(self._heap, (next_due, rule_id))
+            claimed += result.claimed
+            incomes += result.incomes
+            expenses += result.expenses
+            skipped += result.skipped
+        return MaterializeResult(claimed, incomes, expenses, skipped)
+
+    def run_once(self, today: date | None = None) -> MaterializeResult:
+        """
+        Materialize everything due, e.g. to catch up after downtime
+        """
+        today = today or utc_today()
+        totals = MaterializeResult()
+        while True:
+            more = self.load(today)
+            result = self.run_pending(today)
+            totals = MaterializeResult(
+                *(total + value for total, value in zip(totals[:4], result[:4]))
+            )
+            if not more or not result.claimed:
+                return totals
+
+    def _run(self):
+        reload_at = 0.0
+        more = False
+        while not self._stop.is_set():
+            today = utc_today()
+            try:
+                if more or time.monotonic() >= reload_at:
+                    more = self.load(today)
+                    reload_at = time.monotonic() + self.refresh_seconds
+                # a full reload that claims nothing is not worth repeating
+                more = self.run_pending(today).claimed > 0 and more
+            except Exception:
+                logger.exception("Recurring rules pass failed")
+                more = False
+            if more:
+                continue
+            tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            until_tomorrow = (tomorrow - datetime.utcnow()).total_seconds()
+            self._stop.wait(max(0.0, min(until_tomorrow, reload_at - time.monotonic())))
+
+    def start(self):
+        """
+        Start the scheduler thread, its first pass takes care of whatever
+        fell due while no scheduler was running
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="recurring-scheduler", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Recurring scheduler started (batch_size=%d, catch_up=%s)",
+            self.batch_size,
+            self.catch_up,
+        )
+
+    def stop(self, timeout: float = 10):
+        """
+        Stop the scheduler thread after its current batch
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+
+recurring_scheduler = RecurringScheduler(
+    batch_size=settings.recurring_batch_size,
+    refresh_seconds=settings.recurring_refresh_seconds,
+    catch_up=settings.recurring_catch_up,
+)
@@ -0,0 +1,315 @@
+"""
+Recurring Rule Service
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from app.models import Expense, Income, RecurringRule, User
+from app.schema.recurring import RecurringRuleCreate, RecurringRuleUpdate
+from app.utils.budgets import BudgetEntry, apply_bulk_budgets
+from app.utils.recurring import due_dates, utc_today
+from app.utils.rollups import EXPENSE, INCOME, RollupKey, apply_bulk_rollup, month_start
+from app.utils.totals import apply_totals_delta
+
+
+logger = logging.getLogger(__name__)
+
+
+class RecurringRuleNotFoundError(Exception):
+    pass
+
+
+class InvalidRecurringRuleError(Exception):
+    pass
+
+
+class MaterializeResult(NamedTuple):
+    """Outcome of one materialization batch"""
+
+    # rules whose watermark this batch advanced
+    claimed: int = 0
+    incomes: int = 0
+    expenses: int = 0
+    # occurrences not created: expenses the balance could not cover, and
+    # missed occurrences outside catch-up mode
+    skipped: int = 0
+    # new watermark of each claimed rule that is still active, None when
+    # nothing was due
+    next_due: dict[int, date] | None = None
+
+
+def _own_rule(rule_id: int, current_user: User, db: Session) -> RecurringRule:
+    """
+    The user's recurring rule
+    """
+    rule = db.scalar(
+        select(RecurringRule).where(
+            RecurringRule.id == rule_id, RecurringRule.user_id == current_user.id
+        )
+    )
+    if not rule:
+        raise RecurringRuleNotFoundError(f"Recurring rule {rule_id} not found")
+    return rule
+
+
+def _resumed_due(rule: RecurringRule, today: date) -> date:
+    """
+    The rule's first occurrence on or after `today`, so a rule resumed after
+    a pause or past its end does not backfill the occurrences in between
+    """
+    if rule.next_due >= today:
+        return rule.next_due
+    _, next_due = due_dates(
+        rule.next_due, today - timedelta(days=1), rule.start_date, rule.interval, rule.every
+    )
+    return next_due
+
+
+def create_recurring_rule_service(
+    rule: RecurringRuleCreate, current_user: User, db: Session
+) -> RecurringRule:
+    """
+    Create a recurring rule, its first occurrence is due on its start date
+    """
+    try:
+        new_rule = RecurringRule(
+            **rule.model_dump(mode="json", exclude={"start_date", "end_date"}),
+            start_date=rule.start_date,
+            end_date=rule.end_date,
+            next_due=rule.start_date,
+            user_id=current_user.id,
+        )
+        db.add(new_rule)
+        db.commit()
+        db.refresh(new_rule)
+        return new_rule
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to create recurring rule for user_id %s: %s", current_user.id, e)
+        raise e
+
+
+def read_recurring_rules_service(current_user: User, db: Session) -> list[RecurringRule]:
+    """
+    The user's recurring rules, next due first
+    """
+    logger.info("Fetching recurring rules for user_id: %s", current_user.id)
+    return list(
+        db.scalars(
+            select(RecurringRule)
+            .where(RecurringRule.user_id == current_user.id)
+            .order_by(RecurringRule.next_due, RecurringRule.id)
+        )
+    )
+
+
+def update_recurring_rule_service(
+    rule_id: int, rule_update: RecurringRuleUpdate, current_user: User, db: Session
+) -> RecurringRule:
+    """
+    Update a recurring rule, entries already created are left as they are.
+    Reactivating a paused rule, or moving the end of an ended one past its
+    next occurrence, resumes it from today rather than from its old next_due.
+    """
+    try:
+        rule = _own_rule(rule_id, current_user, db)
+        changes = rule_update.model_dump(exclude_unset=True)
+        end_date = changes.get("end_date")
+        if end_date is not None and end_date < rule.start_date:
+            raise InvalidRecurringRuleError("end_date must not be before start_date")
+
+        ended = rule.end_date is not None and rule.next_due > rule.end_date
+        resumes = not rule.is_active and (
+            changes.get("is_active") is True
+            or (
+                ended
+                and "end_date" in changes
+                and changes.get("is_active") is not False
+                and (end_date is None or end_date >= rule.next_due)
+            )
+        )
+        for field, value in changes.items():
+            setattr(rule, field, value)
+        if resumes:
+            rule.next_due = _resumed_due(rule, utc_today())
+            rule.is_active = rule.end_date is None or rule.next_due <= rule.end_date
+        db.commit()
+        db.refresh(rule)
+        return rule
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to update recurring rule %s due to: %s", rule_id, e)
+        raise e
+
+
+def delete_recurring_rule_service(rule_id: int, current_user: User, db: Session) -> RecurringRule:
+    """
+    Delete a recurring rule, entries already created are kept
+    """
+    try:
+        rule = _own_rule(rule_id, current_user, db)
+        db.delete(rule)
+        db.commit()
+        return rule
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to delete recurring rule %s due to: %s", rule_id, e)
+        raise e
+
+
+def materialize_due_rules(
+    db: Session,
+    today: date,
+    rule_ids: list[int] | None = None,
+    limit: int | None = None,
+    catch_up: bool = True,
+) -> MaterializeResult:
+    """
+    Create the incomes and expenses of the rules due on or before `today`,
+    for many users in one transaction.
+
+    The users are locked in id order, as the income and expense services
+    lock them, and each rule is claimed by moving its watermark from the
+    next_due it was read with to the occurrence after `today`. A rule another
+    worker advanced in the meantime matches no row and is skipped, and the
+    entries commit together with the watermarks, so a crash or a second
+    worker can neither lose nor repeat an occurrence.
+
+    Args:
+        rule_ids: only these rules (default: any due rule)
+        limit: at most this many rules, earliest due first
+        catch_up: create every missed occurrence; otherwise only the latest
+            due one of each rule and count the others as skipped
+    """
+    query = (
+        select(RecurringRule)
+        .where(RecurringRule.is_active.is_(True), RecurringRule.next_due <= today)
+        .order_by(RecurringRule.next_due, RecurringRule.id)
+        .limit(limit)
+    )
+    if rule_ids is not None:
+        query = query.where(RecurringRule.id.in_(rule_ids))
+    rules = db.scalars(query).all()
+    if not rules:
+        return MaterializeResult()
+
+    try:
+        users = {
+            user.id: user
+            for user in db.scalars(
+                select(User)
+                .where(User.id.in_({rule.user_id for rule in rules}))
+                .order_by(User.id)
+                .with_for_update()
+            )
+        }
+
+        claimed, skipped = 0, 0
+        next_due = {}
+        occurrences = []
+        for rule in sorted(rules, key=lambda rule: rule.id):
+            dates, following = due_dates(
+                rule.next_due, today, rule.start_date, rule.interval, rule.every, rule.end_date
+            )
+            active = rule.end_date is None or following <= rule.end_date
+            claim = db.execute(
+                update(RecurringRule)
+                .where(RecurringRule.id == rule.id, RecurringRule.next_due == rule.next_due)
+                .values(next_due=following, is_active=active)
+                .execution_options(synchronize_session=False)
+            )
+            if claim.rowcount == 0:
+                continue
+            claimed += 1
+            if active:
+                next_due[rule.id] = following
+            if not catch_up and len(dates) > 1:
+                skipped += len(dates) - 1
+                dates = dates[-1:]
+            occurrences.extend((rule.user_id, day, rule.kind != INCOME, rule) for day in dates)
+
+        # per user and day, incomes before expenses
+        occurrences.sort(key=lambda occurrence: occurrence[:3])
+        incomes, expenses = [], []
+        for user_id, day, is_expense, rule in occurrences:
+            user = users.get(user_id)
+            row = {
+                "amount": rule.amount,
+                "date": datetime.combine(day, time.min),
+                "user_id": user_id,
+            }
+            if user is None:
+                skipped += 1
+            elif not is_expense:
+                user.balance += rule.amount
+                incomes.append({**row, "source": rule.category})
+            elif user.balance < rule.amount:
+                logger.warning(
+                    "Skipped recurring expense of rule %s due %s: insufficient balance",
+                    rule.id,
+                    day,
+                )
+                skipped += 1
+            else:
+                user.balance -= rule.amount
+                expenses.append({**row, "category": rule.category})
+
+        _record_entries(db, incomes, expenses)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to materialize recurring rules: %s", e)
+        raise e
+
+    logger.info(
+        "Materialized %d recurring rules: %d incomes, %d expenses, %d skipped",
+        claimed,
+        len(incomes),
+        len(expenses),
+        skipped,
+    )
+    return MaterializeResult(claimed, len(incomes), len(expenses), skipped, next_due)
+
+
+def _record_entries(db: Session, incomes: list[dict], expenses: list[dict]):
+    """
+    Insert the entries of a batch with one statement per table and update
+    the totals, rollups and budgets as the bulk create services do
+    """
+    totals = defaultdict(lambda: defaultdict(int))
+    for model, kind, label, rows in (
+        (Income, INCOME, "source", incomes),
+        (Expense, EXPENSE, "category", expenses),
+    ):
+        if not rows:
+            continue
+        db.execute(insert(model), rows)
+        for row in rows:
+            user_totals = totals[row["user_id"]]
+            user_totals[kind] += row["amount"]
+            user_totals[f"{kind}_count"] += 1
+        apply_bulk_rollup(
+            db,
+            (
+                (
+                    RollupKey(row["user_id"], month_start(row["date"]), kind, row[label]),
+                    row["amount"],
+                )
+                for row in rows
+            ),
+        )
+
+    for user_id, user_totals in totals.items():
+        apply_totals_delta(db, user_id, **user_totals)
+
+    by_user = defaultdict(list)
+    for row in expenses:
+        by_user[row["user_id"]].append(
+            BudgetEntry(row["user_id"], row["category"], row["date"], row["amount"])
+        )
+    for user_id, entries in by_user.items():
+        apply_bulk_budgets(db, user_id, entries)
@@ -0,0 +1,192 @@
+"""
+Refresh token service: issue, rotate and revoke refresh tokens
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import RefreshToken, RevokedRefreshToken, User
+from app.utils.refresh_tokens import (
+    hash_refresh_token,
+    new_refresh_token,
+    revoked_refresh_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidRefreshTokenError(Exception):
+    pass
+
+
+class RefreshTokenReuseError(InvalidRefreshTokenError):
+    pass
+
+
+REFRESH_TOKEN_EXPIRE_MINUTES = settings.refresh_token_expire_minutes
+
+# monotonic time after which this worker prunes expired tokens again
+_prune_at = 0.0
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive timestamps, they are stored in UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def issue_refresh_token_service(
+    user_id: int, db: Session, family_id: str | None = None, commit: bool = True
+):
+    """
+    Create a refresh token for a user, a new family unless rotating
+    """
+    token = new_refresh_token()
+    expire = datetime.now(timezone.utc) + timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            token_hash=hash_refresh_token(token),
+            family_id=family_id or uuid.uuid4().hex,
+            expires_at=expire,
+        )
+    )
+    if commit:
+        db.commit()
+    return token, expire
+
+
+def _revoke(row: RefreshToken, db: Session):
+    db.add(
+        RevokedRefreshToken(
+            token_hash=row.token_hash,
+            user_id=row.user_id,
+            family_id=row.family_id,
+            expires_at=row.expires_at,
+            revoked_at=datetime.now(timezone.utc),
+        )
+    )
+    db.delete(row)
+
+
+def _revoke_family(family_id: str, db: Session):
+    db.query(RefreshToken).filter(RefreshToken.family_id == family_id).delete(
+        synchronize_session=False
+    )
+    db.commit()
+
+
+def _check_replay(token_hash: str, db: Session):
+    """
+    Revoke the whole family when a revoked token is presented again
+    """
+    revoked_refresh_tokens.sync(db)
+    if not revoked_refresh_tokens.might_contain(token_hash):
+        return
+    revoked = db.get(RevokedRefreshToken, token_hash)
+    if revoked is None:
+        return
+    logger.warning(
+        "Refresh token reuse for user %s, revoking family %s",
+        revoked.user_id,
+        revoked.family_id,
+    )
+    _revoke_family(revoked.family_id, db)
+    raise RefreshTokenReuseError("Refresh token has already been used")
+
+
+def rotate_refresh_token_service(token: str, db: Session):
+    """
+    Exchange a live refresh token for its successor.
+
+    Returns (user, new_token, new_expire). The presented token moves to
+    the revocation store in the same transaction.
+    """
+    token_hash = hash_refresh_token(token)
+    row = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.token_hash == token_hash)
+        .with_for_update()
+        .first()
+    )
+    if row is None:
+        _check_replay(token_hash, db)
+        raise InvalidRefreshTokenError("Invalid refresh token")
+
+    user_id, family_id = row.user_id, row.family_id
+    if _as_utc(row.expires_at) <= datetime.now(timezone.utc):
+        db.delete(row)
+        db.commit()
+        raise InvalidRefreshTokenError("Refresh token has expired")
+
+    user = db.get(User, user_id)
+    if user is None or not user.is_active:
+        _revoke_family(family_id, db)
+        raise InvalidRefreshTokenError("Invalid refresh token")
+
+    _revoke(row, db)
+    new_token, expire = issue_refresh_token_service(
+        user_id, db, family_id=family_id, commit=False
+    )
+    db.commit()
+    revoked_refresh_tokens.add(token_hash)
+    _prune_if_due(db)
+    return user, new_token, expire
+
+
+def prune_refresh_tokens_service(db: Session) -> tuple[int, int]:
+    """
+    Delete expired refresh tokens and the revocations of expired tokens, which
+    can no longer be replayed, then rebuild the filter without them.
+
+    Returns (revocations, tokens) deleted.
+    """
+    now = datetime.now(timezone.utc)
+    revocations = (
+        db.query(RevokedRefreshToken)
+        .filter(RevokedRefreshToken.expires_at <= now)
+        .delete(synchronize_session=False)
+    )
+    tokens = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.expires_at <= now)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    revoked_refresh_tokens.rebuild(db)
+    logger.info(
+        "Pruned %d expired revocations and %d expired refresh tokens", revocations, tokens
+    )
+    return revocations, tokens
+
+
+def _prune_if_due(db: Session):
+    """
+    Prune at most every refresh_revocation_prune_seconds per worker; two
+    threads racing here both delete the same rows, which is harmless
+    """
+    global _prune_at
+    if time.monotonic() < _prune_at:
+        return
+    _prune_at = time.monotonic() + settings.refresh_revocation_prune_seconds
+    try:
+        prune_refresh_tokens_service(db)
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to prune expired refresh tokens: %s", e)
+
+
+def revoke_refresh_token_service(token: str, db: Session) -> bool:
+    """
+    Revoke a live refresh token (logout), False when it was not live
+    """
+    token_hash = hash_refresh_token(token)
+    row = db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
+    if row is None:
+        return False
+    _revoke(row, db)
+    db.commit()
+    revoked_refresh_tokens.add(token_hash)
+    return True
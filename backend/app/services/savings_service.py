@@ -7,6 +7,8 @@ from sqlalchemy.orm import Session
 from app.models import Savings, User
 from app.schema.savings import SavingsCreate, SavingsUpdate
 from app.core.permissions import Role
+from app.utils.pagination import paginate
+from app.utils.totals import apply_totals_delta
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,13 @@ def is_authorized(savings, current_user) -> bool:
     return savings.user_id == current_user.id
 
 
+def _lock_user(db: Session, user_id: int) -> User | None:
+    """
+    Select the user row for update, serializing changes to the user's totals
+    """
+    return db.query(User).filter(User.id == user_id).with_for_update().first()
+
+
 def get_saving_service(savings_id: int, current_user: User, db: Session):
     """
     Retrieving savings for a user
@@ -43,17 +52,28 @@ def get_saving_service(savings_id: int, current_user: User, db: Session):
     return savings
 
 
-def get_all_savings_service(current_user: User, db: Session):
+def get_all_savings_service(
+    current_user: User,
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    columns: tuple | None = None,
+):
     """
-    Retrieving all savings for a user
+    Retrieving all savings for a user, newest first, as Savings objects or
+    as rows of `columns`
     """
     logger.info("Fetching all savings for user_id: %s", current_user.id)
 
     try:
         logger.info("user_id: %s retrieving own savings entries", current_user.id)
-        savings_list = (
-            db.query(Savings).filter(Savings.user_id == current_user.id).all()
+        query = db.query(*(columns or (Savings,))).filter(
+            Savings.user_id == current_user.id
         )
+        savings_list = paginate(
+            query, Savings.created_at, Savings.id, skip, limit, cursor
+        ).all()
     except Exception as e:
         logger.warning(
             "Failed to retrieve savings for user_id: %s due to: %s", current_user.id, e
@@ -76,7 +96,11 @@ def create_saving_service(saving: SavingsCreate, current_user: User, db: Session
 
     new_savings = Savings(**saving.model_dump(), user_id=current_user.id)
 
+    _lock_user(db, current_user.id)
     db.add(new_savings)
+    apply_totals_delta(
+        db, current_user.id, savings=new_savings.amount, savings_count=1
+    )
     db.commit()
     db.refresh(new_savings)
 
@@ -109,9 +133,15 @@ def update_saving_service(
         )
         raise ValueError("Unauthorized access")
 
+    old_amount = existing_savings.amount
     update_data = saving_update.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(existing_savings, key, value)
+    if update_data.get("amount") is not None:
+        _lock_user(db, current_user.id)
+        apply_totals_delta(
+            db, current_user.id, savings=update_data["amount"] - old_amount
+        )
 
     db.commit()
     db.refresh(existing_savings)
@@ -141,7 +171,11 @@ def delete_saving_service(savings_id: int, current_user: User, db: Session):
         )
         raise ValueError("Unauthorized access")
 
+    _lock_user(db, current_user.id)
     db.delete(existing_savings)
+    apply_totals_delta(
+        db, current_user.id, savings=-existing_savings.amount, savings_count=-1
+    )
     db.commit()
 
     logger.info("Savings id: %s deleted for user_id: %s", savings_id, current_user.id)
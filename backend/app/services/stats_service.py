@@ -0,0 +1,133 @@
+"""
+Stats Service, expense and income aggregates computed in SQL
+"""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import User, Expense, Income, UserTotals
+from app.schema.analytics import AmountStats, MonthlyAmount
+from app.utils.periods import in_date_range, month_column
+
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+
+# the column an entry is grouped by: expense category, income source
+CATEGORY_COLUMNS = {Expense: Expense.category, Income: Income.source}
+
+
+def _user_entries(query, model, current_user: User, start, end, category):
+    """
+    Restrict a query to the user's entries in [start, end] and category
+    """
+    query = in_date_range(query.where(model.user_id == current_user.id), model.date, start, end)
+    if category is not None:
+        query = query.where(CATEGORY_COLUMNS[model] == category)
+    return query
+
+
+def total_amount_service(
+    model,
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+):
+    """
+    Sum of a user's expense or income amounts. Without a range it is read
+    from the user's totals row, a primary-key lookup.
+    """
+    if start is None and end is None:
+        totals = db.get(UserTotals, current_user.id)
+        if totals is not None:
+            return totals.total_expense if model is Expense else totals.total_income
+    return amount_stats_service(model, current_user, db, start, end).total
+
+
+def amount_stats_service(
+    model,
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+) -> AmountStats:
+    """
+    SUM, COUNT, AVG, MIN and MAX of the amounts of a user's expenses or
+    incomes, one aggregate row whatever the history size
+    """
+    logger.info("Fetching %s stats for user_id: %s", model.__tablename__, current_user.id)
+    query = _user_entries(
+        select(
+            func.coalesce(func.sum(model.amount), 0),
+            func.count(model.id),
+            func.avg(model.amount),
+            func.min(model.amount),
+            func.max(model.amount),
+        ),
+        model,
+        current_user,
+        start,
+        end,
+        category,
+    )
+    total, count, average, smallest, largest = db.execute(query).one()
+    if average is not None:
+        average = Decimal(average).quantize(CENT)
+    return AmountStats(total=total, count=count, average=average, min=smallest, max=largest)
+
+
+def monthly_amounts_service(
+    model,
+    current_user: User,
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+) -> list[MonthlyAmount]:
+    """
+    Sum and count of a user's expenses or incomes per month, oldest first
+    """
+    logger.info(
+        "Fetching monthly %s for user_id: %s", model.__tablename__, current_user.id
+    )
+    month = month_column(db, model.date).label("month")
+    query = _user_entries(
+        select(month, func.sum(model.amount), func.count(model.id)),
+        model,
+        current_user,
+        start,
+        end,
+        category,
+    ).group_by(month).order_by(month)
+    return [
+        MonthlyAmount(month=month, total=total, count=count)
+        for month, total, count in db.execute(query)
+    ]
+
+
+def entries_in_category_service(
+    model,
+    current_user: User,
+    db: Session,
+    category: str,
+    start: date | None = None,
+    end: date | None = None,
+):
+    """
+    A user's expenses or incomes of one category or source, newest first
+    """
+    query = _user_entries(select(model), model, current_user, start, end, category)
+    return db.scalars(query.order_by(model.date.desc(), model.id.desc())).all()
+
+
+def has_entries_service(model, current_user: User, db: Session) -> bool:
+    """
+    Whether the user has any expense or income at all
+    """
+    return db.scalar(select(exists().where(model.user_id == current_user.id)))
@@ -0,0 +1,143 @@
+"""
+Trends Service, statistics computed with NumPy over a user's history
+"""
+
+import logging
+import math
+from datetime import date
+import numpy as np
+from sqlalchemy import Float, cast, select
+from sqlalchemy.orm import Session
+from app.models import User, Expense, Income
+from app.schema.analytics import (
+    AmountDistribution,
+    CategoryTrend,
+    CategoryTrends,
+    Granularity,
+    RollupKind,
+    TrendPoint,
+    TrendSeries,
+)
+from app.services.stats_service import CATEGORY_COLUMNS
+from app.utils import trends
+from app.utils.periods import day_number, in_date_range
+
+
+logger = logging.getLogger(__name__)
+
+KIND_MODELS = {RollupKind.EXPENSE: Expense, RollupKind.INCOME: Income}
+
+# longest rolling window, in periods
+MAX_TREND_WINDOW = 366
+
+
+def _floats(values: np.ndarray) -> list:
+    """
+    Values rounded to cents, NaN as None
+    """
+    return [None if math.isnan(value) else value for value in np.round(values, 2).tolist()]
+
+
+def _entries(
+    kind: RollupKind, current_user: User, db: Session, start: date | None, end: date | None
+) -> trends.Entries:
+    """
+    (day, amount, category) columns of the user's expenses or incomes
+    """
+    model = KIND_MODELS[kind]
+    query = select(
+        day_number(db, model.date),
+        cast(model.amount, Float),
+        CATEGORY_COLUMNS[model],
+    ).where(model.user_id == current_user.id)
+    query = in_date_range(query, model.date, start, end)
+    return trends.entries_from_rows(db.execute(query).all())
+
+
+def _distributions(stats: trends.Distribution) -> list[dict]:
+    """
+    AmountDistribution fields of each group
+    """
+    columns = {
+        "count": stats.counts.tolist(),
+        "total": _floats(stats.totals),
+        "mean": _floats(stats.means),
+        "stddev": _floats(stats.stddevs),
+    }
+    for index, percentile in enumerate(trends.PERCENTILES):
+        columns[f"p{percentile}"] = _floats(stats.percentiles[:, index])
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def trend_series_service(
+    current_user: User,
+    db: Session,
+    kind: RollupKind = RollupKind.EXPENSE,
+    granularity: Granularity = Granularity.MONTH,
+    window: int = 3,
+    start: date | None = None,
+    end: date | None = None,
+) -> TrendSeries:
+    """
+    Totals per period with their rolling mean, and the distribution of the
+    amounts over the whole range
+    """
+    logger.info(
+        "Computing %s %s trends for user_id: %s",
+        granularity.value,
+        kind.value,
+        current_user.id,
+    )
+    window = max(1, min(window, MAX_TREND_WINDOW))
+    entries = _entries(kind, current_user, db, start, end)
+    axis, totals, counts = trends.period_sums(entries, granularity.value)
+    overall = trends.distribution(
+        entries.amounts, np.zeros(len(entries.amounts), dtype=np.int64), 1
+    )
+    points = [
+        TrendPoint(period=period, total=total, count=count, rolling_mean=mean)
+        for period, total, count, mean in zip(
+            trends.day_dates(axis),
+            _floats(totals),
+            counts.tolist(),
+            _floats(trends.rolling_mean(totals, window)),
+        )
+    ]
+    return TrendSeries(
+        kind=kind,
+        granularity=granularity,
+        window=window,
+        distribution=AmountDistribution(**_distributions(overall)[0]),
+        points=points,
+    )
+
+
+def category_trends_service(
+    current_user: User,
+    db: Session,
+    kind: RollupKind = RollupKind.EXPENSE,
+    start: date | None = None,
+    end: date | None = None,
+) -> CategoryTrends:
+    """
+    Distribution, monthly totals and month over month changes of each
+    expense category or income source, largest total first
+    """
+    logger.info("Computing %s category trends for user_id: %s", kind.value, current_user.id)
+    entries = _entries(kind, current_user, db, start, end)
+    axis, monthly = trends.category_period_sums(entries, trends.MONTH)
+    deltas, relative = trends.month_over_month(monthly)
+    stats = trends.distribution(entries.amounts, entries.categories, len(entries.labels))
+
+    categories = [
+        CategoryTrend(
+            category=label,
+            monthly=_floats(monthly[index]),
+            month_over_month=_floats(deltas[index]),
+            month_over_month_pct=_floats(relative[index] * 100),
+            **fields,
+        )
+        for index, (label, fields) in enumerate(zip(entries.labels, _distributions(stats)))
+    ]
+    categories.sort(key=lambda category: category.total, reverse=True)
+    return CategoryTrends(kind=kind, months=trends.day_dates(axis), categories=categories)
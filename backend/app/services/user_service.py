@@ -2,10 +2,12 @@
 User Service
 """
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.schema.user import UserCreate, UserUpdate
-from app.utils.auth import hash_password
+from app.utils.hashing import password_hasher
+from app.utils.pagination import paginate
 
 
 def get_user_service(db: Session, user_id: int):
@@ -14,10 +16,18 @@ def get_user_service(db: Session, user_id: int):
     return user
 
 
-def get_all_users_service(db: Session, skip: int = 0, limit: int = 100):
-    """Fetch all users with pagination"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+def get_all_users_service(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    columns: tuple | None = None,
+):
+    """Fetch all users with pagination, newest first, optionally as rows of `columns`"""
+    users = paginate(
+        db.query(*(columns or (User,))), User.created_at, User.id, skip, limit, cursor
+    )
+    return users.all()
 
 
 def get_user_by_email_service(db: Session, email: str):
@@ -26,14 +36,7 @@ def get_user_by_email_service(db: Session, email: str):
     return user
 
 
-def create_user_service(db: Session, user: UserCreate):
-    """Create a new user"""
-
-    if get_user_by_email_service(db, user.email):
-        raise ValueError("Email already registered")
-
-    hashed_password = hash_password(user.password) if user.password else None
-
+def _insert_user(db: Session, user: UserCreate, hashed_password: str | None) -> User:
     user_data = user.model_dump(exclude={"password"})
     user_data["password"] = hashed_password
 
@@ -50,19 +53,36 @@ def create_user_service(db: Session, user: UserCreate):
     return new_user
 
 
-def update_user_service(db: Session, user: UserUpdate, user_id: int):
-    """Update user"""
+def _check_email_free(db: Session, email: str):
+    if get_user_by_email_service(db, email):
+        raise ValueError("Email already registered")
+
 
+def create_user_service(db: Session, user: UserCreate):
+    """Create a new user, hashing inline (scripts); routes use create_user_service_async"""
+    _check_email_free(db, user.email)
+    hashed_password = password_hasher.hash(user.password) if user.password else None
+    return _insert_user(db, user, hashed_password)
+
+
+async def create_user_service_async(db: Session, user: UserCreate):
+    """
+    Create a new user, the queries in the threadpool and the hash on the
+    hashing pool
+    """
+    await run_in_threadpool(_check_email_free, db, user.email)
+    hashed_password = (
+        await password_hasher.hash_async(user.password) if user.password else None
+    )
+    return await run_in_threadpool(_insert_user, db, user, hashed_password)
+
+
+def _apply_user_update(db: Session, update_data: dict, user_id: int):
     update_user = db.query(User).filter(User.id == user_id).first()
 
     if not update_user:
         return None
 
-    update_data = user.model_dump(exclude_unset=True)
-
-    if "password" in update_data and update_data["password"]:
-        update_data["password"] = hash_password(update_data["password"])
-
     for key, value in update_data.items():
         setattr(update_user, key, value)
 
@@ -76,6 +96,29 @@ def update_user_service(db: Session, user: UserUpdate, user_id: int):
     return update_user
 
 
+def update_user_service(db: Session, user: UserUpdate, user_id: int):
+    """Update user, hashing inline (scripts); routes use update_user_service_async"""
+    update_data = user.model_dump(exclude_unset=True)
+
+    if "password" in update_data and update_data["password"]:
+        update_data["password"] = password_hasher.hash(update_data["password"])
+
+    return _apply_user_update(db, update_data, user_id)
+
+
+async def update_user_service_async(db: Session, user: UserUpdate, user_id: int):
+    """
+    Update user, a new password is hashed on the hashing pool without
+    holding a request thread
+    """
+    update_data = user.model_dump(exclude_unset=True)
+
+    if "password" in update_data and update_data["password"]:
+        update_data["password"] = await password_hasher.hash_async(update_data["password"])
+
+    return await run_in_threadpool(_apply_user_update, db, update_data, user_id)
+
+
 def delete_user_service(db: Session, user_id: int):
     """Delete user"""
     delete_user = db.query(User).filter(User.id == user_id).first()
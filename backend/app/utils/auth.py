@@ -5,9 +5,11 @@ Authentication utilities
 import logging
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from fastapi.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.core.permissions import role_mask
+from app.utils.hashing import get_pwd_context, password_hasher
+from app.utils.token_cache import verified_tokens
 from app.models import User
 from sqlalchemy.orm import Session
 
@@ -19,59 +21,68 @@ class UserNotFoundError(Exception):
     pass
 
 
-pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
 
-def login_service(user_login, db: Session):
+def _user_by_email(db: Session, email: str) -> User | None:
+    return db.query(User).filter(User.email == email).first()
+
+
+async def login_service_async(user_login, db: Session):
     """
-    Service for login functionalities
+    Service for login functionalities: the query runs in the threadpool and
+    the password check on the hashing pool, so no request thread waits on it
     """
     try:
-        user = db.query(User).filter(User.email == user_login.email).first()
+        user = await run_in_threadpool(_user_by_email, db, user_login.email)
         if not user:
             logger.warning("Data for user not found")
             raise UserNotFoundError("User does not exist")
 
-        if not verify_password(user_login.password, user.password):
+        if not await password_hasher.verify_async(user_login.password, user.password):
             logger.warning("Invalid password for user")
             raise ValueError("Invalid Password")
 
         logger.info("User %s logged in successfully", user_login.email)
-        token, expire = create_access_token(data={"user_id": str(user.id)})
+        token, expire = create_access_token(data=access_token_claims(user))
         return user, token, expire
     except Exception as e:
         logger.error("Failed to login user due to: %s", str(e))
         raise
 
 
-def signup_service(new_user, db: Session):
-    """
-    Signup service for creating new users
+def _check_email_free(db: Session, email: str):
+    if _user_by_email(db, email):
+        logger.warning("Signup attempt with already registered email")
+        raise ValueError("Email is already registered")
+
+
+def _insert_user(new_user, hashed_password: str | None, db: Session) -> User:
+    user_data = new_user.model_dump()
+    user_data["password"] = hashed_password
 
-    :param new_user: Description
-    :param db: Description
+    user = User(**user_data)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+async def signup_service_async(new_user, db: Session):
+    """
+    Signup service for creating new users, hashing on the hashing pool
+    between the threadpool queries
     """
     try:
-        user = db.query(User).filter(User.email == new_user.email).first()
-        if user:
-            logger.warning("Signup attempt with already registered email")
-            raise ValueError("Email is already registered")
-
+        await run_in_threadpool(_check_email_free, db, new_user.email)
         hashed_password = (
-            hash_password(new_user.password) if new_user.password else None
+            await password_hasher.hash_async(new_user.password)
+            if new_user.password
+            else None
         )
-
-        user_data = new_user.model_dump()
-        user_data["password"] = hashed_password
-
-        user = User(**user_data)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return await run_in_threadpool(_insert_user, new_user, hashed_password, db)
     except Exception as e:
         logger.error("Failed to create user due to: %s", e)
         raise e
@@ -79,12 +90,12 @@ def signup_service(new_user, db: Session):
 
 def hash_password(password: str) -> str:
     """Function to hash a password"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Funtion to verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def is_password_strong(password: str) -> bool:
@@ -112,6 +123,20 @@ def validate_password(password: str) -> None:
         )
 
 
+def access_token_claims(user: User) -> dict:
+    """
+    Claims for a user's access token: the subject plus the permission mask
+    and token version read-only routes authorize from
+    """
+    return {
+        "user_id": str(user.id),
+        "email": user.email,
+        "role": user.role,
+        "perms": role_mask(user.role),
+        "ver": user.token_version or 0,
+    }
+
+
 def create_access_token(data: dict):
     """create a JWT access token"""
 
@@ -125,12 +150,21 @@ def create_access_token(data: dict):
         }
     )
 
+    # python-jose (and cryptography) load on first use, not at app import
+    from jose import jwt
+
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt, expire
 
 
 def decode_access_token(token: str):
-    """Decode a JWT access token"""
+    """Decode a JWT access token, reusing the verified payload of a seen token"""
+
+    payload = verified_tokens.get(token)
+    if payload is not None:
+        return payload
+
+    from jose import JWTError, jwt
 
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -141,6 +175,7 @@ def decode_access_token(token: str):
                 detail="Invalid token: Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        verified_tokens.set(token, payload)
         return payload
     except JWTError as e:
         raise HTTPException(
@@ -1,6 +1,16 @@
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
-from app.models import User, Expense, Income, Savings
+from app.models import User, UserTotals
+from app.utils.totals import totals_select
+
+
+def sum_user_totals(current_user: User, db: Session):
+    """
+    Totals and counts of a user summed from the source tables, for users
+    without a user_totals row yet: (total_income, total_expense,
+    total_savings, income_count, expense_count, savings_count)
+    """
+    _, *totals = db.execute(totals_select([current_user.id])).one()
+    return totals
 
 
 def get_user_balance(
@@ -8,19 +18,16 @@ def get_user_balance(
     db: Session
 ):
     """
-    Get balance of a user
+    Get balance of a user from the user_totals row, a primary-key lookup.
+    Users without a row yet (not backfilled) fall back to summing.
     """
-    total_income =  db.query(func.sum(Income.amount)).filter(
-        Income.user_id == current_user.id
-    ).scalar() or 0
-
-    total_expense = db.query(func.sum(Expense.amount)).filter(
-        Expense.user_id == current_user.id
-    ).scalar() or 0
-
-    total_savings = db.query(func.sum(Savings.amount)).filter(
-        Savings.user_id == current_user.id
-    ).scalar() or 0
+    totals = db.get(UserTotals, current_user.id)
+    if totals is not None:
+        total_income = totals.total_income
+        total_expense = totals.total_expense
+        total_savings = totals.total_savings
+    else:
+        total_income, total_expense, total_savings, *_ = sum_user_totals(current_user, db)
 
     available_balance = total_income - total_expense - total_savings
     net_balance = total_income - total_expense
@@ -0,0 +1,202 @@
+"""
+Budget period and running spend utilities
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from app.models import Budget, BudgetSpend, Expense
+
+
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+YEARLY = "yearly"
+PERIODS = (WEEKLY, MONTHLY, YEARLY)
+
+
+class BudgetEntry(NamedTuple):
+    """What of an expense the budgets depend on"""
+
+    user_id: int
+    category: str
+    date: date
+    amount: Decimal
+
+
+class OverBudget(NamedTuple):
+    """A budget whose period spend went over its limit"""
+
+    budget: Budget
+    period_start: date
+    spent: Decimal
+
+
+def period_start(value, period: str) -> date:
+    """
+    First day of the week (Monday), month or year of a date or datetime
+    """
+    day = date(value.year, value.month, value.day)
+    if period == WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if period == MONTHLY:
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def period_end(start: date, period: str) -> date:
+    """
+    Last day of the period starting on `start`
+    """
+    if period == WEEKLY:
+        return start + timedelta(days=6)
+    if period == MONTHLY:
+        following = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        return following - timedelta(days=1)
+    return date(start.year, 12, 31)
+
+
+def budget_entry(expense: Expense) -> BudgetEntry:
+    """
+    Budget view of an expense
+    """
+    return BudgetEntry(expense.user_id, expense.category, expense.date, expense.amount)
+
+
+def apply_budget_delta(
+    db: Session, budget_id: int, start: date, amount, count: int = 0
+) -> Decimal:
+    """
+    Add amount and count to a budget's period, creating it on first use, and
+    return the period's new spend.
+
+    Callers hold the user's row lock, so the UPDATE-then-INSERT cannot race
+    with another writer for the same period.
+    """
+    spent = db.execute(
+        update(BudgetSpend)
+        .where(BudgetSpend.budget_id == budget_id, BudgetSpend.period_start == start)
+        .values(spent=BudgetSpend.spent + amount, count=BudgetSpend.count + count)
+        .returning(BudgetSpend.spent)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    if spent is None:
+        db.execute(
+            insert(BudgetSpend).values(
+                budget_id=budget_id, period_start=start, spent=amount, count=count
+            )
+        )
+        spent = amount
+    return Decimal(spent)
+
+
+def _user_budgets(db: Session, user_id: int, categories: set[str]) -> list[Budget]:
+    if not categories:
+        return []
+    return list(
+        db.scalars(
+            select(Budget).where(
+                Budget.user_id == user_id, Budget.category.in_(categories)
+            )
+        )
+    )
+
+
+def _apply(db: Session, budgets: list[Budget], entries: Iterable[tuple[BudgetEntry, int]]):
+    """
+    Add each (entry, sign) to the budgets of its category, one statement per
+    budget period touched. Returns {(budget id, period start): spend}.
+    """
+    by_category = defaultdict(list)
+    for budget in budgets:
+        by_category[budget.category].append(budget)
+
+    deltas = defaultdict(lambda: [0, 0])
+    for entry, sign in entries:
+        for budget in by_category[entry.category]:
+            delta = deltas[(budget.id, period_start(entry.date, budget.period))]
+            delta[0] += sign * entry.amount
+            delta[1] += sign
+    return {
+        key: apply_budget_delta(db, *key, amount, count)
+        for key, (amount, count) in deltas.items()
+        if amount or count
+    }
+
+
+def apply_entry_budgets(
+    db: Session,
+    expense: Expense,
+    previous: BudgetEntry | None = None,
+    removed: bool = False,
+) -> list[OverBudget]:
+    """
+    Record a created, updated or deleted expense in the spend of the budgets
+    of its category, and return the budgets the expense's periods are now
+    over, from the spend the updates returned.
+
+    Args:
+        expense: the expense after the change
+        previous: budget_entry of the expense before an update
+        removed: True when the expense is being deleted
+    """
+    if expense.date is None:
+        # let the column default fill the date
+        db.flush()
+
+    entry = budget_entry(expense)
+    entries = [(entry, -1 if removed else 1)]
+    if previous is not None:
+        entries.append((previous, -1))
+    budgets = _user_budgets(db, entry.user_id, {change.category for change, _ in entries})
+    if not budgets:
+        return []
+
+    spend = _apply(db, budgets, entries)
+    if removed:
+        return []
+    over = []
+    for budget in budgets:
+        if budget.category != entry.category:
+            continue
+        start = period_start(entry.date, budget.period)
+        spent = spend.get((budget.id, start))
+        if spent is not None and spent > budget.limit:
+            over.append(OverBudget(budget, start, spent))
+    return over
+
+
+def apply_bulk_budgets(db: Session, user_id: int, entries: list[BudgetEntry]):
+    """
+    Record a batch of new expenses of one user, one lookup for their budgets
+    """
+    budgets = _user_budgets(db, user_id, {entry.category for entry in entries})
+    if budgets:
+        _apply(db, budgets, ((entry, 1) for entry in entries))
+
+
+def rebuild_budget_spend(db: Session, budget: Budget, since: date):
+    """
+    Recompute the spend of a budget for the periods from the one of `since`
+    on, from the expenses table
+    """
+    start = period_start(since, budget.period)
+    db.execute(
+        delete(BudgetSpend).where(
+            BudgetSpend.budget_id == budget.id, BudgetSpend.period_start >= start
+        )
+    )
+    rows = db.execute(
+        select(Expense.category, Expense.date, Expense.amount).where(
+            Expense.user_id == budget.user_id,
+            Expense.category == budget.category,
+            Expense.date >= datetime.combine(start, time.min),
+        )
+    )
+    _apply(
+        db,
+        [budget],
+        ((BudgetEntry(budget.user_id, *row), 1) for row in rows),
+    )
@@ -0,0 +1,35 @@
+"""
+Bulk ingestion utilities
+"""
+
+from typing import Any
+from pydantic import BaseModel, ValidationError
+from app.schema.base import BulkRowError
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    One-line summary of a pydantic validation error
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in error.errors(include_url=False)
+    )
+
+
+def validate_rows(
+    rows: list[dict[str, Any]], schema: type[BaseModel]
+) -> tuple[list[tuple[int, BaseModel]], list[BulkRowError]]:
+    """
+    Validate every row against a schema in a single pass
+    Return:
+        (index, model) of the valid rows and the errors of the others
+    """
+    valid = []
+    errors = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, schema.model_validate(row)))
+        except ValidationError as e:
+            errors.append(BulkRowError(index=index, error=format_validation_error(e)))
+    return valid, errors
@@ -0,0 +1,31 @@
+"""
+CSV export utilities
+"""
+
+import csv
+import io
+from typing import Iterable, Iterator, Sequence
+
+
+def iter_csv(
+    header: Sequence[str], rows: Iterable[Sequence], batch_size: int = 1000
+) -> Iterator[str]:
+    """
+    Encode rows as CSV text, yielding one chunk per batch_size rows so the
+    whole export is never held in memory
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue()
@@ -0,0 +1,102 @@
+"""
+Fast JSON path for list endpoints
+
+Selecting only the columns behind a response schema returns plain row
+tuples, which are encoded straight to bytes by orjson instead of building
+ORM objects and validating them through the response_model. The body is
+the same as FastAPI renders for the schema: keys in field order, Decimals
+as strings, datetimes in ISO 8601 with "Z" for UTC.
+
+That only holds for rows the schema would accept unchanged. A page with a
+None in a required field, or columns other than the schema's, and every
+page of a schema with fields that validation may reject or convert (e.g.
+EmailStr, enums), goes through the schema as a list TypeAdapter, which
+fails or renders exactly as the response_model would.
+"""
+
+import functools
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+import orjson
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# field types whose column values orjson encodes as the schema renders them
+PLAIN_TYPES = (int, str, bool, Decimal, datetime, date)
+
+
+def response_columns(model, schema) -> tuple:
+    """
+    Columns of `model` for the fields of `schema`, in field order
+    """
+    return tuple(getattr(model, name) for name in schema.model_fields)
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content) -> bytes:
+    """
+    Encode like a pydantic model in json mode
+    """
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+@functools.cache
+def _list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+@functools.cache
+def _not_null_positions(schema) -> tuple[int, ...] | None:
+    """
+    Positions of the fields of `schema` that do not accept None, or None
+    when a field is not of a plain type and every row needs validating
+    """
+    positions = []
+    for position, field in enumerate(schema.model_fields.values()):
+        types = typing.get_args(field.annotation) or (field.annotation,)
+        if not all(type_ in PLAIN_TYPES or type_ is type(None) for type_ in types):
+            return None
+        if type(None) not in types:
+            positions.append(position)
+    return tuple(positions)
+
+
+def _encodable(rows, schema) -> bool:
+    """
+    Whether the rows encode as the response_model would render them
+    """
+    positions = _not_null_positions(schema)
+    if positions is None:
+        return False
+    if not rows:
+        return True
+    if rows[0]._fields != tuple(schema.model_fields):
+        return False
+    return not any(row[position] is None for row in rows for position in positions)
+
+
+def paginated_json(message: str, rows, next_cursor: str | None, schema) -> Response:
+    """
+    PaginatedResponse body of rows selected with response_columns(model, schema)
+    """
+    if _encodable(rows, schema):
+        fields = rows[0]._fields if rows else ()
+        data = [dict(zip(fields, row)) for row in rows]
+    else:
+        adapter = _list_adapter(schema)
+        data = adapter.dump_python(
+            adapter.validate_python([row._asdict() for row in rows]), mode="json"
+        )
+    content = {
+        "success": True,
+        "message": message,
+        "data": data,
+        "next_cursor": next_cursor,
+    }
+    return Response(content=dumps(content), media_type="application/json")
@@ -0,0 +1,129 @@
+"""
+Password hashing on a dedicated, bounded process pool
+
+argon2 is deliberately slow. Hashing on the request threads lets a burst of
+logins occupy the whole anyio thread pool and stall every other sync route,
+so the async entry points, used by login, signup and password changes, run
+hashes in worker processes without holding a thread. Callers beyond max_pending are turned
+away with PasswordHasherBusyError (503) instead of queueing.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+@functools.cache
+def get_pwd_context():
+    """
+    The passlib context, built on first use so passlib and its argon2 and
+    bcrypt backends stay out of the app's import
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+
+
+class PasswordHasherBusyError(Exception):
+    pass
+
+
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Run password hashes on a process pool with a bound on pending jobs.
+
+    The sync entry points hash inline on the calling thread, which would
+    otherwise just block on the pool's result; workers=0 does the same for
+    the async ones, in the threadpool. Both are subject to the bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _acquire(self):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise PasswordHasherBusyError("Too many password operations in progress")
+            self.pending += 1
+
+    def _release(self):
+        with self._lock:
+            self.pending -= 1
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking a threaded server process is not safe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _reset(self):
+        logger.error("Password hashing pool broke, restarting it")
+        with self._lock:
+            self._pool = None
+
+    def _run(self, fn, *args):
+        self._acquire()
+        try:
+            return fn(*args)
+        finally:
+            self._release()
+
+    async def _run_async(self, fn, *args):
+        self._acquire()
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            return await asyncio.wrap_future(self._executor().submit(fn, *args))
+        except BrokenProcessPool:
+            self._reset()
+            raise
+        finally:
+            self._release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run_async(_verify, plain_password, hashed_password)
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
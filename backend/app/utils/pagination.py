@@ -0,0 +1,59 @@
+"""
+Keyset (cursor) pagination utilities
+"""
+
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import tuple_
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(date: datetime, row_id: int) -> str:
+    """
+    Encode the (date, id) of the last row of a page into an opaque token
+    """
+    payload = json.dumps([date.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a token produced by encode_cursor back into (date, id)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(date), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def paginate(query, date_column, id_column, skip: int, limit: int, cursor: str | None):
+    """
+    Order a query newest first and apply either the cursor or the offset.
+
+    With a cursor the page is an index seek on (user_id, date DESC, id DESC)
+    so its cost does not grow with the page depth; skip is kept for
+    backwards compatibility when no cursor is given.
+    """
+    query = query.order_by(date_column.desc(), id_column.desc())
+    if cursor:
+        date, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(date_column, id_column) < (date, row_id))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def next_cursor(rows, limit: int, date_attr: str = "date") -> str | None:
+    """
+    Cursor for the page after `rows`, or None when this was the last page
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, date_attr), last.id)
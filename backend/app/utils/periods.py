@@ -0,0 +1,39 @@
+"""
+Date range and month bucketing helpers for queries
+"""
+
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import Date, Integer, cast
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+
+def in_date_range(query, column, start: date | None, end: date | None):
+    """
+    Filter on start <= column < day after end, in SQL
+    """
+    if start is not None:
+        query = query.where(column >= datetime.combine(start, time.min))
+    if end is not None:
+        query = query.where(column < datetime.combine(end + timedelta(days=1), time.min))
+    return query
+
+
+def month_column(db: Session, column):
+    """
+    First day of the month of a timestamp column, date_trunc on PostgreSQL
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.date_trunc("month", column), Date)
+    return func.date(column, "start of month")
+
+
+def day_number(db: Session, column):
+    """
+    Days from 1970-01-01 to a timestamp column, as an integer
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.floor(func.extract("epoch", column) / 86400), Integer)
+    # 2440587.5 is the Julian day of 1970-01-01 00:00; CAST truncates, which
+    # only differs from floor before 1970 (floor needs SQLite's math functions)
+    return cast(func.julianday(column) - 2440587.5, Integer)
@@ -0,0 +1,122 @@
+"""
+Authenticated principal cache, saves the users SELECT on every request
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from app.core.config import settings
+from app.core.permissions import role_mask
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The fields of the authenticated user that authorization needs"""
+
+    id: int
+    role: str
+    email: str
+    is_active: bool
+    permissions: int | None = None
+    token_version: int = 0
+
+    def __post_init__(self):
+        if self.permissions is None:
+            object.__setattr__(self, "permissions", role_mask(self.role))
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            role=user.role,
+            email=user.email,
+            is_active=user.is_active,
+            token_version=user.token_version or 0,
+        )
+
+    @classmethod
+    def from_claims(cls, user_id: int, payload: dict) -> "Principal":
+        """
+        The principal an access token vouches for. Deactivation revokes
+        tokens, so a token that passed the version check is active
+        """
+        return cls(
+            id=user_id,
+            role=payload.get("role", ""),
+            email=payload.get("email", ""),
+            is_active=True,
+            permissions=payload["perms"],
+            token_version=payload["ver"],
+        )
+
+
+class PrincipalCache:
+    """
+    Bounded TTL + LRU cache of principals keyed by user id.
+
+    Entries are dropped explicitly when a user is changed, and expire after
+    ttl seconds so workers that missed the invalidation converge. Loads that
+    raced with an invalidation are not stored (see generation).
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Principal | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, principal: Principal, generation: int | None = None):
+        """
+        Store a principal loaded when the cache was at generation
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[principal.id] = (self._clock() + self.ttl, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self.generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl_seconds
+)
+
+
+def invalidate_principal(user_id: int):
+    """
+    Drop a user's cached principal after changing or deleting the user
+    """
+    principal_cache.invalidate(user_id)
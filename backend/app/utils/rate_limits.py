@@ -1,12 +1,156 @@
+import functools
+import inspect
 import os
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.utils.auth import decode_access_token
+
+
+def client_ip(request: Request) -> str:
+    """Rate limit key of the client address"""
+    host = request.client.host if request.client else None
+    return "ip:" + (host or "127.0.0.1")
+
+
+def token_subject(request: Request) -> str | None:
+    """Key of the bearer token subject, None for anonymous requests"""
+    authorization = request.headers.get("authorization")
+    if authorization and authorization.startswith("Bearer "):
+        try:
+            return "user:" + decode_access_token(authorization[7:])["sub"]
+        except HTTPException:
+            pass
+    return None
+
+
+def user_or_ip(request: Request) -> str:
+    """
+    Rate limit key of the token subject for authenticated requests, so users
+    behind one NAT do not share a budget, and of the client address otherwise
+    """
+    return token_subject(request) or client_ip(request)
+
+
+class RateLimiter:
+    """
+    Limits counted in the configured limits storage, shared by the workers
+    when the storage is. limits and the storage are imported on the first
+    check rather than with the app.
+    """
+
+    def __init__(self, storage_uri: str, strategy: str, key_prefix: str = "pft"):
+        self.storage_uri = storage_uri
+        self.strategy_name = strategy
+        self.key_prefix = key_prefix
+        self.enabled = True
+        self._strategy = None
+
+    @property
+    def strategy(self):
+        if self._strategy is None:
+            from limits.storage import storage_from_string
+            from limits.strategies import STRATEGIES
+            from app.utils import rate_limit_storage  # noqa: F401 registers sqlite://
+
+            self._strategy = STRATEGIES[self.strategy_name](
+                storage_from_string(self.storage_uri)
+            )
+        return self._strategy
+
+    @property
+    def storage(self):
+        return self.strategy.storage
+
+    def check(self, items, *identifiers: str):
+        """
+        Count a hit against every limit, 429 once one is exhausted
+        """
+        for item in items:
+            if not self.strategy.hit(item, self.key_prefix, *identifiers):
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=f"Rate limit exceeded: {item}",
+                    headers={"Retry-After": str(item.get_expiry())},
+                )
+
+    def limit(self, limit_value: str, key_func=user_or_ip):
+        """
+        Route decorator applying `limit_value` (e.g. "5/minute") per key; the
+        route must take a `request: Request` parameter. The check of an async
+        route runs in the threadpool, the storage may wait on a lock.
+        """
+
+        def decorator(endpoint):
+            scope = f"{endpoint.__module__}.{endpoint.__name__}"
+
+            @functools.cache
+            def items():
+                from limits import parse_many
+
+                return parse_many(limit_value)
+
+            def check(request: Request):
+                if self.enabled:
+                    self.check(items(), scope, key_func(request))
+
+            if inspect.iscoroutinefunction(endpoint):
+
+                @functools.wraps(endpoint)
+                async def wrapper(*args, **kwargs):
+                    await run_in_threadpool(check, kwargs["request"])
+                    return await endpoint(*args, **kwargs)
+
+            else:
+
+                @functools.wraps(endpoint)
+                def wrapper(*args, **kwargs):
+                    check(kwargs["request"])
+                    return endpoint(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def reset(self):
+        """Clear every counter"""
+        if self._strategy is not None:
+            self.storage.reset()
+
+
+# Route limits (@limiter.limit), counted in the configured storage so they
+# hold across workers when it is shared
+limiter = RateLimiter(
+    settings.rate_limit_storage_uri, settings.rate_limit_strategy, key_prefix="pft"
+)
 
 # During pytest runs the client reuses the same remote address which can
 # hit rate limits across test cases. Detect pytest and relax limits to
 # avoid flaky 429 responses in tests.
 if os.getenv("PYTEST_CURRENT_TEST") or os.getenv("TESTING"):
-    limiter = Limiter(key_func=get_remote_address, default_limits=["10000/minute"])
+    default_limit_value = "10000/minute"
 else:
-    limiter = Limiter(key_func=get_remote_address)
+    default_limit_value = settings.rate_limit_default
+
+# parsed on the first request, a list of limits once set
+default_limits = None
+
+default_limiter = RateLimiter(
+    settings.rate_limit_storage_uri, settings.rate_limit_strategy, key_prefix="pft"
+)
+
+
+def rate_limit_default(request: Request):
+    """
+    App-wide dependency applying the default limits per user or IP. A plain
+    def so FastAPI runs it in the threadpool: the check may wait on the
+    storage's lock and the token is decoded synchronously.
+    """
+    global default_limits
+    if default_limits is None:
+        from limits import parse_many
+
+        default_limits = parse_many(default_limit_value) if default_limit_value else []
+    if default_limits and limiter.enabled:
+        default_limiter.check(default_limits, user_or_ip(request))
@@ -0,0 +1,63 @@
+"""
+Recurring rule occurrence dates
+"""
+
+import calendar
+from datetime import date, datetime, timedelta
+
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+YEARLY = "yearly"
+
+
+def utc_today() -> date:
+    return datetime.utcnow().date()
+
+
+def add_months(start: date, months: int) -> date:
+    """
+    `start` moved by `months` months, on the same day or the month's last
+    day when it is shorter (Jan 31 + 1 month is Feb 28 or 29)
+    """
+    year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+    day = min(start.day, calendar.monthrange(year, month + 1)[1])
+    return date(year, month + 1, day)
+
+
+def following(current: date, start: date, interval: str, every: int) -> date:
+    """
+    The occurrence after `current` of a rule starting on `start`. Months
+    are counted from `start` so a rule on the 31st returns to the 31st
+    after a shorter month instead of drifting to the 28th.
+    """
+    if interval == DAILY:
+        return current + timedelta(days=every)
+    if interval == WEEKLY:
+        return current + timedelta(weeks=every)
+    step = every * 12 if interval == YEARLY else every
+    elapsed = (current.year - start.year) * 12 + current.month - start.month
+    return add_months(start, elapsed + step)
+
+
+def due_dates(
+    next_due: date,
+    until: date,
+    start: date,
+    interval: str,
+    every: int,
+    end: date | None = None,
+) -> tuple[list[date], date]:
+    """
+    Occurrences from `next_due` through `until` (and `end`, if set), and
+    the occurrence after the last of them, the rule's new watermark
+    """
+    if end is not None:
+        until = min(until, end)
+    dates = []
+    current = next_due
+    while current <= until:
+        dates.append(current)
+        current = following(current, start, interval, every)
+    return dates, current
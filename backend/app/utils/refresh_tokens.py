@@ -0,0 +1,119 @@
+"""
+Refresh token primitives and the in-memory front of the revocation store
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from app.core.config import settings
+from app.models import RevokedRefreshToken
+from app.utils.bloom import BloomFilter
+
+
+def new_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    SHA-256 hex of a refresh token. Tokens are 256 random bits, so unlike a
+    password they need no slow hash
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RevocationFilter:
+    """
+    Bloom filter of revoked refresh token hashes in front of
+    revoked_refresh_tokens.
+
+    A token that is not live is only looked up in the revocation store when
+    the filter may contain it, so garbage and long expired tokens cost no
+    second query. Hits are always confirmed in the store. The filter pulls
+    revocations made by other workers at most every sync_seconds, a replay
+    arriving before that is still rejected, only its family survives.
+
+    A bloom filter cannot forget, so every rebuild_seconds it is replaced by
+    one built from the revocations that have not expired yet, dropping the
+    ones pruned from the store since.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100000,
+        sync_seconds: float = 30,
+        error_rate: float = 0.01,
+        clock=time.monotonic,
+        rebuild_seconds: float = 3600,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._filter = BloomFilter(capacity, error_rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._synced_at: float | None = None
+        self._rebuilt_at: float | None = None
+        self._watermark: datetime | None = None
+
+    def _load(self, db, bloom: BloomFilter, since: datetime | None):
+        now = datetime.now(timezone.utc)
+        query = select(RevokedRefreshToken.token_hash).where(
+            RevokedRefreshToken.expires_at > now
+        )
+        if since is not None:
+            query = query.where(RevokedRefreshToken.revoked_at >= since)
+        for (token_hash,) in db.execute(query):
+            bloom.add(bytes.fromhex(token_hash))
+        # overlap a little so commits racing this query are not missed
+        self._watermark = now - timedelta(seconds=5)
+        self._synced_at = self._clock()
+
+    def _rebuild(self, db):
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        self._load(db, bloom, None)
+        self._filter = bloom
+        self._rebuilt_at = self._synced_at
+
+    def sync(self, db):
+        """
+        Add revocations recorded in the store since the last sync, or
+        rebuild the filter when it is due
+        """
+        with self._lock:
+            now = self._clock()
+            if self._rebuilt_at is None or now - self._rebuilt_at >= self.rebuild_seconds:
+                self._rebuild(db)
+            elif now - self._synced_at >= self.sync_seconds:
+                self._load(db, self._filter, self._watermark)
+
+    def rebuild(self, db):
+        """
+        Replace the filter with the revocations in the store now
+        """
+        with self._lock:
+            self._rebuild(db)
+
+    def add(self, token_hash: str):
+        self._filter.add(bytes.fromhex(token_hash))
+
+    def might_contain(self, token_hash: str) -> bool:
+        return bytes.fromhex(token_hash) in self._filter
+
+    def clear(self):
+        with self._lock:
+            self._filter.clear()
+            self._synced_at = None
+            self._rebuilt_at = None
+            self._watermark = None
+
+
+revoked_refresh_tokens = RevocationFilter(
+    capacity=settings.refresh_revocation_filter_capacity,
+    sync_seconds=settings.refresh_revocation_sync_seconds,
+    rebuild_seconds=settings.refresh_revocation_prune_seconds,
+)
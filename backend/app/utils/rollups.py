@@ -0,0 +1,146 @@
+"""
+Monthly per-category rollup utilities
+"""
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+from sqlalchemy import delete, insert, literal, select, update, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import Expense, Income, MonthlyRollup
+from app.utils.periods import month_column
+
+
+INCOME = "income"
+EXPENSE = "expense"
+
+
+class RollupKey(NamedTuple):
+    user_id: int
+    month: date
+    kind: str
+    category: str
+
+
+def month_start(value) -> date:
+    """
+    First day of the month of a date or datetime
+    """
+    return date(value.year, value.month, 1)
+
+
+def rollup_key(entry) -> RollupKey:
+    """
+    Bucket an expense or income falls into
+    """
+    if isinstance(entry, Expense):
+        return RollupKey(entry.user_id, month_start(entry.date), EXPENSE, entry.category)
+    return RollupKey(entry.user_id, month_start(entry.date), INCOME, entry.source)
+
+
+def apply_rollup_delta(db: Session, key: RollupKey, amount, count: int = 0):
+    """
+    Add amount and count to a rollup bucket, creating it on first use.
+
+    Callers hold the user's row lock, so the UPDATE-then-INSERT cannot race
+    with another writer for the same bucket.
+    """
+    if not amount and not count:
+        return
+
+    result = db.execute(
+        update(MonthlyRollup)
+        .where(
+            MonthlyRollup.user_id == key.user_id,
+            MonthlyRollup.month == key.month,
+            MonthlyRollup.kind == key.kind,
+            MonthlyRollup.category == key.category,
+        )
+        .values(total=MonthlyRollup.total + amount, count=MonthlyRollup.count + count)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.execute(
+            insert(MonthlyRollup).values(**key._asdict(), total=amount, count=count)
+        )
+
+
+def apply_entry_rollup(
+    db: Session,
+    entry,
+    previous: tuple[RollupKey, Decimal] | None = None,
+    removed: bool = False,
+):
+    """
+    Record a created, updated or deleted expense or income in the rollups.
+
+    Args:
+        entry: the expense or income after the change
+        previous: (rollup_key, amount) of the entry before an update
+        removed: True when the entry is being deleted
+    """
+    if entry.date is None:
+        # let the column default fill the date
+        db.flush()
+
+    key = rollup_key(entry)
+    if removed:
+        apply_rollup_delta(db, key, -entry.amount, -1)
+    elif previous is None:
+        apply_rollup_delta(db, key, entry.amount, 1)
+    elif previous[0] == key:
+        apply_rollup_delta(db, key, entry.amount - previous[1])
+    else:
+        apply_rollup_delta(db, previous[0], -previous[1], -1)
+        apply_rollup_delta(db, key, entry.amount, 1)
+
+
+def apply_bulk_rollup(db: Session, entries: Iterable[tuple[RollupKey, Decimal]]):
+    """
+    Record a batch of new entries, one statement per bucket touched
+    """
+    buckets = defaultdict(lambda: [0, 0])
+    for key, amount in entries:
+        bucket = buckets[key]
+        bucket[0] += amount
+        bucket[1] += 1
+    for key, (amount, count) in buckets.items():
+        apply_rollup_delta(db, key, amount, count)
+
+
+def rebuild_monthly_rollups(db: Session, user_ids: list[int] | None = None) -> int:
+    """
+    Recompute rollup rows from the expenses and incomes tables
+    """
+    selects = []
+    for model, kind, category in (
+        (Expense, EXPENSE, Expense.category),
+        (Income, INCOME, Income.source),
+    ):
+        month = month_column(db, model.date)
+        query = select(
+            model.user_id,
+            month,
+            literal(kind),
+            category,
+            func.sum(model.amount),
+            func.count(model.id),
+        ).group_by(model.user_id, month, category)
+        if user_ids is not None:
+            query = query.where(model.user_id.in_(user_ids))
+        selects.append(query)
+
+    clear = delete(MonthlyRollup)
+    if user_ids is not None:
+        clear = clear.where(MonthlyRollup.user_id.in_(user_ids))
+    db.execute(clear)
+    result = db.execute(
+        insert(MonthlyRollup).from_select(
+            ["user_id", "month", "kind", "category", "total", "count"],
+            union_all(*selects),
+        )
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,71 @@
+"""
+Verified JWT cache, saves re-verifying the signature of a reused token
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from app.core.config import settings
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified token payloads keyed by the SHA-256 of the
+    token, so raw tokens are never kept in memory. Each entry is dropped at
+    the token's own exp.
+    """
+
+    def __init__(self, maxsize: int = 10000, clock=time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        A copy of the verified payload, None when unknown or expired
+        """
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, token: str, payload: dict):
+        """
+        Store a payload whose signature and claims were just verified
+        """
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or exp is None:
+            return
+        key = self.key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+verified_tokens = VerifiedTokenCache(maxsize=settings.token_cache_size)
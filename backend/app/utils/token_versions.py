@@ -0,0 +1,106 @@
+"""
+Access token versions, refuse tokens issued before a role or status change
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import TokenRevocation, User
+
+
+class TokenVersions:
+    """
+    Lowest accepted token version of every user whose tokens were revoked.
+
+    Read-only requests authorize from token claims alone, so this map is
+    what stops a demoted or deactivated user's old tokens. It is pulled
+    from token_revocations at most every sync_seconds, the same staleness
+    the principal cache allows.
+    """
+
+    def __init__(self, sync_seconds: float = 30, clock=time.monotonic):
+        self.sync_seconds = sync_seconds
+        self._clock = clock
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._synced_at: float | None = None
+        self._watermark: datetime | None = None
+
+    def due(self) -> bool:
+        return (
+            self._synced_at is None
+            or self._clock() - self._synced_at >= self.sync_seconds
+        )
+
+    def sync(self, db: Session):
+        """
+        Pull revocations recorded since the last sync
+        """
+        if not self.due():
+            return
+        with self._lock:
+            if not self.due():
+                return
+            now = datetime.now(timezone.utc)
+            query = select(TokenRevocation.user_id, TokenRevocation.token_version)
+            if self._watermark is not None:
+                query = query.where(TokenRevocation.revoked_at >= self._watermark)
+            for user_id, version in db.execute(query):
+                if version > self._versions.get(user_id, 0):
+                    self._versions[user_id] = version
+            # overlap a little so commits racing this query are not missed
+            self._watermark = now - timedelta(seconds=5)
+            self._synced_at = self._clock()
+
+    def record(self, user_id: int, version: int):
+        with self._lock:
+            if version > self._versions.get(user_id, 0):
+                self._versions[user_id] = version
+
+    def is_current(self, user_id: int, version: int) -> bool:
+        return version >= self._versions.get(user_id, 0)
+
+    def clear(self):
+        with self._lock:
+            self._versions.clear()
+            self._synced_at = None
+            self._watermark = None
+
+
+token_versions = TokenVersions(sync_seconds=settings.principal_cache_ttl_seconds)
+
+
+def revoke_user_tokens(db: Session, user_id: int, commit: bool = True) -> int | None:
+    """
+    Bump a user's token version so every access token issued before is
+    refused. Returns the new version, None for an unknown user. With
+    commit=False the caller commits and then calls token_versions.record.
+    """
+    version = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+    ).scalar_one_or_none()
+    if version is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    result = db.execute(
+        update(TokenRevocation)
+        .where(TokenRevocation.user_id == user_id)
+        .values(token_version=version, revoked_at=now)
+    )
+    if result.rowcount == 0:
+        db.execute(
+            insert(TokenRevocation).values(
+                user_id=user_id, token_version=version, revoked_at=now
+            )
+        )
+    if commit:
+        db.commit()
+        token_versions.record(user_id, version)
+    return version
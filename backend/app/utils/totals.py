@@ -0,0 +1,112 @@
+"""
+Running per-user totals utilities
+"""
+
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import User, Income, Expense, Savings, UserTotals
+
+
+TOTALS_COLUMNS = [
+    "user_id",
+    "total_income",
+    "total_expense",
+    "total_savings",
+    "income_count",
+    "expense_count",
+    "savings_count",
+]
+
+
+def _sum_and_count(model):
+    total = (
+        select(func.coalesce(func.sum(model.amount), 0))
+        .where(model.user_id == User.id)
+        .scalar_subquery()
+    )
+    count = select(func.count(model.id)).where(model.user_id == User.id).scalar_subquery()
+    return total, count
+
+
+def totals_select(user_ids: list[int] | None = None):
+    """
+    SELECT computing the totals row of each user from the source tables
+    """
+    total_income, income_count = _sum_and_count(Income)
+    total_expense, expense_count = _sum_and_count(Expense)
+    total_savings, savings_count = _sum_and_count(Savings)
+    query = select(
+        User.id,
+        total_income,
+        total_expense,
+        total_savings,
+        income_count,
+        expense_count,
+        savings_count,
+    )
+    if user_ids is not None:
+        query = query.where(User.id.in_(user_ids))
+    return query
+
+
+def apply_totals_delta(
+    db: Session,
+    user_id: int,
+    *,
+    income=0,
+    expense=0,
+    savings=0,
+    income_count: int = 0,
+    expense_count: int = 0,
+    savings_count: int = 0,
+):
+    """
+    Add deltas to a user's totals inside the caller's transaction.
+
+    The increments are a single atomic UPDATE, so concurrent writers do not
+    lose updates. A user without a totals row yet gets one computed from the
+    source tables after flushing the pending change.
+    """
+    deltas = {
+        "total_income": income,
+        "total_expense": expense,
+        "total_savings": savings,
+        "income_count": income_count,
+        "expense_count": expense_count,
+        "savings_count": savings_count,
+    }
+    values = {
+        name: getattr(UserTotals, name) + delta
+        for name, delta in deltas.items()
+        if delta
+    }
+    if not values:
+        return
+
+    result = db.execute(
+        update(UserTotals)
+        .where(UserTotals.user_id == user_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.flush()
+        db.execute(
+            insert(UserTotals).from_select(TOTALS_COLUMNS, totals_select([user_id]))
+        )
+
+
+def rebuild_user_totals(db: Session, user_ids: list[int] | None = None) -> int:
+    """
+    Recompute totals rows from the source tables, for backfills and repairs
+    """
+    clear = delete(UserTotals)
+    if user_ids is not None:
+        clear = clear.where(UserTotals.user_id.in_(user_ids))
+    db.execute(clear)
+    result = db.execute(
+        insert(UserTotals).from_select(TOTALS_COLUMNS, totals_select(user_ids))
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,169 @@
+"""
+Vectorized trend statistics over (day, amount, category) column arrays.
+
+Days are integers counted from 1970-01-01 and categories are indexes into
+a list of labels, so every grouping below is a bincount or a sort over the
+whole history at once rather than a loop over the entries.
+"""
+
+from typing import NamedTuple, Sequence
+import numpy as np
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+class Entries(NamedTuple):
+    """Columns of a user's expenses or incomes"""
+
+    days: np.ndarray
+    amounts: np.ndarray
+    categories: np.ndarray
+    labels: list[str]
+
+
+class Distribution(NamedTuple):
+    """Amount statistics of each group, NaN for empty groups"""
+
+    counts: np.ndarray
+    totals: np.ndarray
+    means: np.ndarray
+    stddevs: np.ndarray
+    # one column per PERCENTILES entry
+    percentiles: np.ndarray
+
+
+def entries_from_rows(rows: Sequence[tuple]) -> Entries:
+    """
+    Column arrays from (day number, amount, category) rows
+    """
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return Entries(empty, np.empty(0), empty, [])
+    days, amounts, categories = zip(*rows)
+    labels, codes = np.unique(np.array(categories, dtype=str), return_inverse=True)
+    return Entries(
+        np.array(days, dtype=np.int64),
+        np.array(amounts, dtype=np.float64),
+        codes.astype(np.int64),
+        labels.tolist(),
+    )
+
+
+def buckets(days: np.ndarray, granularity: str) -> np.ndarray:
+    """
+    First day of the day, week (Monday) or month each day falls in
+    """
+    if granularity == DAY:
+        return days
+    if granularity == WEEK:
+        # 1970-01-01 was a Thursday
+        return days - (days + 3) % 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]")
+    return months.astype("datetime64[D]").astype(np.int64)
+
+
+def period_axis(first: int, last: int, granularity: str) -> np.ndarray:
+    """
+    Every bucket from the one of `first` to the one of `last`, gaps included
+    """
+    if granularity == MONTH:
+        months = np.array([first, last], dtype="datetime64[D]").astype("datetime64[M]")
+        axis = np.arange(months[0], months[1] + 1)
+        return axis.astype("datetime64[D]").astype(np.int64)
+    step = 7 if granularity == WEEK else 1
+    bounds = buckets(np.array([first, last], dtype=np.int64), granularity)
+    return np.arange(bounds[0], bounds[1] + 1, step, dtype=np.int64)
+
+
+def positions(entries: Entries, granularity: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The period axis spanning the entries and the index of each entry on it
+    """
+    if not len(entries.days):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    axis = period_axis(entries.days.min(), entries.days.max(), granularity)
+    return axis, np.searchsorted(axis, buckets(entries.days, granularity))
+
+
+def period_sums(entries: Entries, granularity: str):
+    """
+    Period axis, total and count of the entries per period
+    """
+    axis, index = positions(entries, granularity)
+    totals = np.bincount(index, weights=entries.amounts, minlength=len(axis))
+    counts = np.bincount(index, minlength=len(axis))
+    return axis, totals, counts
+
+
+def category_period_sums(entries: Entries, granularity: str):
+    """
+    Period axis and a (category, period) matrix of totals
+    """
+    axis, index = positions(entries, granularity)
+    size = len(entries.labels) * len(axis)
+    totals = np.bincount(
+        entries.categories * len(axis) + index, weights=entries.amounts, minlength=size
+    )
+    return axis, totals.reshape(len(entries.labels), len(axis))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Mean of each value and the window - 1 before it, fewer at the start
+    """
+    sums = np.cumsum(values, dtype=np.float64)
+    windowed = sums.copy()
+    windowed[window:] -= sums[:-window]
+    return windowed / np.minimum(np.arange(1, len(values) + 1), window)
+
+
+def distribution(amounts: np.ndarray, groups: np.ndarray, size: int) -> Distribution:
+    """
+    Count, total, mean, standard deviation and PERCENTILES of the amounts of
+    each of `size` groups. Percentiles interpolate linearly, as
+    numpy.percentile does.
+    """
+    counts = np.bincount(groups, minlength=size)
+    totals = np.bincount(groups, weights=amounts, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = totals / counts
+        deviations = amounts - means[groups]
+        stddevs = np.sqrt(np.bincount(groups, weights=deviations * deviations, minlength=size) / counts)
+
+    # amounts sorted by group then amount, each group a contiguous run
+    ordered = amounts[np.lexsort((amounts, groups))]
+    starts = np.cumsum(counts) - counts
+    percentiles = np.full((size, len(PERCENTILES)), np.nan)
+    filled = counts > 0
+    rank = (counts[filled, None] - 1) * (np.array(PERCENTILES) / 100)
+    lower = np.floor(rank).astype(np.int64)
+    upper = np.minimum(lower + 1, counts[filled, None] - 1)
+    below = ordered[starts[filled, None] + lower]
+    above = ordered[starts[filled, None] + upper]
+    percentiles[filled] = below + (rank - lower) * (above - below)
+    return Distribution(counts, totals, means, stddevs, percentiles)
+
+
+def month_over_month(monthly: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Change of each month from the one before along the last axis, and that
+    change relative to the previous month; NaN for the first month and
+    relative changes from zero
+    """
+    previous = np.full(monthly.shape, np.nan)
+    previous[..., 1:] = monthly[..., :-1]
+    deltas = monthly - previous
+    with np.errstate(invalid="ignore", divide="ignore"):
+        relative = np.where(previous != 0, deltas / previous, np.nan)
+    return deltas, relative
+
+
+def day_dates(days: np.ndarray) -> list:
+    """
+    datetime.date of each day number
+    """
+    return days.astype("datetime64[D]").tolist()
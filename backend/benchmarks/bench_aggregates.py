@@ -0,0 +1,138 @@
+"""
+Latency and memory of the expense/income aggregates, Python versus SQL.
+
+Seeds an in-memory SQLite database with --rows expenses and --rows incomes
+of one user, spread over ten years. "python" is the former route code:
+load every row as an ORM object with .all(), then calculate_total_expenses
+and filter_expenses_by_category, and average/max/min_income and
+group_incomes_by_month. "sql" answers the same questions with
+amount_stats_service (overall and for one category) and
+monthly_amounts_service. Reports the best time of --number runs and the
+peak Python memory of one run (tracemalloc; SQLite's own cache is not
+counted). The python path is skipped above --python-max-rows: at 1M rows
+it needs more than 6 GB.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_aggregates --rows 10000,100000,1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base
+from app.models import Expense, Income, User
+from app.services.stats_service import amount_stats_service, monthly_amounts_service
+from app.utils.expense import calculate_total_expenses, filter_expenses_by_category
+from app.utils.income import (
+    average_income,
+    group_incomes_by_month,
+    max_income,
+    min_income,
+)
+
+BATCH = 50_000
+CATEGORIES = ("Food", "Rent", "Travel", "Health")
+
+
+def seed(db: Session, rows: int):
+    user = User(
+        id=1,
+        email="bench@example.com",
+        password="x",
+        first_name="Bench",
+        last_name="User",
+        role="user",
+        balance=Decimal("0.00"),
+        is_active=True,
+    )
+    db.add(user)
+    db.flush()
+    start = datetime(2016, 1, 1)
+    step = timedelta(days=3650) / rows
+    for model, label in ((Expense, "category"), (Income, "source")):
+        for first in range(0, rows, BATCH):
+            db.execute(
+                insert(model),
+                [
+                    {
+                        "amount": Decimal(index % 5000) / 100 + 1,
+                        label: CATEGORIES[index % 4],
+                        "date": start + step * index,
+                        "created_at": start,
+                        "updated_at": start,
+                        "user_id": 1,
+                    }
+                    for index in range(first, min(first + BATCH, rows))
+                ],
+            )
+    db.commit()
+
+
+def python_path(db: Session, user: User):
+    expenses = db.query(Expense).filter(Expense.user_id == user.id).all()
+    calculate_total_expenses(expenses)
+    calculate_total_expenses(filter_expenses_by_category(expenses, "Food"))
+    incomes = db.query(Income).filter(Income.user_id == user.id).all()
+    average_income(incomes), max_income(incomes), min_income(incomes)
+    group_incomes_by_month(incomes)
+    db.expunge_all()
+
+
+def sql_path(db: Session, user: User):
+    amount_stats_service(Expense, user, db)
+    amount_stats_service(Expense, user, db, category="Food")
+    amount_stats_service(Income, user, db)
+    monthly_amounts_service(Income, user, db)
+
+
+def measure(function, db: Session, user: User, number: int) -> tuple[float, float]:
+    """Best seconds of `number` runs and peak MB of one traced run"""
+    best = float("inf")
+    for _ in range(number):
+        gc.collect()
+        started = time.perf_counter()
+        function(db, user)
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    function(db, user)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--python-max-rows", type=int, default=250_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} | {'path':>6} | {'best ms':>9} | {'peak MB':>8}")
+    for rows in (int(value) for value in args.rows.split(",")):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed(db, rows)
+            user = db.get(User, 1)
+            for name, function in (("python", python_path), ("sql", sql_path)):
+                if function is python_path and rows > args.python_max_rows:
+                    print(f"{rows:>9} | {name:>6} | {'skipped':>9} |")
+                    continue
+                best, peak = measure(function, db, user, args.number)
+                print(f"{rows:>9} | {name:>6} | {best * 1000:9.1f} | {peak:8.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
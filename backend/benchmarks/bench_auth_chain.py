@@ -0,0 +1,96 @@
+"""
+Microbenchmark of the auth dependency chain with and without the JWT cache.
+
+Times header parsing + decode_access_token + principal lookup + RBAC check,
+i.e. what every protected route runs before its body, with a warm principal
+cache so no database is involved, then with a cold one (in-memory SQLite
+users SELECT). The claims row is a GET with a token that carries permission
+claims, which never looks the principal up.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_auth_chain --number 20000
+"""
+
+import argparse
+import timeit
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.core.permissions import Permission
+from app.db.database import Base
+from app.dependencies.auth import get_current_user
+from app.dependencies.rbac import RBACChecker
+from app.models import User
+from app.utils.auth import access_token_claims, create_access_token
+from app.utils.principal_cache import Principal, principal_cache
+from app.utils.token_cache import verified_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    user = User(
+        id=1,
+        email="bench@example.com",
+        password="x",
+        first_name="Bench",
+        last_name="User",
+        role="user",
+        balance=0,
+        is_active=True,
+        token_version=0,
+    )
+    db.add(user)
+    db.commit()
+    request = Request({"type": "http", "method": "GET", "headers": []})
+
+    token, _ = create_access_token(data={"user_id": "1"})
+    claims_token, _ = create_access_token(data=access_token_claims(user))
+    checker = RBACChecker([Permission.EXPENSE_READ])
+
+    def chain(header):
+        return lambda: checker(
+            get_current_user(request=request, authorization=header, db=db)
+        )
+
+    cache_size = verified_tokens.maxsize
+    ttl = principal_cache.ttl
+    results = {}
+    for label, size, principal_ttl, bearer in (
+        ("without cache", 0, ttl, token),
+        ("with cache", cache_size, ttl, token),
+        ("cold principal", cache_size, 0, token),
+        ("claims", cache_size, 0, claims_token),
+    ):
+        verified_tokens.clear()
+        verified_tokens.maxsize = size
+        principal_cache.ttl = principal_ttl
+        if principal_ttl:
+            principal_cache.set(
+                Principal(id=1, role="user", email="bench@example.com", is_active=True)
+            )
+        else:
+            principal_cache.clear()
+        best = min(
+            timeit.repeat(chain(f"Bearer {bearer}"), number=args.number, repeat=args.repeat)
+        )
+        results[label] = best / args.number * 1e6
+        print(
+            f"{label:>15}: {results[label]:8.2f} us/request "
+            f"(hits={verified_tokens.hits}, misses={verified_tokens.misses})"
+        )
+
+    print(f"token cache speedup: {results['without cache'] / results['with cache']:.1f}x")
+    print(f"claims vs cold principal: {results['cold principal'] / results['claims']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Pages/sec of GET /expenses, ORM objects + response_model versus columns + orjson.
+
+Builds a page of --rows expenses from an in-memory SQLite database the way
+the route does, either loading Expense objects and rendering them through
+FastAPI's response_model serialization and JSONResponse, or selecting the
+ExpenseResponse columns as rows and encoding them with orjson. Both bodies
+are compared byte for byte before timing.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_list_serialization --rows 1000 --number 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.db.database import Base
+from app.models import Expense, User
+from app.routes.expense import EXPENSE_COLUMNS, read_expenses, router
+from app.schema.base import PaginatedResponse
+from app.schema.expense import ExpenseResponse
+from app.services.expense_service import read_all_expense_service
+from app.utils.fast_json import paginated_json
+from app.utils.pagination import next_cursor
+
+MESSAGE = "Expenses retrieved successfully"
+
+
+def seed(db: Session, rows: int) -> User:
+    user = User(
+        id=1,
+        email="bench@example.com",
+        password="x",
+        first_name="Bench",
+        last_name="User",
+        role="user",
+        balance=Decimal("0.00"),
+        is_active=True,
+    )
+    db.add(user)
+    start = datetime(2026, 1, 1)
+    db.execute(
+        insert(Expense),
+        [
+            {
+                "amount": Decimal(index % 5000) / 100,
+                "category": ("Food", "Rent", "Travel", "Café")[index % 4],
+                "date": start + timedelta(minutes=index),
+                "created_at": start,
+                "updated_at": start,
+                "user_id": 1,
+            }
+            for index in range(rows)
+        ],
+    )
+    db.commit()
+    return user
+
+
+async def model_page(db, user, field, rows: int) -> bytes:
+    expenses = read_all_expense_service(user, db, 0, rows)
+    content = PaginatedResponse(
+        message=MESSAGE, data=expenses, next_cursor=next_cursor(expenses, rows)
+    )
+    body = JSONResponse(
+        await serialize_response(field=field, response_content=content)
+    ).body
+    # a request starts with an empty session, as when it is closed
+    db.expunge_all()
+    return body
+
+
+async def fast_page(db, user, field, rows: int) -> bytes:
+    expenses = read_all_expense_service(user, db, 0, rows, columns=EXPENSE_COLUMNS)
+    return paginated_json(
+        MESSAGE, expenses, next_cursor(expenses, rows), ExpenseResponse
+    ).body
+
+
+async def pages_per_second(page, args) -> float:
+    best = 0.0
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        for _ in range(args.number):
+            await page(*args.page_args)
+        best = max(best, args.number / (time.perf_counter() - started))
+    return best
+
+
+async def run(args):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    user = seed(db, args.rows)
+    field = next(
+        route.response_field for route in router.routes if route.endpoint is read_expenses
+    )
+    args.page_args = (db, user, field, args.rows)
+
+    before = await model_page(*args.page_args)
+    after = await fast_page(*args.page_args)
+    assert before == after, "response bodies differ"
+
+    results = {}
+    for name, page in (("response_model", model_page), ("orjson", fast_page)):
+        results[name] = await pages_per_second(page, args)
+        print(
+            f"{name:>14}: {results[name]:8.1f} pages/s "
+            f"({results[name] * args.rows:10.0f} rows/s)"
+        )
+    print(f"speedup: {results['orjson'] / results['response_model']:.1f}x "
+          f"({len(after)} byte pages)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
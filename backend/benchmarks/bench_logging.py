@@ -0,0 +1,126 @@
+"""
+Request latency with logging enabled, synchronous handlers versus the queue.
+
+Drives an in-process app behind RequestIDMiddleware whose route logs
+--lines INFO lines from a service logger, like the app's routes and
+services do, and a warning every 100 requests. "sync" is the former setup
+(text lines written by FileHandler + StreamHandler on the request thread),
+"queue" the QueueHandler/QueueListener JSON pipeline, "queue 10%" the same
+keeping the service chatter of one request in ten. Output goes to a
+temporary file and /dev/null.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_logging --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.middleware.request_id import RequestIDMiddleware
+from benchmarks.bench_middleware import request
+
+service_logger = logging.getLogger("app.services.bench_service")
+
+
+def build_app(lines: int) -> Starlette:
+    served = 0
+
+    async def expenses(request):
+        nonlocal served
+        served += 1
+        for index in range(lines):
+            service_logger.info("Fetching expense %d for user_id: %s", index, 42)
+        if served % 100 == 0:
+            service_logger.warning("Expense %d not found for user_id: %s", served, 42)
+        return JSONResponse({"success": True, "message": "ok", "data": []})
+
+    return Starlette(
+        routes=[Route("/expenses", expenses)],
+        middleware=[Middleware(RequestIDMiddleware)],
+    )
+
+
+def sync_logging(path: str, stream) -> list[logging.Handler]:
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [logging.FileHandler(path), logging.StreamHandler(stream)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        logging.getLogger().addHandler(handler)
+    return handlers
+
+
+async def latencies(app, requests: int, concurrency: int) -> list[float]:
+    remaining = iter(range(requests))
+    timings = []
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            await request(app, "/expenses")
+            timings.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=5)
+    args = parser.parse_args()
+
+    app = build_app(args.lines)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    devnull = open(os.devnull, "w")
+    stdout = sys.stdout
+
+    print(f"{'setup':>10} | {'req/s':>8} | {'p50 us':>8} | {'p99 us':>8} | log bytes")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, rate in (("sync", None), ("queue", 1.0), ("queue 10%", 0.1)):
+            path = os.path.join(directory, name.replace(" ", "-") + ".log")
+            if rate is None:
+                handlers = sync_logging(path, devnull)
+            else:
+                settings.log_file, settings.log_sample_rate = path, rate
+                # the listener's stdout handler binds sys.stdout when created
+                sys.stdout = devnull
+                setup_logging()
+                sys.stdout = stdout
+
+            asyncio.run(latencies(app, args.concurrency, args.concurrency))
+            started = time.perf_counter()
+            timings = asyncio.run(latencies(app, args.requests, args.concurrency))
+            elapsed = time.perf_counter() - started
+
+            if rate is None:
+                for handler in handlers:
+                    root.removeHandler(handler)
+                    handler.close()
+            else:
+                shutdown_logging()
+            quantiles = statistics.quantiles(timings, n=100)
+            print(
+                f"{name:>10} | {args.requests / elapsed:8.0f} | "
+                f"{quantiles[49] * 1e6:8.0f} | {quantiles[98] * 1e6:8.0f} | "
+                f"{os.path.getsize(path)}"
+            )
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
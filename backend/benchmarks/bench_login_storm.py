@@ -0,0 +1,171 @@
+"""
+Login throughput and collateral latency during a login storm.
+
+For each hashing pool size, starts the API on a scratch SQLite database,
+fires a storm of concurrent logins and, at the same time, probes a cheap
+authenticated sync route (GET /api/v1/expenses/). Reports login throughput,
+503 rejections and the probe p50/p99. With PASSWORD_HASH_WORKERS=0 (hashing on
+the request threads) the probes queue behind argon2 in the anyio thread pool.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_login_storm --logins 300 --concurrency 64 --workers 0,2,4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+PASSWORD = "BenchPass123!"
+
+
+def serve(port: int):
+    """Server side: seed one user and run uvicorn with login rate limits off"""
+    import logging
+    import uvicorn
+    from app.db.database import Base, engine, SessionLocal
+    from app.main import app
+    from app.models import User
+    from app.utils.hashing import get_pwd_context
+    from app.utils.rate_limits import limiter
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(
+            User(
+                id=1,
+                email="storm@example.com",
+                password=get_pwd_context().hash(PASSWORD),
+                first_name="Storm",
+                last_name="User",
+                role="user",
+                balance=0,
+            )
+        )
+        db.commit()
+
+    limiter.enabled = False
+    logging.disable(logging.INFO)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def percentile(values, q):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def storm(base_url: str, logins: int, concurrency: int, token: str):
+    """Run the login storm and the probe loop, return the measurements"""
+    statuses = []
+    probes = []
+    done = asyncio.Event()
+    remaining = iter(range(logins))
+    payload = {"email": "storm@example.com", "password": PASSWORD}
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+
+        async def login_worker():
+            for _ in remaining:
+                response = await client.post("/api/v1/auth/login", json=payload)
+                statuses.append(response.status_code)
+
+        async def probe():
+            headers = {"Authorization": f"Bearer {token}"}
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/api/v1/expenses/", headers=headers)
+                probes.append((time.perf_counter() - started) * 1000)
+
+        probe_tasks = [asyncio.create_task(probe()) for _ in range(4)]
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(*probe_tasks)
+
+    return elapsed, statuses, probes
+
+
+def wait_ready(base_url: str, timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(base_url + "/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def run(workers: int, args) -> dict:
+    from app.utils.auth import create_access_token
+
+    port = args.port
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tempfile.mkdtemp()}/bench_login.db",
+        PASSWORD_HASH_WORKERS=str(workers),
+        PASSWORD_HASH_MAX_PENDING=str(args.max_pending),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_login_storm", "--serve", "--port", str(port)],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base_url)
+        token, _ = create_access_token(data={"user_id": "1"})
+        elapsed, statuses, probes = asyncio.run(
+            storm(base_url, args.logins, args.concurrency, token)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    ok = statuses.count(200)
+    return {
+        "workers": workers,
+        "logins/s": ok / elapsed,
+        "503": statuses.count(503),
+        "probe p50 ms": statistics.median(probes) if probes else float("nan"),
+        "probe p99 ms": percentile(probes, 0.99),
+        "probes": len(probes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", default="0,2", help="comma separated pool sizes")
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port)
+        return
+
+    results = [run(int(w), args) for w in args.workers.split(",")]
+    columns = list(results[0])
+    print(" | ".join(f"{c:>12}" for c in columns))
+    for row in results:
+        print(" | ".join(
+            f"{row[c]:>12.1f}" if isinstance(row[c], float) else f"{row[c]:>12}"
+            for c in columns
+        ))
+
+
+if __name__ == "__main__":
+    main()
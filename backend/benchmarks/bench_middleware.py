@@ -0,0 +1,157 @@
+"""
+Requests/sec through the middleware stack, BaseHTTPMiddleware versus pure ASGI.
+
+Drives two otherwise identical apps in-process, without a server or
+client: "before" has the former BaseHTTPMiddleware security headers and DB
+metrics middleware, "after" the pure ASGI security headers, DB metrics,
+timing and request id middleware. Routes: a JSON "/" like the app's, and
+"/stream" streaming --chunks chunks. Requests run --concurrency at a time.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_middleware --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.db.metrics import start_request_stats
+from app.middleware.db_metrics import DBMetricsMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.middleware.security import SecurityHeadersMiddleware
+from app.middleware.timing import TimingMiddleware
+
+
+class BaseHTTPSecurityHeaders(BaseHTTPMiddleware):
+    """The former SecurityHeadersMiddleware"""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        response.headers["Referrer-Policy"] = "no-referrer"
+        return response
+
+
+class BaseHTTPDBMetrics(BaseHTTPMiddleware):
+    """The former DBMetricsMiddleware, without the log line"""
+
+    async def dispatch(self, request, call_next):
+        stats = start_request_stats()
+        response = await call_next(request)
+        response.headers["X-DB-Query-Count"] = str(stats.query_count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.db_time_ms:.2f}"
+        response.headers["X-DB-Pool-Wait-Ms"] = f"{stats.pool_wait_ms:.2f}"
+        return response
+
+
+def build_app(middleware, chunks: int) -> Starlette:
+    async def root(request):
+        return JSONResponse({"message": "Welcome to the Personal Finance Tracker API"})
+
+    async def body():
+        for index in range(chunks):
+            yield b"2026-01-01,expense,Groceries,12.50,%d\n" % index
+
+    async def stream(request):
+        return StreamingResponse(body(), media_type="text/csv")
+
+    return Starlette(
+        routes=[Route("/", root), Route("/stream", stream)],
+        middleware=middleware,
+    )
+
+
+async def request(app, path: str) -> int:
+    """One request straight through the ASGI app, returns the body size"""
+    size = 0
+    pending = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if pending:
+            return pending.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return size
+
+
+async def throughput(app, path: str, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            await request(app, path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=100)
+    args = parser.parse_args()
+
+    stacks = {
+        "before": [
+            Middleware(BaseHTTPDBMetrics),
+            Middleware(BaseHTTPSecurityHeaders),
+        ],
+        "after": [
+            Middleware(RequestIDMiddleware),
+            Middleware(TimingMiddleware),
+            Middleware(DBMetricsMiddleware),
+            Middleware(SecurityHeadersMiddleware),
+        ],
+    }
+    # the request log line would dominate both stacks
+    logging.disable(logging.INFO)
+
+    results = {}
+    for name, middleware in stacks.items():
+        app = build_app(middleware, args.chunks)
+        for path in ("/", "/stream"):
+            asyncio.run(throughput(app, path, args.concurrency, args.concurrency))
+            results[name, path] = asyncio.run(
+                throughput(app, path, args.requests, args.concurrency)
+            )
+
+    print(f"{'path':>8} | {'before req/s':>12} | {'after req/s':>12} | speedup")
+    for path in ("/", "/stream"):
+        before, after = results["before", path], results["after", path]
+        print(f"{path:>8} | {before:12.0f} | {after:12.0f} | {after / before:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
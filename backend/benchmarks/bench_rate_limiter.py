@@ -0,0 +1,94 @@
+"""
+Rate limiter cost per request and correctness across worker processes.
+
+Part one times one limit check (key function + hit) per storage and
+strategy. Part two forks --workers processes that each fire --attempts hits
+at one "5/minute" limit and reports how many got through in total: the
+in-memory storage lets through 5 per worker, a shared storage 5 overall.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_rate_limiter --number 20000 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import timeit
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+from starlette.requests import Request
+
+from app.utils.auth import create_access_token
+from app.utils.rate_limits import user_or_ip
+
+
+def storages(directory: str) -> dict[str, str]:
+    uris = {
+        "memory": "memory://",
+        "sqlite (disk)": f"sqlite:///{directory}/limits.db",
+    }
+    if os.path.isdir("/dev/shm"):
+        uris["sqlite (/dev/shm)"] = f"sqlite:////dev/shm/pft-bench-{os.getpid()}.db"
+    return uris
+
+
+def storm(uri: str, strategy: str, attempts: int) -> int:
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse("5/minute")
+    return sum(limiter.hit(item, "pft", "ip:10.0.0.1") for _ in range(attempts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--attempts", type=int, default=50)
+    args = parser.parse_args()
+
+    token, _ = create_access_token(data={"user_id": "1"})
+    request = Request({
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("10.0.0.1", 1234),
+    })
+    # a limit high enough that every timed hit is accepted and written
+    item = parse(f"{args.number * args.repeat * 2}/minute")
+
+    with tempfile.TemporaryDirectory() as directory:
+        uris = storages(directory)
+        print(f"{'storage':>18} | {'strategy':>22} | us/check")
+        for name, uri in uris.items():
+            for strategy in ("fixed-window", "sliding-window-counter"):
+                limiter = STRATEGIES[strategy](storage_from_string(uri))
+
+                def check():
+                    limiter.hit(item, "pft", user_or_ip(request))
+
+                best = min(timeit.repeat(check, number=args.number, repeat=args.repeat))
+                print(f"{name:>18} | {strategy:>22} | {best / args.number * 1e6:8.2f}")
+                limiter.storage.reset()
+
+        print(f"\n{args.workers} workers x {args.attempts} hits against 5/minute:")
+        context = multiprocessing.get_context("fork")
+        for name, uri in uris.items():
+            with context.Pool(args.workers) as pool:
+                allowed = pool.starmap(
+                    storm,
+                    [(uri, "sliding-window-counter", args.attempts)] * args.workers,
+                )
+            print(f"{name:>18}: {sum(allowed)} allowed")
+
+        shm = uris.get("sqlite (/dev/shm)")
+        if shm:
+            for suffix in ("", "-wal", "-shm"):
+                path = shm.split("://", 1)[1][1:] + suffix
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
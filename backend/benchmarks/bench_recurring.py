@@ -0,0 +1,96 @@
+"""
+Recurring rule materialization throughput per batch size.
+
+Seeds a SQLite database with --users users holding --rules monthly
+recurring incomes and expenses each, all due once, then materializes them
+with RecurringScheduler.run_once at each --batch-sizes value (1 is one
+transaction per rule) and reports rules and entries per second. A file
+database is used so every commit pays for its fsync, as a server would.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_recurring --users 1000 --rules 4 --batch-sizes 1,50,500
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import Base
+from app.models import RecurringRule, User
+from app.services.recurring_scheduler import RecurringScheduler
+
+TODAY = date(2025, 3, 20)
+
+
+def seed(db: Session, users: int, rules: int):
+    db.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": f"bench{user_id}@example.com",
+                "password": "x",
+                "first_name": "Bench",
+                "last_name": "User",
+                "role": "user",
+                "balance": Decimal("100000.00"),
+                "is_active": True,
+            }
+            for user_id in range(1, users + 1)
+        ],
+    )
+    db.execute(
+        insert(RecurringRule),
+        [
+            {
+                "user_id": user_id,
+                "kind": "income" if index % 2 else "expense",
+                "amount": Decimal("10.00"),
+                "category": f"Rule {index}",
+                "interval": "monthly",
+                "every": 1,
+                "start_date": TODAY,
+                "next_due": TODAY,
+                "is_active": True,
+            }
+            for user_id in range(1, users + 1)
+            for index in range(rules)
+        ],
+    )
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--rules", type=int, default=4)
+    parser.add_argument("--batch-sizes", default="1,50,500")
+    args = parser.parse_args()
+
+    print(f"{'batch':>6} | {'rules':>7} | {'seconds':>8} | {'rules/s':>9}")
+    for batch_size in (int(value) for value in args.batch_sizes.split(",")):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+            Base.metadata.create_all(engine)
+            with Session(engine) as db:
+                seed(db, args.users, args.rules)
+            scheduler = RecurringScheduler(sessionmaker(bind=engine), batch_size=batch_size)
+
+            started = time.perf_counter()
+            result = scheduler.run_once(TODAY)
+            elapsed = time.perf_counter() - started
+            engine.dispose()
+        print(
+            f"{batch_size:>6} | {result.claimed:>7} | {elapsed:8.2f} | "
+            f"{result.claimed / elapsed:9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
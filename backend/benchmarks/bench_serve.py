@@ -0,0 +1,117 @@
+"""
+Requests/sec and memory of python -m app.serve per number of workers.
+
+For each --workers value starts the server on a free port (default rate
+limit off, warnings-only logging), then --clients client processes send
+keep-alive GET requests for --seconds. Reports requests/sec, the workers'
+RSS and their PSS, where pages still shared with the preloaded parent are
+split between the processes that share them.
+
+Results depend on the cores the server and the clients share; run the
+clients from another machine for numbers past a few workers.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_serve --workers 1,2,4 --clients 4 --seconds 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def children(pid: int) -> list[int]:
+    found = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as stat:
+                    if int(stat.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        found.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                pass
+    return found
+
+
+def memory_kb(pid: int) -> tuple[int, int]:
+    """(RSS, PSS) of a process in kB"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as rollup:
+        for line in rollup:
+            name, _, rest = line.partition(":")
+            if name in ("Rss", "Pss"):
+                values[name] = int(rest.split()[0])
+    return values["Rss"], values["Pss"]
+
+
+def client(url: str, seconds: float) -> int:
+    done = 0
+    with httpx.Client() as http:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            http.get(url).raise_for_status()
+            done += 1
+    return done
+
+
+def wait_ready(url: str):
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            httpx.get(url, timeout=1).raise_for_status()
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ, RATE_LIMIT_DEFAULT="", LOG_LEVEL="WARNING")
+    pool = multiprocessing.get_context("fork").Pool(args.clients)
+    print(f"{'workers':>7} | {'req/s':>8} | {'RSS MB':>8} | {'PSS MB':>8}")
+    for workers in (int(value) for value in args.workers.split(",")):
+        port = free_port()
+        url = f"http://127.0.0.1:{port}/"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "app.serve", "--workers", str(workers),
+             "--host", "127.0.0.1", "--port", str(port)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_ready(url)
+            pool.starmap(client, [(url, 1.0)] * args.clients)
+            started = time.perf_counter()
+            done = sum(pool.starmap(client, [(url, args.seconds)] * args.clients))
+            elapsed = time.perf_counter() - started
+            usage = [memory_kb(pid) for pid in children(server.pid)]
+            rss = sum(rss for rss, _ in usage) / 1024
+            pss = sum(pss for _, pss in usage) / 1024
+            print(f"{workers:>7} | {done / elapsed:8.0f} | {rss:8.1f} | {pss:8.1f}")
+        finally:
+            server.terminate()
+            server.wait()
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Latency of the trend statistics, Python loops versus NumPy.
+
+Seeds an in-memory SQLite database with --rows expenses of one user over
+ten years and fetches their (day, amount, category) columns once. "python"
+computes weekly totals, a 4 week rolling mean, per category monthly totals
+with month over month changes and per category mean, stddev and
+percentiles with dicts, loops and sorted(); "numpy" computes the same with
+app.utils.trends. "service" is trend_series_service plus
+category_trends_service end to end, query and response schemas included.
+Reports the best time of --number runs.
+
+Usage (from backend/, with the app's environment):
+    python -m benchmarks.bench_trends --rows 10000,100000,1000000
+"""
+
+import argparse
+import gc
+import math
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base
+from app.models import User
+from app.schema.analytics import Granularity, RollupKind
+from app.services.trends_service import (
+    _entries,
+    category_trends_service,
+    trend_series_service,
+)
+from app.utils import trends
+from benchmarks.bench_aggregates import seed
+
+EPOCH = date(1970, 1, 1)
+
+
+def _percentile(ordered: list, percentile: float) -> float:
+    rank = (len(ordered) - 1) * percentile / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (rank - lower) * (ordered[upper] - ordered[lower])
+
+
+def python_path(rows: list):
+    weekly = defaultdict(float)
+    monthly = defaultdict(lambda: defaultdict(float))
+    amounts = defaultdict(list)
+    for day, amount, category in rows:
+        weekly[day - (day + 3) % 7] += amount
+        month = (EPOCH + timedelta(days=day)).replace(day=1)
+        monthly[category][month] += amount
+        amounts[category].append(amount)
+
+    weeks = range(min(weekly), max(weekly) + 1, 7)
+    totals = [weekly.get(week, 0.0) for week in weeks]
+    [sum(totals[max(0, index - 3) : index + 1]) / min(index + 1, 4) for index in range(len(totals))]
+
+    months = sorted({month for by_month in monthly.values() for month in by_month})
+    for by_month in monthly.values():
+        series = [by_month.get(month, 0.0) for month in months]
+        [(current - previous, (current - previous) / previous if previous else None)
+         for previous, current in zip(series, series[1:])]
+
+    for values in amounts.values():
+        mean = sum(values) / len(values)
+        math.sqrt(sum((value - mean) ** 2 for value in values) / len(values))
+        ordered = sorted(values)
+        [_percentile(ordered, percentile) for percentile in trends.PERCENTILES]
+
+
+def numpy_path(entries: trends.Entries):
+    _, totals, _ = trends.period_sums(entries, trends.WEEK)
+    trends.rolling_mean(totals, 4)
+    _, monthly = trends.category_period_sums(entries, trends.MONTH)
+    trends.month_over_month(monthly)
+    trends.distribution(entries.amounts, entries.categories, len(entries.labels))
+
+
+def service_path(db: Session, user: User):
+    trend_series_service(user, db, RollupKind.EXPENSE, Granularity.WEEK, 4)
+    category_trends_service(user, db, RollupKind.EXPENSE)
+
+
+def best_of(function, number: int, *args) -> float:
+    best = float("inf")
+    for _ in range(number):
+        gc.collect()
+        started = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} | {'path':>7} | {'best ms':>9}")
+    for rows in (int(value) for value in args.rows.split(",")):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed(db, rows)
+            user = db.get(User, 1)
+            entries = _entries(RollupKind.EXPENSE, user, db, None, None)
+            columns = list(
+                zip(
+                    entries.days.tolist(),
+                    entries.amounts.tolist(),
+                    np.array(entries.labels)[entries.categories].tolist(),
+                )
+            )
+            for name, function, argument in (
+                ("python", python_path, columns),
+                ("numpy", numpy_path, entries),
+            ):
+                best = best_of(function, args.number, argument)
+                print(f"{rows:>9} | {name:>7} | {best * 1000:9.1f}")
+            best = best_of(service_path, args.number, db, user)
+            print(f"{rows:>9} | {'service':>7} | {best * 1000:9.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,9 @@ from app.main import app
 from app.models import User, Income, Expense, Savings
 from app.schema.user import UserCreate
 from app.utils.auth import hash_password
+from app.utils.principal_cache import principal_cache
+from app.utils.refresh_tokens import revoked_refresh_tokens
+from app.utils.token_versions import token_versions
 from fastapi.testclient import TestClient
 
 
@@ -43,6 +46,16 @@ def override_get_db():
 app.dependency_overrides[get_db] = override_get_db
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """User ids are reused across tests, never carry principals over"""
+    principal_cache.clear()
+    revoked_refresh_tokens.clear()
+    token_versions.clear()
+    yield
+    principal_cache.clear()
+
+
 @pytest.fixture(scope="function")
 def client():
     """Provide a test client for making requests to the app"""
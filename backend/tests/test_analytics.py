@@ -0,0 +1,220 @@
+"""
+Tests for the monthly rollups and analytics routes
+"""
+from decimal import Decimal
+from datetime import date, datetime
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models import User, Expense, Income, MonthlyRollup
+from app.utils import trends
+from app.utils.rollups import rebuild_monthly_rollups
+
+
+def _rollups(db: Session, user: User):
+    db.expire_all()
+    return {
+        (row.month, row.kind, row.category): (row.total, row.count)
+        for row in db.query(MonthlyRollup).filter(MonthlyRollup.user_id == user.id)
+    }
+
+
+class TestMonthlyRollups:
+    """Test cases for the incrementally maintained rollups"""
+
+    def test_expense_changes_update_rollups(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test create, update and delete move amounts between buckets"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        response = client.post(
+            "/api/v1/expenses/",
+            json={"amount": "40.00", "category": "Food", "date": "2025-01-15T10:00:00"},
+            headers=headers,
+        )
+        expense_id = response.json()["data"]["id"]
+        client.post(
+            "/api/v1/expenses/",
+            json={"amount": "10.00", "category": "Food", "date": "2025-01-20T10:00:00"},
+            headers=headers,
+        )
+
+        assert _rollups(db, test_user) == {
+            (date(2025, 1, 1), "expense", "Food"): (Decimal("50.00"), 2)
+        }
+
+        client.put(
+            f"/api/v1/expenses/{expense_id}",
+            json={"category": "Travel", "date": "2025-02-01T10:00:00"},
+            headers=headers,
+        )
+        assert _rollups(db, test_user) == {
+            (date(2025, 1, 1), "expense", "Food"): (Decimal("10.00"), 1),
+            (date(2025, 2, 1), "expense", "Travel"): (Decimal("40.00"), 1),
+        }
+
+        client.delete(f"/api/v1/expenses/{expense_id}", headers=headers)
+        assert _rollups(db, test_user)[(date(2025, 2, 1), "expense", "Travel")] == (Decimal("0.00"), 0)
+
+    def test_income_without_date_uses_default(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test an income created without a date lands in the current month"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        client.post("/api/v1/incomes/", json={"amount": "300.00", "source": "Salary"}, headers=headers)
+
+        month = datetime.utcnow().date().replace(day=1)
+        assert _rollups(db, test_user) == {(month, "income", "Salary"): (Decimal("300.00"), 1)}
+
+    def test_rebuild_monthly_rollups(self, db: Session, test_user: User):
+        """Test rebuild groups existing rows by month and category"""
+        db.add_all([
+            Expense(amount=Decimal("5.00"), category="Food", date=datetime(2024, 3, 2), user_id=test_user.id),
+            Expense(amount=Decimal("7.00"), category="Food", date=datetime(2024, 3, 30), user_id=test_user.id),
+            Income(amount=Decimal("100.00"), source="Salary", date=datetime(2024, 4, 1), user_id=test_user.id),
+        ])
+        db.commit()
+
+        assert rebuild_monthly_rollups(db) == 2
+        assert _rollups(db, test_user) == {
+            (date(2024, 3, 1), "expense", "Food"): (Decimal("12.00"), 2),
+            (date(2024, 4, 1), "income", "Salary"): (Decimal("100.00"), 1),
+        }
+
+
+class TestAnalyticsRoutes:
+    """Test cases for analytics routes"""
+
+    def _seed(self, db: Session, user: User):
+        db.add_all([
+            MonthlyRollup(user_id=user.id, month=date(2025, 1, 1), kind="income", category="Salary", total=Decimal("1000.00"), count=1),
+            MonthlyRollup(user_id=user.id, month=date(2025, 1, 1), kind="expense", category="Food", total=Decimal("200.00"), count=4),
+            MonthlyRollup(user_id=user.id, month=date(2025, 1, 1), kind="expense", category="Rent", total=Decimal("500.00"), count=1),
+            MonthlyRollup(user_id=user.id, month=date(2025, 2, 1), kind="expense", category="Food", total=Decimal("150.00"), count=3),
+        ])
+        db.commit()
+
+    def test_monthly_summary(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test monthly totals and net per month"""
+        self._seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/analytics/monthly", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [m["month"] for m in data] == ["2025-01-01", "2025-02-01"]
+        assert Decimal(data[0]["total_expense"]) == Decimal("700.00")
+        assert Decimal(data[0]["net"]) == Decimal("300.00")
+        assert data[1]["income_count"] == 0
+
+    def test_category_summary_in_period(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test category totals are filtered by month and sorted by total"""
+        self._seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get(
+            "/api/v1/analytics/categories",
+            params={"kind": "expense", "start": "2025-01-10", "end": "2025-01-31"},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [c["category"] for c in data] == ["Rent", "Food"]
+        assert Decimal(data[1]["total"]) == Decimal("200.00")
+
+    def test_analytics_requires_auth(self, client: TestClient):
+        """Test analytics routes require authentication"""
+        response = client.get("/api/v1/analytics/monthly")
+
+        assert response.status_code in (401, 403)
+
+
+class TestTrends:
+    """Test cases for the NumPy trend statistics and routes"""
+
+    def _seed(self, db: Session, user: User):
+        db.add_all([
+            Expense(amount=Decimal("10.00"), category="Food", date=datetime(2025, 1, 6, 9), user_id=user.id),
+            Expense(amount=Decimal("30.00"), category="Food", date=datetime(2025, 1, 12, 18), user_id=user.id),
+            Expense(amount=Decimal("500.00"), category="Rent", date=datetime(2025, 1, 31, 23), user_id=user.id),
+            Expense(amount=Decimal("20.00"), category="Food", date=datetime(2025, 3, 3, 0), user_id=user.id),
+            Income(amount=Decimal("1000.00"), source="Salary", date=datetime(2025, 1, 1), user_id=user.id),
+        ])
+        db.commit()
+
+    def test_distribution_matches_numpy(self):
+        """Test grouped statistics match numpy.percentile, mean and std per group"""
+        rng = np.random.default_rng(7)
+        amounts = rng.gamma(2.0, 40.0, 1000).round(2)
+        groups = rng.integers(0, 4, 1000)
+
+        stats = trends.distribution(amounts, groups, 5)
+
+        for group in range(4):
+            values = amounts[groups == group]
+            assert stats.counts[group] == len(values)
+            assert stats.means[group] == pytest.approx(values.mean())
+            assert stats.stddevs[group] == pytest.approx(values.std())
+            assert stats.percentiles[group] == pytest.approx(np.percentile(values, trends.PERCENTILES))
+        assert stats.counts[4] == 0
+        assert np.isnan(stats.percentiles[4]).all()
+
+    def test_monthly_trends(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test monthly totals include empty months and a rolling mean"""
+        self._seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/analytics/trends", params={"window": 2}, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [(p["period"], p["total"], p["count"]) for p in data["points"]] == [
+            ("2025-01-01", 540.0, 3),
+            ("2025-02-01", 0.0, 0),
+            ("2025-03-01", 20.0, 1),
+        ]
+        assert [p["rolling_mean"] for p in data["points"]] == [540.0, 270.0, 10.0]
+        assert data["distribution"]["count"] == 4
+        assert data["distribution"]["p50"] == 25.0
+
+    def test_weekly_trends_in_range(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test weeks start on Monday and the range is applied in SQL"""
+        self._seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get(
+            "/api/v1/analytics/trends",
+            params={"granularity": "week", "start": "2025-01-01", "end": "2025-01-31"},
+            headers=headers,
+        )
+
+        points = response.json()["data"]["points"]
+        assert [p["period"] for p in points] == ["2025-01-06", "2025-01-13", "2025-01-20", "2025-01-27"]
+        assert [p["total"] for p in points] == [40.0, 0.0, 0.0, 500.0]
+
+    def test_category_trends(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test per category distributions and month over month changes"""
+        self._seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/analytics/trends/categories", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["months"] == ["2025-01-01", "2025-02-01", "2025-03-01"]
+        rent, food = data["categories"]
+        assert rent["category"] == "Rent"
+        assert food["monthly"] == [40.0, 0.0, 20.0]
+        assert food["month_over_month"] == [None, -40.0, 20.0]
+        assert food["month_over_month_pct"] == [None, -100.0, None]
+        assert (food["count"], food["mean"], food["p50"]) == (3, 20.0, 20.0)
+
+    def test_trends_without_entries(self, client: TestClient, authenticated_user_token: str):
+        """Test an empty history gives no points and no statistics"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/analytics/trends", params={"kind": "income"}, headers=headers)
+
+        data = response.json()["data"]
+        assert data["points"] == []
+        assert data["distribution"]["count"] == 0
+        assert data["distribution"]["mean"] is None
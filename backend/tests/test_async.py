@@ -0,0 +1,198 @@
+"""
+Tests for the async database mode (aiosqlite)
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, timezone
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.db.database import Base, get_async_db
+from app.models import User
+from app.schema.expense import ExpenseCreate, ExpenseUpdate
+from app.schema.income import IncomeCreate
+from app.schema.savings import SavingsCreate
+from app.routes import overlay_router, expense_router
+from app.routes.async_expense import (
+    router as async_expense_router,
+    read_expenses as async_read_expenses,
+)
+from app.services import (
+    async_expense_service,
+    async_income_service,
+    async_savings_service,
+    async_user_service,
+)
+from app.services.expense_service import InsufficientBalanceError
+from app.utils.auth import create_access_token
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Create the schema in a temporary SQLite file and seed one user"""
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(
+            User(
+                email="async@example.com",
+                password="hashed",
+                first_name="Async",
+                last_name="User",
+                role="user",
+                balance=Decimal("1000.00"),
+            )
+        )
+        session.commit()
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def async_session_factory(db_file):
+    """async_sessionmaker bound to an aiosqlite engine"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}", poolclass=NullPool)
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+class TestAsyncServices:
+    """Test cases for the async service layer"""
+
+    @pytest.mark.asyncio
+    async def test_create_expense_deducts_balance(self, async_session_factory):
+        """Test that the async expense service deducts from the balance"""
+        async with async_session_factory() as db:
+            expense = await async_expense_service.create_expense_service(
+                ExpenseCreate(
+                    amount=Decimal("100.00"),
+                    category="Food",
+                    date=datetime.now(timezone.utc),
+                ),
+                1,
+                db,
+            )
+            user = await db.get(User, 1)
+
+            assert expense.id is not None
+            assert user.balance == Decimal("900.00")
+
+    @pytest.mark.asyncio
+    async def test_create_expense_insufficient_balance(self, async_session_factory):
+        """Test that async expense creation checks the balance"""
+        async with async_session_factory() as db:
+            with pytest.raises(InsufficientBalanceError):
+                await async_expense_service.create_expense_service(
+                    ExpenseCreate(
+                        amount=Decimal("5000.00"),
+                        category="Rent",
+                        date=datetime.now(timezone.utc),
+                    ),
+                    1,
+                    db,
+                )
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_expense(self, async_session_factory):
+        """Test update and delete keep the balance consistent"""
+        async with async_session_factory() as db:
+            user = await db.get(User, 1)
+            expense = await async_expense_service.create_expense_service(
+                ExpenseCreate(
+                    amount=Decimal("100.00"),
+                    category="Food",
+                    date=datetime.now(timezone.utc),
+                ),
+                user.id,
+                db,
+            )
+            await async_expense_service.update_expense_service(
+                expense.id, ExpenseUpdate(amount=Decimal("150.00")), user, db
+            )
+            await db.refresh(user)
+            assert user.balance == Decimal("850.00")
+
+            await async_expense_service.delete_expense_service(expense.id, user, db)
+            await db.refresh(user)
+            assert user.balance == Decimal("1000.00")
+
+    @pytest.mark.asyncio
+    async def test_income_and_savings(self, async_session_factory):
+        """Test async income and savings services"""
+        async with async_session_factory() as db:
+            user = await db.get(User, 1)
+            await async_income_service.create_income_service(
+                IncomeCreate(amount=Decimal("250.00"), source="Salary"), user, db
+            )
+            await async_savings_service.create_saving_service(
+                SavingsCreate(amount=Decimal("50.00")), user, db
+            )
+
+            incomes = await async_income_service.fetch_all_income_service(user, db)
+            savings = await async_savings_service.get_all_savings_service(user, db)
+            await db.refresh(user)
+
+            assert len(incomes) == 1
+            assert len(savings) == 1
+            assert user.balance == Decimal("1250.00")
+
+    @pytest.mark.asyncio
+    async def test_user_service(self, async_session_factory):
+        """Test async user lookups"""
+        async with async_session_factory() as db:
+            user = await async_user_service.get_user_by_email_service(
+                db, "async@example.com"
+            )
+            users = await async_user_service.get_all_users_service(db)
+
+            assert user.id == 1
+            assert len(users) == 1
+
+
+class TestAsyncRoutes:
+    """Test cases for the async router overlay"""
+
+    def test_overlay_serves_async_routes(self, async_session_factory):
+        """Test CRUD goes through async routes while sync-only routes remain"""
+        app = FastAPI()
+        app.include_router(
+            overlay_router(expense_router, async_expense_router), prefix="/api/v1"
+        )
+
+        async def override_get_async_db():
+            async with async_session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+
+        endpoints = {
+            route.path: route.endpoint
+            for route in app.routes
+            if getattr(route, "methods", None) == {"GET"}
+        }
+        assert endpoints["/api/v1/expenses/"] is async_read_expenses
+        assert "/api/v1/expenses/total" in endpoints
+
+        token, _ = create_access_token(data={"user_id": "1"})
+        headers = {"Authorization": f"Bearer {token}"}
+        client = TestClient(app)
+
+        response = client.post(
+            "/api/v1/expenses/",
+            json={
+                "amount": "20.00",
+                "category": "Food",
+                "date": datetime.now(timezone.utc).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+        response = client.get("/api/v1/expenses/", headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 1
@@ -3,9 +3,19 @@ Tests for authentication routes
 """
 
 import pytest
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from fastapi.testclient import TestClient
 from app.models import User
+from app.utils.principal_cache import PrincipalCache, Principal, principal_cache
+from app.utils.hashing import PasswordHasher, PasswordHasherBusyError, password_hasher
+from app.utils.bloom import BloomFilter
+from app.utils.refresh_tokens import RevocationFilter, hash_refresh_token, revoked_refresh_tokens
+from app.models import RefreshToken, RevokedRefreshToken, TokenRevocation
+from app.core.permissions import Permission, Role, ROLE_MASKS, has_permission, permission_mask, role_mask
+from app.utils.auth import access_token_claims, create_access_token
+from app.utils.token_versions import token_versions
+from app.services.refresh_token_service import issue_refresh_token_service, prune_refresh_tokens_service
 
 
 class TestAuthRoutes:
@@ -271,3 +281,458 @@ class TestAuthRateLimiting:
             response = client.post("/api/v1/auth/signup", json=user_data)
             # Requests should succeed
             assert response.status_code == 429
+
+
+class TestPrincipalCache:
+    """Test cases for the authenticated principal cache"""
+
+    def _principal(self, user_id=1, role="user"):
+        return Principal(id=user_id, role=role, email=f"u{user_id}@example.com", is_active=True)
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL"""
+        now = [0.0]
+        cache = PrincipalCache(maxsize=10, ttl=30, clock=lambda: now[0])
+        cache.set(self._principal())
+
+        assert cache.get(1) is not None
+        now[0] = 31
+        assert cache.get(1) is None
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted past maxsize"""
+        cache = PrincipalCache(maxsize=2, ttl=30)
+        cache.set(self._principal(1))
+        cache.set(self._principal(2))
+        cache.get(1)
+        cache.set(self._principal(3))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None and cache.get(3) is not None
+
+    def test_stale_load_is_not_stored(self):
+        """Test a load that raced with an invalidation is dropped"""
+        cache = PrincipalCache(maxsize=10, ttl=30)
+        generation = cache.generation
+        cache.invalidate(1)
+        cache.set(self._principal(1), generation)
+
+        assert cache.get(1) is None
+
+    def test_cached_requests_skip_user_select(
+        self, client: TestClient, test_user: User, authenticated_user_token: str
+    ):
+        """Test a warm cache saves the users query"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        cold = client.get("/api/v1/expenses/", headers=headers)
+        warm = client.get("/api/v1/expenses/", headers=headers)
+
+        assert principal_cache.get(test_user.id) is not None
+        assert int(warm.headers["X-DB-Query-Count"]) == int(cold.headers["X-DB-Query-Count"]) - 1
+
+    def test_admin_role_change_invalidates(
+        self,
+        client: TestClient,
+        test_user: User,
+        authenticated_user_token: str,
+        authenticated_admin_token: str,
+    ):
+        """Test admin updates take effect immediately for the cached user"""
+        user_headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        admin_headers = {"Authorization": f"Bearer {authenticated_admin_token}"}
+        assert client.get("/api/v1/admin/users", headers=user_headers).status_code == 403
+
+        response = client.put(
+            f"/api/v1/admin/users/{test_user.id}", json={"role": "admin"}, headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        assert client.get("/api/v1/admin/users", headers=user_headers).status_code == 200
+
+
+class TestPasswordHasher:
+    """Test cases for the bounded password hashing pool"""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_hash_and_verify(self):
+        """Test hashes made in a worker process verify, also inline"""
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        try:
+            hashed = await hasher.hash_async("Secret123!")
+            assert await hasher.verify_async("Secret123!", hashed) is True
+            assert await hasher.verify_async("wrong", hashed) is False
+            assert hasher.verify("Secret123!", hashed) is True
+            assert hasher.pending == 0
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_async_hash(self):
+        """Test the async entry point"""
+        hasher = PasswordHasher(workers=0, max_pending=2)
+
+        hashed = await hasher.hash_async("Secret123!")
+
+        assert await hasher.verify_async("Secret123!", hashed) is True
+
+    def test_rejects_beyond_max_pending(self):
+        """Test callers fail fast once max_pending jobs are in flight"""
+        hasher = PasswordHasher(workers=0, max_pending=1)
+        hasher.pending = 1
+
+        with pytest.raises(PasswordHasherBusyError):
+            hasher.hash("Secret123!")
+        assert hasher.pending == 1
+
+    def test_login_returns_503_when_busy(self, client: TestClient, test_user: User, monkeypatch):
+        """Test a saturated hasher sheds logins with 503"""
+        from app.utils.rate_limits import limiter
+
+        limiter.reset()
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpassword123"},
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_login_waits_without_a_thread(
+        self, client: TestClient, test_user: User, authenticated_user_token: str, monkeypatch
+    ):
+        """Test a login waiting on its password check leaves the only thread to other routes"""
+        import asyncio
+        import anyio
+        import httpx
+        from app.main import app
+        from app.utils.rate_limits import limiter
+
+        limiter.reset()
+        release = asyncio.Event()
+
+        async def slow_verify(plain_password, hashed_password):
+            await release.wait()
+            return True
+
+        monkeypatch.setattr(password_hasher, "verify_async", slow_verify)
+        threads = anyio.to_thread.current_default_thread_limiter()
+        tokens, threads.total_tokens = threads.total_tokens, 1
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                login = asyncio.create_task(
+                    ac.post(
+                        "/api/v1/auth/login",
+                        json={"email": test_user.email, "password": "testpassword123"},
+                    )
+                )
+                me = await asyncio.wait_for(
+                    ac.get(
+                        "/api/v1/auth/me",
+                        headers={"Authorization": f"Bearer {authenticated_user_token}"},
+                    ),
+                    5,
+                )
+                assert not login.done()
+                release.set()
+                response = await asyncio.wait_for(login, 5)
+        finally:
+            threads.total_tokens = tokens
+
+        assert me.status_code == 200
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_user_service_uses_hashing_pool(self, db, monkeypatch):
+        """Test the async user service awaits the pool instead of hashing on the thread"""
+        from app.schema.user import UserCreate
+        from app.services.user_service import create_user_service_async
+
+        def inline_hash(password):
+            raise AssertionError("hashed on the request thread")
+
+        async def pool_hash(password):
+            return f"pooled:{password}"
+
+        monkeypatch.setattr(password_hasher, "hash", inline_hash)
+        monkeypatch.setattr(password_hasher, "hash_async", pool_hash)
+
+        user = await create_user_service_async(
+            db,
+            UserCreate(
+                email="pooled@example.com",
+                password="NewPass123!",
+                first_name="Pooled",
+                last_name="User",
+                balance=Decimal("500.00"),
+            ),
+        )
+
+        assert user.password == "pooled:NewPass123!"
+
+
+class TestRefreshTokens:
+    """Test cases for refresh token rotation and revocation"""
+
+    @pytest.fixture
+    def refresh_token(self, db, test_user: User):
+        token, _ = issue_refresh_token_service(test_user.id, db)
+        return token
+
+    def _refresh(self, client: TestClient, token: str):
+        return client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+    def test_login_returns_refresh_token(self, client: TestClient, test_user: User, db):
+        """Test login issues a refresh token stored only as its digest"""
+        from app.utils.rate_limits import limiter
+
+        limiter.reset()
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpassword123"},
+        )
+
+        assert response.status_code == 200
+        token = response.json()["refresh_token"]
+        row = db.query(RefreshToken).one()
+        assert row.token_hash == hash_refresh_token(token)
+        assert token not in row.token_hash
+
+    def test_refresh_rotates(self, client: TestClient, refresh_token, test_user: User, db):
+        """Test a refresh returns a working access token and a new refresh token"""
+        response = self._refresh(client, refresh_token)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["refresh_token"] != refresh_token
+        me = client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {data['access_token']}"},
+        )
+        assert me.json()["id"] == test_user.id
+        assert db.get(RevokedRefreshToken, hash_refresh_token(refresh_token)) is not None
+
+    def test_refresh_skips_password_hashing(self, client: TestClient, refresh_token, monkeypatch):
+        """Test renewal works while the password hasher sheds load"""
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+        assert self._refresh(client, refresh_token).status_code == 200
+
+    def test_reuse_revokes_family(self, client: TestClient, refresh_token, db):
+        """Test replaying a rotated token revokes its successor too"""
+        successor = self._refresh(client, refresh_token).json()["refresh_token"]
+
+        replay = self._refresh(client, refresh_token)
+
+        assert replay.status_code == 401
+        assert replay.json()["detail"] == "Refresh token has already been used"
+        assert self._refresh(client, successor).status_code == 401
+        assert db.query(RefreshToken).count() == 0
+
+    def test_unknown_token_skips_revocation_store(self, client: TestClient, db, monkeypatch):
+        """Test a token the filter has never seen is rejected without a store lookup"""
+        from sqlalchemy.orm import Session
+
+        lookups = []
+        original_get = Session.get
+
+        def tracking_get(self, entity, *args, **kwargs):
+            if entity is RevokedRefreshToken:
+                lookups.append(args)
+            return original_get(self, entity, *args, **kwargs)
+
+        monkeypatch.setattr(Session, "get", tracking_get)
+
+        response = self._refresh(client, "not-a-real-token")
+
+        assert response.status_code == 401
+        assert lookups == []
+
+    def test_expired_token_rejected(self, client: TestClient, refresh_token, db):
+        """Test expired refresh tokens are refused"""
+        row = db.query(RefreshToken).one()
+        row.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db.commit()
+
+        response = self._refresh(client, refresh_token)
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Refresh token has expired"
+
+    def test_inactive_user_cannot_refresh(self, client: TestClient, refresh_token, test_user: User, db):
+        """Test deactivated users cannot renew their session"""
+        test_user.is_active = False
+        db.commit()
+
+        assert self._refresh(client, refresh_token).status_code == 401
+
+    def test_logout_revokes(self, client: TestClient, refresh_token):
+        """Test a logged out refresh token no longer works"""
+        response = client.post(
+            "/api/v1/auth/logout", json={"refresh_token": refresh_token}
+        )
+
+        assert response.status_code == 204
+        assert revoked_refresh_tokens.might_contain(hash_refresh_token(refresh_token))
+        assert self._refresh(client, refresh_token).status_code == 401
+
+    def test_filter_syncs_other_workers_revocations(self, db, test_user: User):
+        """Test revocations written by another process reach the filter"""
+        token_hash = hash_refresh_token("revoked-elsewhere")
+        db.add(
+            RevokedRefreshToken(
+                token_hash=token_hash,
+                user_id=test_user.id,
+                family_id="f" * 32,
+                expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+                revoked_at=datetime.now(timezone.utc),
+            )
+        )
+        db.commit()
+
+        assert not revoked_refresh_tokens.might_contain(token_hash)
+        revoked_refresh_tokens.sync(db)
+        assert revoked_refresh_tokens.might_contain(token_hash)
+
+    def _revocation(self, user: User, token: str, expires_at: datetime) -> RevokedRefreshToken:
+        return RevokedRefreshToken(
+            token_hash=hash_refresh_token(token),
+            user_id=user.id,
+            family_id="f" * 32,
+            expires_at=expires_at,
+            revoked_at=datetime.now(timezone.utc),
+        )
+
+    def test_prune_drops_expired(self, db, test_user: User):
+        """Test pruning deletes expired tokens and revocations and rebuilds the filter"""
+        now = datetime.now(timezone.utc)
+        expired, kept = hash_refresh_token("expired"), hash_refresh_token("kept")
+        db.add_all([
+            self._revocation(test_user, "expired", now - timedelta(minutes=1)),
+            self._revocation(test_user, "kept", now + timedelta(days=1)),
+            RefreshToken(
+                user_id=test_user.id,
+                token_hash=hash_refresh_token("stale"),
+                family_id="f" * 32,
+                expires_at=now - timedelta(minutes=1),
+            ),
+        ])
+        db.commit()
+        revoked_refresh_tokens.add(expired)
+
+        assert prune_refresh_tokens_service(db) == (1, 1)
+        assert db.get(RevokedRefreshToken, expired) is None
+        assert db.query(RefreshToken).count() == 0
+        assert not revoked_refresh_tokens.might_contain(expired)
+        assert revoked_refresh_tokens.might_contain(kept)
+
+    def test_filter_rebuild_forgets_pruned(self, db, test_user: User):
+        """Test a worker's filter drops revocations pruned elsewhere once rebuild_seconds pass"""
+        clock = [0.0]
+        bloom = RevocationFilter(capacity=1000, sync_seconds=10, rebuild_seconds=100, clock=lambda: clock[0])
+        row = self._revocation(test_user, "pruned-elsewhere", datetime.now(timezone.utc) + timedelta(days=1))
+        db.add(row)
+        db.commit()
+        bloom.sync(db)
+        db.delete(row)
+        db.commit()
+
+        clock[0] = 50
+        bloom.sync(db)
+        assert bloom.might_contain(row.token_hash)
+        clock[0] = 100
+        bloom.sync(db)
+        assert not bloom.might_contain(row.token_hash)
+
+    def test_bloom_filter(self):
+        """Test the bloom filter has no false negatives and few false positives"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        members = [hash_refresh_token(f"member-{i}") for i in range(1000)]
+        for member in members:
+            bloom.add(bytes.fromhex(member))
+
+        assert all(bytes.fromhex(member) in bloom for member in members)
+        false_positives = sum(
+            bytes.fromhex(hash_refresh_token(f"other-{i}")) in bloom
+            for i in range(10000)
+        )
+        assert false_positives < 300
+
+
+class TestPermissionClaims:
+    """Test cases for permission bitmasks carried in access tokens"""
+
+    def _headers(self, user: User) -> dict:
+        token, _ = create_access_token(data=access_token_claims(user))
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_role_masks(self):
+        """Test role masks agree with the permission lists"""
+        assert ROLE_MASKS["admin"] & ROLE_MASKS["user"] == ROLE_MASKS["user"]
+        assert role_mask(Role.MODERATOR) == 0
+        assert has_permission(Role.USER, Permission.EXPENSE_READ)
+        assert not has_permission(Role.USER, Permission.ADMIN_READ)
+        assert permission_mask([Permission.ADMIN_READ]) & ROLE_MASKS["user"] == 0
+
+    def test_read_only_requests_skip_user_lookup(self, client: TestClient, test_user: User):
+        """Test GET routes authorize from the claims alone"""
+        response = client.get("/api/v1/expenses/", headers=self._headers(test_user))
+
+        assert response.status_code == 200
+        assert len(principal_cache) == 0
+
+    def test_claims_enforce_permissions(self, client: TestClient, test_user: User):
+        """Test a user token cannot read admin routes"""
+        response = client.get("/api/v1/admin/users", headers=self._headers(test_user))
+
+        assert response.status_code == 403
+
+    def test_role_change_revokes_tokens(self, client: TestClient, test_admin_user: User):
+        """Test a demoted admin's old token stops working on read-only routes"""
+        headers = self._headers(test_admin_user)
+        assert client.get("/api/v1/admin/users", headers=headers).status_code == 200
+
+        response = client.put(
+            f"/api/v1/admin/users/{test_admin_user.id}", json={"role": "user"}, headers=headers
+        )
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/admin/users", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+
+    def test_deactivation_revokes_tokens(
+        self, client: TestClient, test_user: User, authenticated_admin_token: str
+    ):
+        """Test deactivated users cannot keep reading with an old token"""
+        headers = self._headers(test_user)
+        client.post(
+            f"/api/v1/admin/users/{test_user.id}?activate=false",
+            headers={"Authorization": f"Bearer {authenticated_admin_token}"},
+        )
+
+        assert client.get("/api/v1/expenses/", headers=headers).status_code == 401
+
+    def test_revocations_from_other_workers_sync(
+        self, client: TestClient, test_user: User, db, monkeypatch
+    ):
+        """Test revocations recorded by another process are picked up"""
+        headers = self._headers(test_user)
+        assert client.get("/api/v1/expenses/", headers=headers).status_code == 200
+        db.add(
+            TokenRevocation(
+                user_id=test_user.id,
+                token_version=1,
+                revoked_at=datetime.now(timezone.utc),
+            )
+        )
+        db.commit()
+
+        monkeypatch.setattr(token_versions, "sync_seconds", 0)
+        response = client.get("/api/v1/expenses/", headers=headers)
+
+        assert response.status_code == 401
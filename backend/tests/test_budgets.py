@@ -0,0 +1,165 @@
+"""
+Tests for budgets and their running spend
+"""
+from decimal import Decimal
+from datetime import date, datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models import User, Expense
+from app.utils.budgets import MONTHLY, WEEKLY, YEARLY, period_end, period_start
+
+
+def _status(client: TestClient, headers: dict) -> dict:
+    response = client.get("/api/v1/budgets/status", headers=headers)
+    assert response.status_code == 200
+    return {(item["category"], item["period"]): item for item in response.json()["data"]}
+
+
+class TestBudgetPeriods:
+    """Test cases for budget period bounds"""
+
+    def test_period_bounds(self):
+        """Test weeks start on Monday and months and years end on their last day"""
+        day = datetime(2024, 2, 15, 13, 30)
+
+        assert period_start(day, WEEKLY) == date(2024, 2, 12)
+        assert period_end(date(2024, 2, 12), WEEKLY) == date(2024, 2, 18)
+        assert period_start(day, MONTHLY) == date(2024, 2, 1)
+        assert period_end(date(2024, 2, 1), MONTHLY) == date(2024, 2, 29)
+        assert period_end(date(2024, 12, 1), MONTHLY) == date(2024, 12, 31)
+        assert period_start(day, YEARLY) == date(2024, 1, 1)
+        assert period_end(date(2024, 1, 1), YEARLY) == date(2024, 12, 31)
+
+
+class TestBudgetRoutes:
+    """Test cases for budget routes"""
+
+    def test_spend_follows_expense_changes(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test create, update, recategorize and delete move the period spend"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        client.post("/api/v1/budgets/", json={"category": "Food", "limit": "100.00"}, headers=headers)
+        now = datetime.utcnow().isoformat()
+
+        response = client.post(
+            "/api/v1/expenses/",
+            json={"amount": "60.00", "category": "Food", "date": now},
+            headers=headers,
+        )
+        expense_id = response.json()["data"]["id"]
+        client.post(
+            "/api/v1/expenses/",
+            json={"amount": "5.00", "category": "Travel", "date": now},
+            headers=headers,
+        )
+        food = _status(client, headers)[("Food", "monthly")]
+        assert (Decimal(food["spent"]), food["count"], Decimal(food["remaining"])) == (
+            Decimal("60.00"), 1, Decimal("40.00")
+        )
+
+        client.put(f"/api/v1/expenses/{expense_id}", json={"amount": "120.00"}, headers=headers)
+        food = _status(client, headers)[("Food", "monthly")]
+        assert Decimal(food["spent"]) == Decimal("120.00")
+        assert food["over_budget"] is True
+
+        client.put(f"/api/v1/expenses/{expense_id}", json={"category": "Travel"}, headers=headers)
+        assert Decimal(_status(client, headers)[("Food", "monthly")]["spent"]) == 0
+
+        client.put(f"/api/v1/expenses/{expense_id}", json={"category": "Food"}, headers=headers)
+        client.delete(f"/api/v1/expenses/{expense_id}", headers=headers)
+        food = _status(client, headers)[("Food", "monthly")]
+        assert (Decimal(food["spent"]), food["count"]) == (0, 0)
+
+    def test_new_budget_counts_current_period(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test a new budget starts from the expenses already in its period"""
+        now = datetime.utcnow()
+        db.add_all([
+            Expense(amount=Decimal("30.00"), category="Food", date=now, user_id=test_user.id),
+            Expense(amount=Decimal("70.00"), category="Food", date=now - timedelta(days=400), user_id=test_user.id),
+        ])
+        db.commit()
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post(
+            "/api/v1/budgets/",
+            json={"category": "Food", "period": "yearly", "limit": "50.00"},
+            headers=headers,
+        )
+
+        assert response.status_code == 201
+        food = _status(client, headers)[("Food", "yearly")]
+        assert Decimal(food["spent"]) == Decimal("30.00")
+        assert food["period_start"] == date(now.year, 1, 1).isoformat()
+        assert food["period_end"] == date(now.year, 12, 31).isoformat()
+
+    def test_status_is_one_query(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test the status of several budgets is read in a single query"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        for category, period in (("Food", "weekly"), ("Food", "monthly"), ("Rent", "yearly")):
+            client.post(
+                "/api/v1/budgets/",
+                json={"category": category, "period": period, "limit": "10.00"},
+                headers=headers,
+            )
+
+        response = client.get("/api/v1/budgets/status", headers=headers)
+
+        assert len(response.json()["data"]) == 3
+        assert response.headers["X-DB-Query-Count"] == "1"
+
+    def test_check_budget_on_create(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test check_budget lists the budgets the new expense went over"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        client.post("/api/v1/budgets/", json={"category": "Food", "limit": "50.00"}, headers=headers)
+        client.post("/api/v1/budgets/", json={"category": "Food", "period": "yearly", "limit": "500.00"}, headers=headers)
+        expense = {"amount": "40.00", "category": "Food", "date": datetime.utcnow().isoformat()}
+
+        first = client.post("/api/v1/expenses/", json=expense, params={"check_budget": True}, headers=headers)
+        unchecked = client.post("/api/v1/expenses/", json=expense, headers=headers)
+        checked = client.post("/api/v1/expenses/", json=expense, params={"check_budget": True}, headers=headers)
+
+        assert first.json()["data"]["over_budget"] == []
+        assert unchecked.json()["data"]["over_budget"] is None
+        [alert] = checked.json()["data"]["over_budget"]
+        assert (alert["period"], Decimal(alert["spent"])) == ("monthly", Decimal("120.00"))
+
+    def test_bulk_create_updates_spend(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test bulk created expenses are added to the budgets of their category"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        client.post("/api/v1/budgets/", json={"category": "Food", "period": "weekly", "limit": "50.00"}, headers=headers)
+        now = datetime.utcnow().isoformat()
+
+        client.post(
+            "/api/v1/expenses/bulk",
+            json={"items": [
+                {"amount": "10.00", "category": "Food", "date": now},
+                {"amount": "15.00", "category": "Food", "date": now},
+                {"amount": "99.00", "category": "Rent", "date": now},
+            ]},
+            headers=headers,
+        )
+
+        food = _status(client, headers)[("Food", "weekly")]
+        assert (Decimal(food["spent"]), food["count"]) == (Decimal("25.00"), 2)
+
+    def test_budget_crud(self, client: TestClient, test_user: User, authenticated_user_token: str, authenticated_admin_token: str):
+        """Test duplicates conflict, limits update and other users' budgets are not found"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        budget = {"category": "Food", "limit": "100.00"}
+        budget_id = client.post("/api/v1/budgets/", json=budget, headers=headers).json()["data"]["id"]
+
+        assert client.post("/api/v1/budgets/", json=budget, headers=headers).status_code == 409
+        response = client.put(f"/api/v1/budgets/{budget_id}", json={"limit": "150.00"}, headers=headers)
+        assert Decimal(response.json()["data"]["limit"]) == Decimal("150.00")
+
+        admin = {"Authorization": f"Bearer {authenticated_admin_token}"}
+        assert client.delete(f"/api/v1/budgets/{budget_id}", headers=admin).status_code == 404
+        assert client.delete(f"/api/v1/budgets/{budget_id}", headers=headers).status_code == 200
+        assert client.get("/api/v1/budgets/", headers=headers).json()["data"] == []
+
+    def test_invalid_limit(self, client: TestClient, authenticated_user_token: str):
+        """Test a budget needs a positive limit"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post("/api/v1/budgets/", json={"category": "Food", "limit": "0"}, headers=headers)
+
+        assert response.status_code == 422
@@ -0,0 +1,117 @@
+"""
+Tests for the dashboard route
+"""
+from decimal import Decimal
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models import User, Expense, Income, Savings, UserTotals, MonthlyRollup
+from app.utils.balance import get_user_balance
+
+
+def _post(client: TestClient, headers: dict, path: str, payload: dict):
+    response = client.post(f"/api/v1/{path}/", json=payload, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["data"]
+
+
+class TestDashboardRoutes:
+    """Test cases for GET /dashboard"""
+
+    def test_dashboard_figures(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test totals, month to date, recent transactions, categories and goals"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        now = datetime.utcnow().replace(microsecond=0)
+        _post(client, headers, "expenses", {"amount": "10.00", "category": "Food", "date": "2024-01-05T10:00:00"})
+        _post(client, headers, "incomes", {"amount": "1000.00", "source": "Salary", "date": (now - timedelta(seconds=3)).isoformat()})
+        food = _post(client, headers, "expenses", {"amount": "40.00", "category": "Food", "date": (now - timedelta(seconds=2)).isoformat()})
+        travel = _post(client, headers, "expenses", {"amount": "25.00", "category": "Travel", "date": (now - timedelta(seconds=1)).isoformat()})
+        goal = _post(client, headers, "savings", {"amount": "200.00", "current_amount": "50.00", "goal": "1000.00", "description": "Bike"})
+        db.add(Savings(user_id=test_user.id, amount=Decimal("5.00"), description="Done", is_completed=True))
+        db.commit()
+
+        response = client.get("/api/v1/dashboard/?recent=2", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["balance"] == {
+            "total_income": "1000.00",
+            "total_expense": "75.00",
+            "total_savings": "200.00",
+            "balance": "725.00",
+            "net_balance": "925.00",
+            "income_count": 1,
+            "expense_count": 3,
+            "savings_count": 1,
+        }
+        assert data["month_to_date"]["month"] == now.date().replace(day=1).isoformat()
+        assert data["month_to_date"]["income"] == "1000.00"
+        assert data["month_to_date"]["expense"] == "65.00"
+        assert data["month_to_date"]["net"] == "935.00"
+        assert [(t["type"], t["id"]) for t in data["recent_transactions"]] == [
+            ("expense", travel["id"]),
+            ("expense", food["id"]),
+        ]
+        assert data["top_categories"] == [
+            {"category": "Food", "total": "40.00", "count": 1},
+            {"category": "Travel", "total": "25.00", "count": 1},
+        ]
+        assert [g["id"] for g in data["savings_goals"]] == [goal["id"]]
+        assert data["savings_goals"][0]["goal"] == "1000.00"
+
+    def test_dashboard_of_new_user(self, client: TestClient, authenticated_user_token: str):
+        """Test a user without entries gets zeros and empty lists"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/dashboard/", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert Decimal(data["balance"]["balance"]) == 0
+        assert Decimal(data["month_to_date"]["net"]) == 0
+        assert data["recent_transactions"] == []
+        assert data["top_categories"] == []
+        assert data["savings_goals"] == []
+
+    def test_dashboard_without_totals_row(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test a user not backfilled gets totals and month figures summed from the entries"""
+        now = datetime.utcnow().replace(microsecond=0)
+        db.add_all([
+            Income(user_id=test_user.id, amount=Decimal("300.00"), source="Salary", date=now),
+            Expense(user_id=test_user.id, amount=Decimal("20.00"), category="Food", date=now),
+            Expense(user_id=test_user.id, amount=Decimal("5.00"), category="Food", date=datetime(2024, 1, 5)),
+            Savings(user_id=test_user.id, amount=Decimal("50.00"), description="Bike"),
+        ])
+        db.commit()
+        db.query(UserTotals).delete()
+        db.query(MonthlyRollup).delete()
+        db.commit()
+
+        response = client.get("/api/v1/dashboard/", headers={"Authorization": f"Bearer {authenticated_user_token}"})
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        expected = get_user_balance(test_user, db)
+        assert {name: float(data["balance"][name]) for name in expected} == expected
+        assert (data["balance"]["income_count"], data["balance"]["expense_count"]) == (1, 2)
+        assert (data["month_to_date"]["income"], data["month_to_date"]["expense"]) == ("300.00", "20.00")
+        assert data["top_categories"] == [{"category": "Food", "total": "20.00", "count": 1}]
+
+    def test_dashboard_query_count(self, client: TestClient, authenticated_user_token: str):
+        """Test the dashboard takes two queries however many entries there are"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        counts = []
+        for index in range(3):
+            _post(client, headers, "incomes", {"amount": "100.00", "source": f"Source {index}"})
+            _post(client, headers, "expenses", {"amount": "5.00", "category": f"Category {index}", "date": datetime.utcnow().isoformat()})
+            _post(client, headers, "savings", {"amount": "1.00", "description": f"Goal {index}"})
+
+            response = client.get("/api/v1/dashboard/", headers=headers)
+            assert response.status_code == 200
+            counts.append(int(response.headers["X-DB-Query-Count"]))
+
+        assert counts == [2, 2, 2]
+        data = response.json()["data"]
+        assert len(data["recent_transactions"]) == 6
+        assert len(data["top_categories"]) == 3
+        assert len(data["savings_goals"]) == 3
@@ -0,0 +1,128 @@
+"""
+Tests for primary / replica session routing, using two SQLite files
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, timezone
+from fastapi import Request, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.db.database as database
+from app.db.database import Base, get_db
+from app.db.routing import SessionRouter, PRIMARY_STICKY_COOKIE
+from app.main import app
+from app.models import User, Expense
+from app.utils.auth import create_access_token
+
+
+def _make_db(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with factory() as session:
+        for user_id in (1, 2):
+            session.add(
+                User(
+                    id=user_id,
+                    email=f"replica{user_id}@example.com",
+                    password="hashed",
+                    first_name="Replica",
+                    last_name="User",
+                    role="user",
+                    balance=Decimal("1000.00"),
+                )
+            )
+        session.commit()
+    return factory
+
+
+@pytest.fixture
+def routed_app(tmp_path, monkeypatch):
+    """Serve the app through a SessionRouter over a primary and a replica file"""
+    primary = _make_db(tmp_path / "primary.db")
+    replica = _make_db(tmp_path / "replica.db")
+    monkeypatch.setattr(
+        database, "session_router", SessionRouter(primary, replica, sticky_seconds=30)
+    )
+    override = app.dependency_overrides.pop(get_db)
+    yield primary, replica
+    app.dependency_overrides[get_db] = override
+
+
+class TestSessionRouting:
+    """Test cases for read replica routing"""
+
+    def _headers(self, user_id: str = "1"):
+        token, _ = create_access_token(data={"user_id": user_id})
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_reads_go_to_replica(self, routed_app):
+        """Test GET requests are served by the replica"""
+        primary, replica = routed_app
+        with replica() as session:
+            session.add(
+                Expense(amount=Decimal("5.00"), category="Replica", user_id=1, date=datetime.now(timezone.utc))
+            )
+            session.commit()
+
+        response = TestClient(app).get("/api/v1/expenses/", headers=self._headers())
+
+        assert response.status_code == 200
+        assert [e["category"] for e in response.json()["data"]] == ["Replica"]
+
+    def test_writes_go_to_primary_and_stick(self, routed_app):
+        """Test writes hit the primary and the writer's next reads stick to it"""
+        primary, replica = routed_app
+        response = TestClient(app).post(
+            "/api/v1/expenses/",
+            json={"amount": "10.00", "category": "Food", "date": datetime.now(timezone.utc).isoformat()},
+            headers=self._headers(),
+        )
+        assert response.status_code == 201
+        # bearer clients do not send cookies, the token subject sticks instead
+        assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+        with primary() as session:
+            assert session.query(Expense).count() == 1
+        with replica() as session:
+            assert session.query(Expense).count() == 0
+
+        # read-your-writes for the writer, replica for everyone else
+        assert len(TestClient(app).get("/api/v1/expenses/", headers=self._headers()).json()["data"]) == 1
+        assert TestClient(app).get("/api/v1/expenses/", headers=self._headers("2")).json()["data"] == []
+
+    def test_anonymous_writes_stick_by_cookie(self, tmp_path):
+        """Test requests without a token fall back to the sticky cookie"""
+        primary = _make_db(tmp_path / "primary.db")
+        replica = _make_db(tmp_path / "replica.db")
+        router = SessionRouter(primary, replica, sticky_seconds=30)
+
+        def request(method, cookies=b""):
+            return Request(
+                {"type": "http", "method": method, "headers": [(b"cookie", cookies)]}
+            )
+
+        response = Response()
+        router.session_for(request("POST"), response).close()
+        cookie = response.headers["set-cookie"].split(";")[0].encode()
+        assert cookie.startswith(PRIMARY_STICKY_COOKIE.encode())
+
+        sticky = router.session_for(request("GET", cookie), Response())
+        fresh = router.session_for(request("GET"), Response())
+        assert sticky.bind is primary.kw["bind"]
+        assert fresh.bind is replica.kw["bind"]
+        sticky.close()
+        fresh.close()
+
+    def test_no_replica_uses_primary(self, tmp_path):
+        """Test the router falls back to the primary without a replica"""
+        primary = _make_db(tmp_path / "only.db")
+        router = SessionRouter(primary)
+
+        session = router.session_for(None, None)
+
+        assert session.bind is primary.kw["bind"]
+        session.close()
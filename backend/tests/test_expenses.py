@@ -108,6 +108,39 @@ class TestExpenseRoutes:
         data = response.json()
         assert len(data["data"]) == 2
 
+    def test_read_all_expenses_with_cursor(self, client: TestClient, test_user: User, authenticated_user_token: str, db):
+        """Test paging through expenses with next_cursor"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        same_day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        db.add_all(
+            [
+                Expense(amount=Decimal("10.00"), category="Food", user_id=test_user.id, date=same_day)
+                for _ in range(5)
+            ]
+        )
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            url = "/api/v1/expenses/?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(expense["id"] for expense in data["data"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert seen == sorted(seen, reverse=True)
+
+    def test_read_all_expenses_invalid_cursor(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test an invalid cursor is rejected"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        response = client.get("/api/v1/expenses/?cursor=not-a-cursor", headers=headers)
+
+        assert response.status_code == 400
+
     def test_read_all_expenses_empty(self, client: TestClient, test_user: User, authenticated_user_token: str):
         """Test retrieving expenses when none exist"""
         headers = {"Authorization": f"Bearer {authenticated_user_token}"}
@@ -297,3 +330,107 @@ class TestExpenseRoutes:
         admin_expenses = response.json()["data"]
         assert len(admin_expenses) == 1
         assert admin_expenses[0]["user_id"] == test_admin_user.id
+
+
+class TestBulkExpenses:
+    """Test cases for bulk expense creation"""
+
+    def test_bulk_create_reports_row_errors(self, client: TestClient, test_user: User, authenticated_user_token: str, db):
+        """Test valid rows are inserted, invalid and uncovered rows are reported"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        date = datetime.now(timezone.utc).isoformat()
+        items = [
+            {"amount": "100.00", "category": "Food", "date": date},
+            {"amount": "-5.00", "category": "Food", "date": date},
+            {"amount": "950.00", "category": "Rent", "date": date},
+            {"amount": "200.00", "category": "Travel", "date": date},
+            {"category": "Food", "date": date},
+        ]
+
+        response = client.post("/api/v1/expenses/bulk", json={"items": items}, headers=headers)
+
+        assert response.status_code == 200
+        result = response.json()["data"]
+        assert result["created"] == 2
+        assert len(result["ids"]) == 2
+        assert [error["index"] for error in result["errors"]] == [1, 2, 4]
+        assert result["errors"][1]["error"] == "Insufficient balance"
+        assert "amount" in result["errors"][2]["error"]
+
+        db.refresh(test_user)
+        assert test_user.balance == Decimal("700.00")
+        categories = [e.category for e in db.query(Expense).order_by(Expense.id)]
+        assert categories == ["Food", "Travel"]
+
+    def test_bulk_create_too_many_rows(self, client: TestClient, test_user: User, authenticated_user_token: str, monkeypatch):
+        """Test batches over the row limit are rejected"""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "bulk_max_rows", 2)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post("/api/v1/expenses/bulk", json={"items": [{}, {}, {}]}, headers=headers)
+
+        assert response.status_code == 413
+
+
+class TestExpenseStats:
+    """Test cases for the SQL-aggregated expense endpoints"""
+
+    @pytest.fixture
+    def old_expense(self, db, test_user: User):
+        expense = Expense(amount=Decimal("20.00"), category="Food", user_id=test_user.id, date=datetime(2024, 1, 10))
+        db.add(expense)
+        db.commit()
+        return expense
+
+    def test_expense_stats(self, client: TestClient, authenticated_user_token: str, multiple_test_expenses, old_expense):
+        """Test sum, count, average, min and max with category and date filters"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        stats = client.get("/api/v1/expenses/stats", headers=headers).json()["data"]
+        food = client.get("/api/v1/expenses/stats?category=Food", headers=headers).json()["data"]
+        january = client.get("/api/v1/expenses/stats?start=2024-01-01&end=2024-01-31", headers=headers).json()["data"]
+
+        assert {key: Decimal(str(stats[key])) for key in ("total", "count", "average", "min", "max")} == {
+            "total": Decimal("245.50"),
+            "count": 4,
+            "average": Decimal("61.38"),
+            "min": Decimal("20.00"),
+            "max": Decimal("100.00"),
+        }
+        assert Decimal(food["total"]) == Decimal("70.00") and food["count"] == 2
+        assert Decimal(january["total"]) == Decimal("20.00") and january["count"] == 1
+
+    def test_expense_stats_empty(self, client: TestClient, authenticated_user_token: str):
+        """Test a user without expenses gets zero totals and no average"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        stats = client.get("/api/v1/expenses/stats", headers=headers).json()["data"]
+
+        assert Decimal(stats["total"]) == 0
+        assert stats["count"] == 0
+        assert stats["average"] is None and stats["min"] is None
+
+    def test_monthly_expenses(self, client: TestClient, authenticated_user_token: str, multiple_test_expenses, old_expense):
+        """Test expenses are summed per month, oldest first"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/expenses/monthly", headers=headers)
+
+        assert response.status_code == 200
+        months = [(m["month"], Decimal(m["total"]), m["count"]) for m in response.json()["data"]]
+        assert months == [
+            ("2024-01-01", Decimal("20.00"), 1),
+            (datetime.now(timezone.utc).date().replace(day=1).isoformat(), Decimal("225.50"), 3),
+        ]
+
+    def test_total_and_category_with_date_range(self, client: TestClient, authenticated_user_token: str, multiple_test_expenses, old_expense):
+        """Test the total and the category listing honour start and end"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        total = client.get("/api/v1/expenses/total?end=2024-12-31", headers=headers).json()
+        food = client.get("/api/v1/expenses/category/Food?start=2025-01-01", headers=headers).json()["data"]
+
+        assert total["total_expenses"] == 20.0
+        assert [expense["id"] for expense in food] == [multiple_test_expenses[0].id]
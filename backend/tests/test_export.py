@@ -0,0 +1,95 @@
+"""
+Tests for CSV export routes
+"""
+import csv
+import io
+from decimal import Decimal
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models import User, Expense, Income
+from app.utils.export import iter_csv
+
+
+def _rows(response):
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+def _seed(db: Session, user: User):
+    db.add_all([
+        Expense(amount=Decimal("10.00"), category="Food", date=datetime(2025, 1, 5, 12), user_id=user.id),
+        Expense(amount=Decimal("20.00"), category="Rent", date=datetime(2025, 2, 1, 9), user_id=user.id),
+        Expense(amount=Decimal("30.00"), category="Travel", date=datetime(2025, 3, 10), user_id=user.id),
+        Income(amount=Decimal("500.00"), source="Salary", date=datetime(2025, 1, 31, 8), user_id=user.id),
+    ])
+    db.commit()
+
+
+class TestExportRoutes:
+    """Test cases for CSV export routes"""
+
+    def test_export_expenses(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test expenses are streamed as CSV, oldest first"""
+        _seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get("/api/v1/expenses/export.csv", headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "expenses.csv" in response.headers["content-disposition"]
+        rows = _rows(response)
+        assert rows[0] == ["id", "date", "category", "amount"]
+        assert [row[2] for row in rows[1:]] == ["Food", "Rent", "Travel"]
+
+    def test_export_expenses_date_range(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test start and end days are both inclusive"""
+        _seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.get(
+            "/api/v1/expenses/export.csv",
+            params={"start": "2025-01-06", "end": "2025-02-01"},
+            headers=headers,
+        )
+
+        assert [row[2] for row in _rows(response)[1:]] == ["Rent"]
+
+    def test_export_incomes(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test incomes are streamed as CSV"""
+        _seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        rows = _rows(client.get("/api/v1/incomes/export.csv", headers=headers))
+
+        assert rows[0] == ["id", "date", "source", "amount"]
+        assert rows[1][2:] == ["Salary", "500.00"]
+
+    def test_export_transactions(self, client: TestClient, test_user: User, authenticated_user_token: str, db: Session):
+        """Test the combined export interleaves expenses and incomes by date"""
+        _seed(db, test_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        rows = _rows(client.get("/api/v1/transactions/export.csv", headers=headers))
+
+        assert rows[0] == ["id", "date", "type", "category", "amount"]
+        assert [(row[2], row[3]) for row in rows[1:]] == [
+            ("expense", "Food"),
+            ("income", "Salary"),
+            ("expense", "Rent"),
+            ("expense", "Travel"),
+        ]
+
+    def test_export_only_own_rows(self, client: TestClient, test_user: User, test_admin_user: User, authenticated_user_token: str, db: Session):
+        """Test exports never include other users' transactions"""
+        _seed(db, test_admin_user)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        assert len(_rows(client.get("/api/v1/transactions/export.csv", headers=headers))) == 1
+
+    def test_iter_csv_yields_batches(self):
+        """Test iter_csv yields one chunk per batch"""
+        chunks = list(iter_csv(("n",), ((i,) for i in range(5)), batch_size=2))
+
+        assert len(chunks) == 3
+        assert "".join(chunks).split() == ["n", "0", "1", "2", "3", "4"]
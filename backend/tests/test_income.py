@@ -267,3 +267,66 @@ class TestIncomeRoutes:
         admin_incomes = response.json()["data"]
         assert len(admin_incomes) == 1
         assert all(inc["user_id"] == test_admin_user.id for inc in admin_incomes)
+
+
+class TestBulkIncomes:
+    """Test cases for bulk income creation"""
+
+    def test_bulk_create_incomes(self, client: TestClient, test_user: User, authenticated_user_token: str, db):
+        """Test a batch adjusts the balance once and reports invalid rows"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        items = [
+            {"amount": "250.00", "source": "Salary", "date": "2025-01-31T09:00:00"},
+            {"amount": "0", "source": "Gift"},
+            {"amount": "50.00", "source": "Gift"},
+        ]
+
+        response = client.post("/api/v1/incomes/bulk", json={"items": items}, headers=headers)
+
+        assert response.status_code == 200
+        result = response.json()["data"]
+        assert result["created"] == 2
+        assert [error["index"] for error in result["errors"]] == [1]
+
+        db.refresh(test_user)
+        assert test_user.balance == Decimal("1300.00")
+        incomes = db.query(Income).filter(Income.id.in_(result["ids"])).all()
+        assert sorted(income.source for income in incomes) == ["Gift", "Salary"]
+        assert all(income.date is not None for income in incomes)
+
+
+class TestIncomeStats:
+    """Test cases for the SQL-aggregated income endpoints"""
+
+    def test_income_total_and_stats(self, client: TestClient, authenticated_user_token: str, multiple_test_incomes):
+        """Test the total and per-source stats"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        total = client.get("/api/v1/incomes/total", headers=headers).json()
+        salary = client.get("/api/v1/incomes/stats?source=Salary", headers=headers).json()["data"]
+
+        assert total["total_income"] == 3100.0
+        assert Decimal(salary["average"]) == Decimal("2500.00")
+        assert salary["count"] == 1
+
+    def test_incomes_by_source_and_month(self, client: TestClient, authenticated_user_token: str, multiple_test_incomes):
+        """Test the source listing and the monthly sums"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        freelance = client.get("/api/v1/incomes/source/Freelance", headers=headers).json()["data"]
+        months = client.get("/api/v1/incomes/monthly", headers=headers).json()["data"]
+
+        assert [income["source"] for income in freelance] == ["Freelance"]
+        assert [(m["month"], Decimal(m["total"]), m["count"]) for m in months] == [
+            (datetime.now(timezone.utc).date().replace(day=1).isoformat(), Decimal("3100.00"), 3)
+        ]
+
+    def test_total_income_from_totals_row(self, client: TestClient, authenticated_user_token: str):
+        """Test the unbounded total follows entries created through the API"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        client.post("/api/v1/incomes/", json={"amount": "120.00", "source": "Salary"}, headers=headers)
+        client.post("/api/v1/incomes/", json={"amount": "30.00", "source": "Gift"}, headers=headers)
+
+        response = client.get("/api/v1/incomes/total", headers=headers)
+
+        assert response.json()["total_income"] == 150.0
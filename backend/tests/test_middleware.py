@@ -0,0 +1,164 @@
+"""
+Tests for application middleware
+"""
+
+import asyncio
+import contextvars
+import logging
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from app.db.metrics import start_request_stats
+from app.middleware.db_metrics import DBMetricsMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.middleware.security import SecurityHeadersMiddleware
+from app.middleware.timing import TimingMiddleware
+from app.models import User
+
+
+class TestDBMetricsMiddleware:
+    """Test cases for per-request database metrics"""
+
+    def test_metrics_headers_present(self, client: TestClient):
+        """Test every response reports its database work"""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["X-DB-Query-Count"] == "0"
+        assert float(response.headers["X-DB-Time-Ms"]) == 0
+        assert "X-DB-Pool-Wait-Ms" in response.headers
+
+    def test_metrics_count_queries(self, client: TestClient, test_user: User, authenticated_user_token: str, multiple_test_expenses):
+        """Test queries issued while serving a route are counted"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        response = client.get("/api/v1/expenses/", headers=headers)
+
+        assert response.status_code == 200
+        # user lookup + expense page
+        assert int(response.headers["X-DB-Query-Count"]) >= 2
+        assert float(response.headers["X-DB-Time-Ms"]) > 0
+
+    def test_metrics_logged_once(self, client: TestClient, caplog):
+        """Test one structured log line is emitted per request"""
+        with caplog.at_level(logging.INFO, logger="app.db.metrics"):
+            client.get("/")
+
+        lines = [r.getMessage() for r in caplog.records if r.name == "app.db.metrics"]
+        assert len(lines) == 1
+        assert "path=/ status=200 queries=0" in lines[0]
+
+
+    def test_failed_queries_counted(self, db):
+        """Test a failing statement is counted and leaves no timer behind"""
+        def run():
+            stats = start_request_stats()
+            with pytest.raises(OperationalError):
+                db.execute(text("SELECT * FROM missing_table"))
+            db.rollback()
+            db.execute(text("SELECT 1"))
+            return stats
+
+        # in a copy of the context, so the stats do not outlive the test
+        stats = contextvars.copy_context().run(run)
+
+        assert stats.query_count == 2
+        assert stats.db_time > 0
+        assert not db.connection().info.get("query_start_time")
+
+class TestASGIMiddleware:
+    """Test cases for the security, request id and timing middleware"""
+
+    def test_security_headers(self, client: TestClient):
+        """Test security headers are set once on every response"""
+        response = client.get("/")
+
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["Content-Security-Policy"] == "default-src 'self'"
+        assert response.headers.get_list("X-Content-Type-Options") == ["nosniff"]
+
+    def test_request_id_generated(self, client: TestClient, caplog):
+        """Test a request without an id gets a fresh one, logged with the metrics"""
+        with caplog.at_level(logging.INFO, logger="app.db.metrics"):
+            first = client.get("/").headers["X-Request-ID"]
+        second = client.get("/").headers["X-Request-ID"]
+
+        assert len(first) == 32 and first != second
+        lines = [r.getMessage() for r in caplog.records if r.name == "app.db.metrics"]
+        assert lines[0].endswith(f"request_id={first}")
+
+    def test_request_id_propagated(self, client: TestClient):
+        """Test a well formed incoming id is kept and a malformed one replaced"""
+        kept = client.get("/", headers={"X-Request-ID": "edge-1234.abc"})
+        replaced = client.get("/", headers={"X-Request-ID": "bad id\r\nx: y"})
+
+        assert kept.headers["X-Request-ID"] == "edge-1234.abc"
+        assert replaced.headers["X-Request-ID"] != "bad id\r\nx: y"
+
+    def test_response_time_header(self, client: TestClient):
+        """Test the time to response start is reported"""
+        response = client.get("/")
+
+        assert float(response.headers["X-Response-Time-Ms"]) >= 0
+
+    def test_streaming_passes_through(self):
+        """Test body chunks reach the server as they are produced"""
+        events = []
+
+        async def chunks():
+            for index in range(3):
+                events.append(f"produce {index}")
+                yield f"chunk {index}\n".encode()
+
+        async def endpoint(request):
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        app = Starlette(
+            routes=[Route("/stream", endpoint)],
+            middleware=[
+                Middleware(RequestIDMiddleware),
+                Middleware(TimingMiddleware),
+                Middleware(DBMetricsMiddleware),
+                Middleware(SecurityHeadersMiddleware),
+            ],
+        )
+
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            # no disconnect, the streaming response's listener waits
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                events.append("start")
+            elif message.get("body"):
+                events.append(f"send {message['body'].decode().strip()}")
+
+        scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": "GET",
+            "path": "/stream",
+            "raw_path": b"/stream",
+            "root_path": "",
+            "scheme": "http",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 1),
+            "server": ("testserver", 80),
+        }
+        asyncio.run(app(scope, receive, send))
+
+        assert events == [
+            "start",
+            "produce 0", "send chunk 0",
+            "produce 1", "send chunk 1",
+            "produce 2", "send chunk 2",
+        ]
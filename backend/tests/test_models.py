@@ -4,6 +4,7 @@ Tests for database models
 import pytest
 from decimal import Decimal
 from datetime import datetime, timezone
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 
 from app.models import User, Income, Expense, Savings
@@ -318,3 +319,34 @@ class TestSavingsModel:
 
         assert test_savings.current_amount != original_amount
         assert test_savings.current_amount == Decimal("3000.00")
+
+
+class TestModelIndexes:
+    """Test cases for the per-user composite indexes"""
+
+    @pytest.mark.parametrize(
+        "table, index_name",
+        [
+            ("expenses", "ix_expenses_user_id_date"),
+            ("incomes", "ix_incomes_user_id_date"),
+            ("savings", "ix_savings_user_id_created_at"),
+        ],
+    )
+    def test_user_date_index_exists(self, db: Session, table: str, index_name: str):
+        """Test the (user_id, date) index is created with the table"""
+        indexes = {index["name"]: index for index in inspect(db.get_bind()).get_indexes(table)}
+
+        assert index_name in indexes
+        assert indexes[index_name]["column_names"][0] == "user_id"
+
+    def test_user_listing_uses_index(self, db: Session, test_user: User):
+        """Test per-user listings are served by an index search"""
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM expenses "
+                "WHERE user_id = :user_id ORDER BY date DESC, id DESC"
+            ),
+            {"user_id": test_user.id},
+        ).fetchall()
+
+        assert "ix_expenses_user_id_date" in " ".join(str(row[-1]) for row in plan)
@@ -0,0 +1,242 @@
+"""
+Tests for recurring rules and their scheduler
+"""
+from decimal import Decimal
+from datetime import date
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, sessionmaker
+from app.models import User, Expense, Income, RecurringRule, UserTotals, MonthlyRollup
+from app.services import recurring_service
+from app.services.recurring_scheduler import RecurringScheduler
+from app.services.recurring_service import materialize_due_rules
+from app.utils.recurring import MONTHLY, WEEKLY, YEARLY, add_months, due_dates
+
+TODAY = date(2025, 3, 20)
+
+
+def _rule(user: User, kind: str, amount: str, category: str, start: date, **fields) -> RecurringRule:
+    return RecurringRule(
+        user_id=user.id,
+        kind=kind,
+        amount=Decimal(amount),
+        category=category,
+        interval=fields.pop("interval", MONTHLY),
+        start_date=start,
+        next_due=start,
+        **fields,
+    )
+
+
+class TestRecurringDates:
+    """Test cases for occurrence dates"""
+
+    def test_month_end_does_not_drift(self):
+        """Test a rule on the 31st clamps to short months and returns to the 31st"""
+        dates, following = due_dates(date(2024, 1, 31), date(2024, 4, 30), date(2024, 1, 31), MONTHLY, 1)
+
+        assert dates == [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]
+        assert following == date(2024, 5, 31)
+        assert add_months(date(2024, 2, 29), 12) == date(2025, 2, 28)
+
+    def test_every_and_end_date(self):
+        """Test every N intervals stops at the end date"""
+        dates, following = due_dates(
+            date(2025, 1, 6), date(2025, 12, 31), date(2025, 1, 6), WEEKLY, 2, end=date(2025, 2, 10)
+        )
+
+        assert dates == [date(2025, 1, 6), date(2025, 1, 20), date(2025, 2, 3)]
+        assert following == date(2025, 2, 17)
+        assert due_dates(date(2020, 2, 29), TODAY, date(2020, 2, 29), YEARLY, 5)[0] == [date(2020, 2, 29), date(2025, 2, 28)]
+
+
+class TestMaterializeDueRules:
+    """Test cases for batched materialization"""
+
+    def test_catch_up_creates_every_missed_occurrence(self, db: Session, test_user: User, test_admin_user: User):
+        """Test a batch covers several users, balances, totals and rollups, once"""
+        db.add_all([
+            _rule(test_user, "income", "100.00", "Salary", date(2025, 1, 15)),
+            _rule(test_user, "expense", "40.00", "Rent", date(2025, 1, 1)),
+            _rule(test_admin_user, "expense", "10.00", "Gym", date(2025, 3, 1), interval=WEEKLY),
+        ])
+        db.commit()
+
+        result = materialize_due_rules(db, TODAY)
+
+        assert (result.claimed, result.incomes, result.expenses, result.skipped) == (3, 3, 6, 0)
+        db.expire_all()
+        assert db.get(User, test_user.id).balance == Decimal("1180.00")
+        assert db.get(User, test_admin_user.id).balance == Decimal("4970.00")
+        totals = db.get(UserTotals, test_user.id)
+        assert (totals.total_income, totals.expense_count) == (Decimal("300.00"), 3)
+        rollup = db.get(MonthlyRollup, (test_user.id, date(2025, 2, 1), "expense", "Rent"))
+        assert rollup.total == Decimal("40.00")
+        assert sorted(result.next_due.values()) == [date(2025, 3, 22), date(2025, 4, 1), date(2025, 4, 15)]
+
+        again = materialize_due_rules(db, TODAY)
+        assert again.claimed == 0
+        assert again.next_due is None
+        assert db.query(Expense).count() == 6
+
+    def test_without_catch_up_only_latest_occurrence(self, db: Session, test_user: User):
+        """Test missed occurrences are skipped and the watermark still moves past them"""
+        db.add(_rule(test_user, "income", "50.00", "Rent", date(2024, 12, 5)))
+        db.commit()
+
+        result = materialize_due_rules(db, TODAY, catch_up=False)
+
+        assert (result.incomes, result.skipped) == (1, 3)
+        assert db.scalar(select(Income.date)).date() == date(2025, 3, 5)
+        assert db.scalar(select(RecurringRule.next_due)) == date(2025, 4, 5)
+
+    def test_expense_over_balance_is_skipped(self, db: Session, test_user: User):
+        """Test an expense the balance cannot cover is skipped, not created"""
+        db.add_all([
+            _rule(test_user, "expense", "600.00", "Rent", date(2025, 2, 1)),
+            _rule(test_user, "income", "100.00", "Salary", date(2025, 3, 1), end_date=date(2025, 3, 1)),
+        ])
+        db.commit()
+
+        result = materialize_due_rules(db, TODAY)
+
+        assert (result.incomes, result.expenses, result.skipped) == (1, 1, 1)
+        db.expire_all()
+        assert db.get(User, test_user.id).balance == Decimal("500.00")
+        assert db.scalar(select(RecurringRule.is_active).where(RecurringRule.category == "Salary")) is False
+
+    def test_rule_claimed_elsewhere_is_skipped(self, db: Session, test_user: User, monkeypatch):
+        """Test a watermark moved by another worker after the read makes the claim miss"""
+        db.add(_rule(test_user, "income", "100.00", "Salary", date(2025, 3, 1)))
+        db.commit()
+        due = recurring_service.due_dates
+
+        def other_worker_first(*args, **kwargs):
+            db.execute(
+                update(RecurringRule)
+                .values(next_due=date(2025, 4, 1))
+                .execution_options(synchronize_session=False)
+            )
+            return due(*args, **kwargs)
+
+        monkeypatch.setattr(recurring_service, "due_dates", other_worker_first)
+
+        result = materialize_due_rules(db, TODAY)
+
+        assert (result.claimed, result.incomes) == (0, 0)
+        assert db.query(Income).count() == 0
+
+
+class TestRecurringScheduler:
+    """Test cases for the heap scheduler"""
+
+    def test_run_once_drains_in_batches(self, db: Session, test_user: User, test_admin_user: User):
+        """Test small batches and a small heap still cover every due rule once"""
+        for day in range(1, 6):
+            db.add(_rule(test_user, "income", "1.00", f"Source {day}", date(2025, 3, day)))
+        db.add(_rule(test_admin_user, "income", "1.00", "Later", date(2025, 3, 21)))
+        db.commit()
+        scheduler = RecurringScheduler(sessionmaker(bind=db.get_bind()), batch_size=2, max_loaded=3)
+
+        result = scheduler.run_once(TODAY)
+
+        assert (result.claimed, result.incomes) == (5, 5)
+        assert scheduler.run_once(TODAY).claimed == 0
+        assert scheduler.run_once(date(2025, 3, 21)).incomes == 1
+
+
+class TestRecurringRoutes:
+    """Test cases for recurring rule routes"""
+
+    def test_create_update_delete(self, client: TestClient, test_user: User, authenticated_user_token: str):
+        """Test a rule is due on its start date and can be paused and deleted"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post(
+            "/api/v1/recurring/",
+            json={"kind": "expense", "amount": "25.00", "category": "Gym", "interval": "weekly", "start_date": "2025-03-03"},
+            headers=headers,
+        )
+
+        assert response.status_code == 201
+        rule = response.json()["data"]
+        assert (rule["next_due"], rule["every"], rule["is_active"]) == ("2025-03-03", 1, True)
+
+        response = client.put(f"/api/v1/recurring/{rule['id']}", json={"is_active": False}, headers=headers)
+        assert response.json()["data"]["is_active"] is False
+        assert client.delete(f"/api/v1/recurring/{rule['id']}", headers=headers).status_code == 200
+        assert client.get("/api/v1/recurring/", headers=headers).json()["data"] == []
+
+    def test_reactivated_rule_does_not_backfill(self, client: TestClient, db: Session, test_user: User, authenticated_user_token: str, monkeypatch):
+        """Test a paused or ended rule resumes from today, not from its old next_due"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        response = client.post(
+            "/api/v1/recurring/",
+            json={"kind": "income", "amount": "10.00", "category": "Pocket", "interval": "weekly", "start_date": "2025-03-03"},
+            headers=headers,
+        )
+        rule_id = response.json()["data"]["id"]
+        materialize_due_rules(db, date(2025, 3, 10))
+        client.put(f"/api/v1/recurring/{rule_id}", json={"is_active": False}, headers=headers)
+
+        monkeypatch.setattr(recurring_service, "utc_today", lambda: date(2025, 4, 9))
+        response = client.put(f"/api/v1/recurring/{rule_id}", json={"is_active": True}, headers=headers)
+
+        assert response.json()["data"]["next_due"] == "2025-04-14"
+        assert materialize_due_rules(db, date(2025, 4, 14)).incomes == 1
+        assert db.query(Income).count() == 3
+
+        # ended on its end date, then extended
+        client.put(f"/api/v1/recurring/{rule_id}", json={"end_date": "2025-04-15"}, headers=headers)
+        materialize_due_rules(db, date(2025, 4, 30))
+        monkeypatch.setattr(recurring_service, "utc_today", lambda: date(2025, 5, 20))
+        response = client.put(f"/api/v1/recurring/{rule_id}", json={"end_date": "2025-06-30"}, headers=headers)
+
+        rule = response.json()["data"]
+        assert (rule["next_due"], rule["is_active"]) == ("2025-05-26", True)
+        assert materialize_due_rules(db, date(2025, 5, 26)).incomes == 1
+        assert db.query(Income).count() == 4
+
+    def test_end_before_start_rejected(self, client: TestClient, authenticated_user_token: str):
+        """Test a rule cannot end before it starts"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post(
+            "/api/v1/recurring/",
+            json={"kind": "income", "amount": "5.00", "category": "Gift", "start_date": "2025-03-03", "end_date": "2025-03-01"},
+            headers=headers,
+        )
+
+        assert response.status_code == 422
+
+    def test_update_end_before_start_rejected(self, client: TestClient, authenticated_user_token: str):
+        """Test an update cannot move the end date before the rule's start"""
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+        response = client.post(
+            "/api/v1/recurring/",
+            json={"kind": "income", "amount": "5.00", "category": "Gift", "start_date": "2025-03-03"},
+            headers=headers,
+        )
+        rule_id = response.json()["data"]["id"]
+
+        response = client.put(f"/api/v1/recurring/{rule_id}", json={"end_date": "2025-03-01"}, headers=headers)
+
+        assert response.status_code == 400
+        assert client.get("/api/v1/recurring/", headers=headers).json()["data"][0]["end_date"] is None
+
+    def test_other_users_rule_not_found(self, client: TestClient, test_user: User, authenticated_user_token: str, authenticated_admin_token: str):
+        """Test rules of other users cannot be updated"""
+        response = client.post(
+            "/api/v1/recurring/",
+            json={"kind": "income", "amount": "5.00", "category": "Gift", "start_date": "2025-03-03"},
+            headers={"Authorization": f"Bearer {authenticated_user_token}"},
+        )
+        rule_id = response.json()["data"]["id"]
+
+        response = client.put(
+            f"/api/v1/recurring/{rule_id}",
+            json={"amount": "6.00"},
+            headers={"Authorization": f"Bearer {authenticated_admin_token}"},
+        )
+
+        assert response.status_code == 404
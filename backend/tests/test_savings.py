@@ -404,3 +404,40 @@ class TestSavingsRoutes:
             )
             assert response.status_code == 200
             assert response.json()["data"]["current_amount"] == str(amount)
+
+    def test_totals_changes_lock_the_user_row(
+        self,
+        client: TestClient,
+        test_user: User,
+        authenticated_user_token: str,
+        monkeypatch,
+    ):
+        """Test create, amount update and delete lock the user before the totals"""
+        from app.services import savings_service
+
+        locked = []
+        lock_user = savings_service._lock_user
+
+        def recording_lock(db, user_id):
+            locked.append(user_id)
+            return lock_user(db, user_id)
+
+        monkeypatch.setattr(savings_service, "_lock_user", recording_lock)
+        headers = {"Authorization": f"Bearer {authenticated_user_token}"}
+
+        response = client.post(
+            "/api/v1/savings/", json={"amount": "100.00"}, headers=headers
+        )
+        savings_id = response.json()["data"]["id"]
+        client.put(
+            f"/api/v1/savings/{savings_id}",
+            json={"current_amount": "10.00"},
+            headers=headers,
+        )
+        assert locked == [test_user.id]
+
+        client.put(
+            f"/api/v1/savings/{savings_id}", json={"amount": "200.00"}, headers=headers
+        )
+        client.delete(f"/api/v1/savings/{savings_id}", headers=headers)
+        assert locked == [test_user.id] * 3
@@ -1,6 +1,7 @@
 """
 Tests for Pydantic schemas
 """
+import json
 import pytest
 from decimal import Decimal
 from datetime import datetime, timezone
@@ -313,3 +314,118 @@ class TestSavingsSchema:
         savings = SavingsResponse(**response_data)
         assert savings.is_completed is True
         assert savings.current_amount == savings.amount
+
+
+class TestFastListResponses:
+    """Contract tests of the orjson list responses against the response schemas"""
+
+    @pytest.mark.parametrize(
+        "path, limit",
+        [
+            ("/api/v1/expenses/", 2),
+            ("/api/v1/incomes/", 2),
+            ("/api/v1/savings/", 1),
+            ("/api/v1/admin/users", 1),
+        ],
+    )
+    def test_body_matches_response_model(
+        self,
+        client,
+        test_admin_user,
+        authenticated_admin_token,
+        db,
+        monkeypatch,
+        path,
+        limit,
+    ):
+        """Test the fast path renders the same bytes as the response_model"""
+        from app.core.config import settings
+        from app.models import Expense, Income, Savings
+
+        db.add_all(
+            [
+                Expense(amount=Decimal("12.50"), category="Café", user_id=test_admin_user.id),
+                Expense(amount=Decimal("3.00"), category="Food", user_id=test_admin_user.id),
+                Expense(amount=Decimal("0.99"), category="Food", user_id=test_admin_user.id),
+                Income(amount=Decimal("1000.00"), source="Salary", user_id=test_admin_user.id),
+                Income(amount=Decimal("0.10"), source="Interest", user_id=test_admin_user.id),
+                Income(amount=Decimal("7.00"), source="Gift", user_id=test_admin_user.id),
+                Savings(
+                    amount=Decimal("500.00"),
+                    current_amount=Decimal("20.00"),
+                    goal=Decimal("500.00"),
+                    is_completed=False,
+                    user_id=test_admin_user.id,
+                ),
+                Savings(
+                    amount=Decimal("100.00"),
+                    current_amount=Decimal("0.00"),
+                    target_date=datetime(2027, 1, 1, 12, 30, 15, 250000),
+                    duration_months=6,
+                    description=None,
+                    is_completed=True,
+                    user_id=test_admin_user.id,
+                ),
+            ]
+        )
+        db.commit()
+        headers = {"Authorization": f"Bearer {authenticated_admin_token}"}
+
+        bodies = {}
+        for fast in (False, True):
+            monkeypatch.setattr(settings, "fast_list_responses", fast)
+            first = client.get(f"{path}?limit={limit}", headers=headers)
+            cursor = first.json()["next_cursor"]
+            second = client.get(f"{path}?limit={limit}&cursor={cursor}", headers=headers)
+            assert first.status_code == second.status_code == 200
+            assert first.headers["content-type"] == "application/json"
+            bodies[fast] = (first.content, second.content)
+
+        assert cursor is not None
+        assert bodies[True] == bodies[False]
+
+    @pytest.mark.parametrize(
+        "columns, schema",
+        [
+            ("app.routes.expense:EXPENSE_COLUMNS", "app.schema.expense:ExpenseResponse"),
+            ("app.routes.income:INCOME_COLUMNS", "app.schema.income:IncomeResponse"),
+            ("app.routes.savings:SAVINGS_COLUMNS", "app.schema.savings:SavingsResponse"),
+            ("app.routes.admin:USER_COLUMNS", "app.schema.user:UserResponse"),
+        ],
+    )
+    def test_columns_match_schema_fields(self, columns, schema):
+        """Test each fast path selects exactly its response schema's fields, in order"""
+        import importlib
+
+        def load(path):
+            module, name = path.split(":")
+            return getattr(importlib.import_module(module), name)
+
+        assert [column.key for column in load(columns)] == list(load(schema).model_fields)
+
+    def test_nullable_columns_render_as_response_model(self):
+        """Test nulls and extra columns give the response_model's body or error"""
+        from collections import namedtuple
+        from app.schema.base import PaginatedResponse
+        from app.utils.fast_json import paginated_json
+
+        fields = list(SavingsResponse.model_fields)
+        Row = namedtuple("Row", fields)
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        values = dict(
+            id=1, amount=Decimal("5.00"), current_amount=Decimal("0.00"), target_date=None,
+            duration_months=None, goal=None, description=None, is_completed=False,
+            user_id=1, created_at=now, updated_at=now,
+        )
+
+        def body(rows):
+            return json.loads(paginated_json("ok", rows, None, SavingsResponse).body)
+
+        expected = PaginatedResponse[list[SavingsResponse]](
+            message="ok", data=[SavingsResponse(**values)]
+        ).model_dump(mode="json")
+        assert body([Row(**values)]) == expected
+        Extra = namedtuple("Extra", fields + ["password"])
+        assert body([Extra(**values, password="secret")]) == expected
+        with pytest.raises(ValidationError):
+            body([Row(**{**values, "current_amount": None})])
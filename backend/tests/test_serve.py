@@ -0,0 +1,95 @@
+"""
+Tests for the multi-worker serve entry point
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import httpx
+import pytest
+from app.serve import bind_socket, default_workers, warm_up
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid: int) -> set[int]:
+    found = set()
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as stat:
+                    # the ppid follows the parenthesised command name
+                    if int(stat.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        found.add(int(entry))
+            except (OSError, IndexError, ValueError):
+                pass
+    return found
+
+
+class TestServe:
+    """Test cases for app.serve"""
+
+    def test_default_workers_follow_cpu_affinity(self):
+        """Test the default worker count is the number of usable CPUs"""
+        assert default_workers() == len(os.sched_getaffinity(0))
+
+    def test_bound_socket_is_tcp(self):
+        """Test the shared socket is IPPROTO_TCP so asyncio disables Nagle on connections"""
+        sock = bind_socket("127.0.0.1", 0, 16)
+        try:
+            assert sock.proto == socket.IPPROTO_TCP
+            assert sock.get_inheritable()
+        finally:
+            sock.close()
+
+    def test_warm_up_builds_deferred_schemas(self):
+        """Test the parent builds the deferred validators before forking"""
+        from app.schema.user import UserCreate, UserResponse
+        from pydantic_core import SchemaValidator
+
+        warm_up()
+
+        assert isinstance(UserResponse.__pydantic_validator__, SchemaValidator)
+        assert isinstance(UserCreate.__pydantic_validator__, SchemaValidator)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+    def test_workers_serve_and_stop_on_sigterm(self):
+        """Test the forked workers share the socket and all exit cleanly on SIGTERM"""
+        port = _free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "app.serve", "--workers", "2", "--host", "127.0.0.1", "--port", str(port)],
+            cwd=BACKEND_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    response = httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+                    break
+                except httpx.TransportError:
+                    assert time.monotonic() < deadline, "server did not start"
+                    time.sleep(0.2)
+
+            assert response.status_code == 200
+            assert "X-Request-ID" in response.headers
+            workers = _children(server.pid)
+            assert len(workers) == 2
+
+            server.send_signal(signal.SIGTERM)
+            assert server.wait(timeout=30) == 0
+            assert not any(os.path.exists(f"/proc/{pid}") for pid in workers)
+        finally:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
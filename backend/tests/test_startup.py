@@ -0,0 +1,73 @@
+"""
+Tests for the import time of the app
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# cumulative `python -X importtime` of app.main, IMPORT_TIME_BUDGET_MS overrides
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+# loaded on first use (hashing, JWT, rate limits, trends), never at import
+LAZY_MODULES = ("passlib", "jose", "cryptography", "limits", "slowapi", "numpy")
+
+
+def _import_app(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", "import sys, app.main; print(' '.join(sys.modules))"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_time_ms() -> float:
+    result = _import_app("-X", "importtime")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| app\.main$", result.stderr, re.M)
+    assert match, result.stderr[-2000:]
+    return int(match.group(1)) / 1000
+
+
+class TestStartup:
+    """Test cases for the app's cold start"""
+
+    def test_import_time_within_budget(self):
+        """Test importing app.main stays within the startup budget"""
+        # the best of three runs, the others absorb a busy machine
+        best = min(_import_time_ms() for _ in range(3))
+
+        assert best < IMPORT_TIME_BUDGET_MS, (
+            f"import app.main took {best:.0f} ms, budget {IMPORT_TIME_BUDGET_MS:.0f} ms"
+        )
+
+    def test_heavy_dependencies_are_lazy(self):
+        """Test hashing, JWT, rate limit and NumPy libraries are not imported with the app"""
+        modules = _import_app().stdout.split()
+
+        loaded = {name.split(".")[0] for name in modules} & set(LAZY_MODULES)
+
+        assert not loaded
+
+    def test_schemas_are_built_on_first_use(self):
+        """Test importing the app leaves the schema validators deferred"""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import app.main\n"
+                "from app.schema.user import UserCreate, UserResponse\n"
+                "print(type(UserCreate.__pydantic_validator__).__name__,"
+                " type(UserResponse.__pydantic_validator__).__name__)",
+            ],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == ["MockValSer", "MockValSer"]
@@ -2,10 +2,22 @@
 Tests for utility functions
 """
 
+import json
+import logging
+import logging.handlers
 import pytest
 from decimal import Decimal
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from app.models import User
+from app.core import logging_config
+from app.core.config import settings
+from app.core.logging_config import (
+    SamplingFilter,
+    request_id_var,
+    setup_logging,
+    shutdown_logging,
+)
+from app.models import User, Income, UserTotals
 from app.schema.user import UserCreate, UserUpdate
 from app.utils.auth import (
     hash_password,
@@ -15,6 +27,22 @@ from app.utils.auth import (
     create_access_token,
     decode_access_token,
 )
+from app.utils.token_cache import VerifiedTokenCache, verified_tokens
+from app.utils.pagination import encode_cursor, decode_cursor, InvalidCursorError
+from app.utils.rate_limit_storage import SQLiteStorage
+from app.utils import rate_limits
+from app.utils.balance import get_user_balance
+from app.utils.totals import rebuild_user_totals
+from app.schema.expense import ExpenseCreate, ExpenseUpdate
+from app.schema.income import IncomeCreate
+from app.schema.savings import SavingsCreate
+from app.services.expense_service import (
+    create_expense_service,
+    update_expense_service,
+    delete_expense_service,
+)
+from app.services.income_service import create_income_service
+from app.services.savings_service import create_saving_service
 from app.services.user_service import (
     get_user_service,
     get_all_users_service,
@@ -154,6 +182,328 @@ class TestAuthUtils:
         assert verify_password(password, hash2)
 
 
+class TestVerifiedTokenCache:
+    """Test cases for the verified JWT cache"""
+
+    def test_decode_reuses_verified_payload(self):
+        """Test a reused token is served from the cache"""
+        token, _ = create_access_token({"user_id": "321"})
+        hits = verified_tokens.hits
+
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+        assert first == second
+        assert verified_tokens.hits == hits + 1
+
+    def test_tampered_token_is_not_served(self):
+        """Test a token differing from a cached one is verified again"""
+        token, _ = create_access_token({"user_id": "654"})
+        decode_access_token(token)
+
+        with pytest.raises(Exception):
+            decode_access_token(token[:-2] + ("aa" if not token.endswith("aa") else "bb"))
+
+    def test_entries_expire_at_exp(self):
+        """Test entries are dropped at the token's exp"""
+        now = [1000.0]
+        cache = VerifiedTokenCache(maxsize=10, clock=lambda: now[0])
+        cache.set("token", {"sub": "1", "exp": 1060})
+
+        assert cache.get("token") == {"sub": "1", "exp": 1060}
+        now[0] = 1060
+        assert cache.get("token") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_bounded_and_copies(self):
+        """Test the LRU bound and that callers cannot mutate cached payloads"""
+        cache = VerifiedTokenCache(maxsize=1)
+        cache.set("a", {"sub": "1", "exp": 2**40})
+        cache.get("a")["sub"] = "tampered"
+        assert cache.get("a")["sub"] == "1"
+
+        cache.set("b", {"sub": "2", "exp": 2**40})
+        assert cache.get("a") is None
+        assert len(cache) == 1
+
+
+def _hit_shared_limit(path: str, attempts: int) -> int:
+    """Worker process body: how many hits of a 10/minute limit were allowed"""
+    from limits import parse
+    from limits.strategies import SlidingWindowCounterRateLimiter
+
+    limiter = SlidingWindowCounterRateLimiter(SQLiteStorage(f"sqlite:///{path}"))
+    item = parse("10/minute")
+    return sum(limiter.hit(item, "shared") for _ in range(attempts))
+
+
+class TestRateLimitStorage:
+    """Test cases for the shared SQLite rate limit storage and limit keys"""
+
+    def test_limit_shared_across_storages(self, tmp_path):
+        """Test two workers' storages count against one limit"""
+        from limits import parse
+        from limits.strategies import SlidingWindowCounterRateLimiter
+
+        uri = f"sqlite:///{tmp_path / 'limits.db'}"
+        first = SlidingWindowCounterRateLimiter(SQLiteStorage(uri))
+        second = SlidingWindowCounterRateLimiter(SQLiteStorage(uri))
+        item = parse("5/minute")
+
+        allowed = [first.hit(item, "k") for _ in range(3)]
+        allowed += [second.hit(item, "k") for _ in range(3)]
+
+        assert allowed == [True] * 5 + [False]
+        assert first.get_window_stats(item, "k").remaining == 0
+        assert second.hit(item, "other") is True
+
+    def test_limit_exact_across_processes(self, tmp_path):
+        """Test concurrent processes never exceed the limit together"""
+        import multiprocessing
+
+        path = str(tmp_path / "limits.db")
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            allowed = pool.starmap(_hit_shared_limit, [(path, 10)] * 4)
+
+        assert sum(allowed) == 10
+
+    def test_storage_registered_with_limits(self, tmp_path):
+        """Test the sqlite:// scheme resolves to SQLiteStorage"""
+        from limits.storage import storage_from_string
+
+        storage = storage_from_string(f"sqlite:///{tmp_path / 'limits.db'}")
+
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.incr("k", 60) == 1 and storage.incr("k", 60) == 2
+        storage.clear("k")
+        assert storage.get("k") == 0
+
+    def test_keys_by_user_then_ip(self, client, test_user: User, authenticated_user_token: str):
+        """Test authenticated requests are keyed by subject, others by address"""
+        from starlette.requests import Request
+
+        def request(headers):
+            return Request({
+                "type": "http",
+                "headers": headers,
+                "client": ("10.0.0.1", 1234),
+            })
+
+        authorization = [(b"authorization", f"Bearer {authenticated_user_token}".encode())]
+        assert rate_limits.user_or_ip(request(authorization)) == f"user:{test_user.id}"
+        assert rate_limits.user_or_ip(request([(b"authorization", b"Bearer bad")])) == "ip:10.0.0.1"
+        assert rate_limits.user_or_ip(request([])) == "ip:10.0.0.1"
+
+    def test_default_limit_per_user(
+        self, client, monkeypatch, authenticated_user_token: str, authenticated_admin_token: str
+    ):
+        """Test the app-wide default limit counts each user separately"""
+        from limits import parse_many
+
+        monkeypatch.setattr(rate_limits, "default_limits", parse_many("2/minute"))
+        rate_limits.default_limiter.storage.reset()
+        user = {"Authorization": f"Bearer {authenticated_user_token}"}
+        admin = {"Authorization": f"Bearer {authenticated_admin_token}"}
+
+        statuses = [client.get("/api/v1/expenses/", headers=user).status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        assert client.get("/api/v1/expenses/", headers=admin).status_code == 200
+        rate_limits.default_limiter.storage.reset()
+
+    @pytest.mark.asyncio
+    async def test_default_limit_off_event_loop(self, tmp_path, monkeypatch):
+        """Test requests waiting on a locked limits storage leave the event loop running"""
+        import asyncio
+        import sqlite3
+        import time
+        import httpx
+        from limits import parse_many
+        from app.main import app
+
+        path = tmp_path / "limits.db"
+        limiter = rate_limits.RateLimiter(f"sqlite:///{path}", "sliding-window-counter")
+        monkeypatch.setattr(rate_limits, "default_limiter", limiter)
+        monkeypatch.setattr(rate_limits, "default_limits", parse_many("5/minute"))
+        assert limiter.storage.check()
+        locker = sqlite3.connect(path, isolation_level=None)
+        locker.execute("BEGIN IMMEDIATE")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [asyncio.create_task(client.get("/")) for _ in range(5)]
+            started = time.perf_counter()
+            await asyncio.sleep(0.2)
+            stalled = time.perf_counter() - started
+            locker.execute("COMMIT")
+            responses = await asyncio.gather(*requests)
+            over = await client.get("/")
+        locker.close()
+
+        assert stalled < 1
+        assert [response.status_code for response in responses] == [200] * 5
+        assert over.status_code == 429
+
+
+class TestLoggingPipeline:
+    """Test cases for the queue-backed JSON logging"""
+
+    @staticmethod
+    def _record(name, level=logging.INFO, request_id="-"):
+        record = logging.LogRecord(name, level, __file__, 1, "msg %s", ("x",), None)
+        record.request_id = request_id
+        return record
+
+    def test_sampling_keeps_whole_requests(self):
+        """Test INFO chatter is sampled per request, warnings and other loggers are kept"""
+        sampler = SamplingFilter(0.5, ("app.services",))
+        kept = {
+            request_id: [
+                sampler.filter(self._record("app.services.expense_service", request_id=request_id))
+                for _ in range(5)
+            ]
+            for request_id in (f"req-{i}" for i in range(200))
+        }
+
+        assert all(len(set(decisions)) == 1 for decisions in kept.values())
+        assert 60 < sum(decisions[0] for decisions in kept.values()) < 140
+
+        dropping = SamplingFilter(0.0, ("app.services",))
+        assert not dropping.filter(self._record("app.services.expense_service", request_id="a"))
+        assert not dropping.filter(self._record("app.services"))
+        assert dropping.filter(self._record("app.services.expense_service", logging.WARNING))
+        assert dropping.filter(self._record("app.servicesx"))
+        assert dropping.filter(self._record("app.db.metrics"))
+
+    def test_setup_writes_json_lines(self, tmp_path, monkeypatch):
+        """Test records reach the file as JSON with the request id and per-logger levels apply"""
+        log_file = tmp_path / "app.log"
+        monkeypatch.setattr(settings, "log_file", str(log_file))
+        monkeypatch.setattr(settings, "log_json", True)
+        monkeypatch.setattr(settings, "log_levels", "app.tests.quiet=ERROR")
+        root = logging.getLogger()
+        root_level = root.level
+
+        listener = setup_logging()
+        try:
+            token = request_id_var.set("req-42")
+            try:
+                logging.getLogger("app.tests.loud").info("hello %s", "world")
+                logging.getLogger("app.tests.quiet").warning("dropped")
+            finally:
+                request_id_var.reset(token)
+            assert logging_config._listener is listener
+        finally:
+            shutdown_logging()
+            root.setLevel(root_level)
+            logging.getLogger("app.tests.quiet").setLevel(logging.NOTSET)
+
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        ours = [line for line in lines if line["logger"].startswith("app.tests.")]
+        assert len(ours) == 1
+        assert ours[0]["message"] == "hello world"
+        assert ours[0]["level"] == "INFO"
+        assert ours[0]["request_id"] == "req-42"
+        assert not any(
+            isinstance(handler, logging.handlers.QueueHandler) for handler in root.handlers
+        )
+
+
+class TestPaginationUtils:
+    """Test cases for cursor pagination utilities"""
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes back to its (date, id)"""
+        date = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+
+        assert decode_cursor(encode_cursor(date, 42)) == (date, 42)
+
+    def test_decode_invalid_cursor(self):
+        """Test malformed cursors raise InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("garbage")
+
+    def test_fetch_all_users_with_cursor(self, db: Session, test_user: User, test_admin_user: User):
+        """Test users can be paged with a cursor"""
+        test_user.created_at = datetime(2025, 1, 1)
+        test_admin_user.created_at = datetime(2025, 1, 2)
+        db.commit()
+
+        first_page = get_all_users_service(db, limit=1)
+        cursor = encode_cursor(first_page[0].created_at, first_page[0].id)
+        second_page = get_all_users_service(db, limit=1, cursor=cursor)
+
+        assert first_page[0].id == test_admin_user.id
+        assert [user.id for user in second_page] == [test_user.id]
+
+
+class TestUserTotals:
+    """Test cases for the incrementally maintained user totals"""
+
+    def test_services_maintain_totals(self, db: Session, test_user: User):
+        """Test create, update and delete keep the totals row in step"""
+        now = datetime.now(timezone.utc)
+        create_income_service(
+            IncomeCreate(amount=Decimal("500.00"), source="Salary", date=now), test_user, db
+        )
+        expense = create_expense_service(
+            ExpenseCreate(amount=Decimal("100.00"), category="Food", date=now), test_user.id, db
+        )
+        create_saving_service(SavingsCreate(amount=Decimal("50.00")), test_user, db)
+        update_expense_service(expense.id, ExpenseUpdate(amount=Decimal("150.00")), test_user, db)
+
+        totals = db.get(UserTotals, test_user.id)
+        assert totals.total_income == Decimal("500.00")
+        assert totals.total_expense == Decimal("150.00")
+        assert totals.total_savings == Decimal("50.00")
+        assert (totals.income_count, totals.expense_count, totals.savings_count) == (1, 1, 1)
+
+        delete_expense_service(expense.id, test_user, db)
+        db.refresh(totals)
+        assert totals.total_expense == Decimal("0.00")
+        assert totals.expense_count == 0
+
+    def test_first_write_seeds_from_existing_rows(self, db: Session, test_user: User, test_income: Income):
+        """Test a user without a totals row gets one summed from existing data"""
+        create_income_service(
+            IncomeCreate(amount=Decimal("10.00"), source="Gift", date=datetime.now(timezone.utc)), test_user, db
+        )
+
+        totals = db.get(UserTotals, test_user.id)
+        assert totals.total_income == test_income.amount + Decimal("10.00")
+        assert totals.income_count == 2
+
+    def test_balance_reads_totals_row(self, db: Session, test_user: User):
+        """Test get_user_balance uses the totals row"""
+        db.add(UserTotals(user_id=test_user.id, total_income=Decimal("300.00"), total_expense=Decimal("100.00"), total_savings=Decimal("50.00")))
+        db.commit()
+
+        balance = get_user_balance(test_user, db)
+
+        assert balance["balance"] == 150.0
+        assert balance["net_balance"] == 200.0
+
+    def test_balance_falls_back_without_totals_row(self, db: Session, test_user: User, test_income: Income):
+        """Test get_user_balance sums the source tables when no row exists"""
+        balance = get_user_balance(test_user, db)
+
+        assert balance["total_income"] == float(test_income.amount)
+        assert db.get(UserTotals, test_user.id) is None
+
+    def test_rebuild_user_totals(self, db: Session, test_user: User, test_income: Income, test_expense):
+        """Test rebuild recomputes drifted totals from the source tables"""
+        db.add(UserTotals(user_id=test_user.id, total_income=Decimal("999.00")))
+        db.commit()
+
+        assert rebuild_user_totals(db) == 1
+
+        totals = db.get(UserTotals, test_user.id)
+        db.refresh(totals)
+        assert totals.total_income == test_income.amount
+        assert totals.total_expense == test_expense.amount
+        assert totals.expense_count == 1
+
+
 class TestUserUtils:
     """Test cases for user utilities"""
 